@@ -0,0 +1,43 @@
+from pdutils import eq_multiple, equals_multiple
+
+from .common import K, N, DTYPES, DENSITIES, PLACEMENTS, make_series, skip_large
+
+class EqMultiple:
+    
+    params = [K, N, DTYPES, ['any', 'all', 'none']]
+    param_names = ['k', 'n', 'dtype', 'na']
+    timeout = 300
+    
+    def setup (self, k, n, dtype, na):
+        skip_large(k, n)
+        self.series = make_series(k, n, dtype)
+    
+    def time_eq_multiple (self, k, n, dtype, na):
+        eq_multiple(list(self.series), na)
+    
+    def peakmem_eq_multiple (self, k, n, dtype, na):
+        eq_multiple(list(self.series), na)
+
+class EqMultipleNA:
+    
+    params = [DENSITIES, PLACEMENTS]
+    param_names = ['density', 'placement']
+    
+    def setup (self, density, placement):
+        self.series = make_series(10, 10**6, density=density, placement=placement)
+    
+    def time_eq_multiple (self, density, placement):
+        eq_multiple(list(self.series))
+
+class EqualsMultiple:
+    
+    params = [K, N, [True, False]]
+    param_names = ['k', 'n', 'equal']
+    timeout = 300
+    
+    def setup (self, k, n, equal):
+        skip_large(k, n)
+        self.series = make_series(k, n, equal=equal)
+    
+    def time_equals_multiple (self, k, n, equal):
+        equals_multiple(list(self.series))
@@ -0,0 +1,70 @@
+import pandas as pd
+
+from pdutils import merge_non_na
+
+from .common import K, N, DTYPES, DENSITIES, PLACEMENTS, ALIGNMENTS, make_series, skip_large
+
+class MergeNonNA:
+    
+    params = [K, N, DTYPES]
+    param_names = ['k', 'n', 'dtype']
+    timeout = 300
+    
+    def setup (self, k, n, dtype):
+        skip_large(k, n)
+        self.series = make_series(k, n, dtype, placement='sparse_tail')
+    
+    def time_merge_non_na (self, k, n, dtype):
+        merge_non_na(list(self.series), remaining_na='ignore')
+    
+    def peakmem_merge_non_na (self, k, n, dtype):
+        merge_non_na(list(self.series), remaining_na='ignore')
+
+class MergeNonNAFrame:
+    
+    params = [K, N]
+    param_names = ['k', 'n']
+    timeout = 300
+    
+    def setup (self, k, n):
+        skip_large(k, n)
+        self.df = pd.concat(make_series(k, n, placement='sparse_tail'), axis='columns')
+    
+    def time_merge_non_na (self, k, n):
+        # older versions fill the first column of the frame in place
+        merge_non_na(self.df.copy(), remaining_na='ignore')
+
+class MergeNonNANA:
+    
+    params = [DENSITIES, PLACEMENTS]
+    param_names = ['density', 'placement']
+    
+    def setup (self, density, placement):
+        self.series = make_series(10, 10**6, density=density, placement=placement)
+    
+    def time_merge_non_na (self, density, placement):
+        merge_non_na(list(self.series), remaining_na='ignore')
+
+class MergeNonNAAlignment:
+    
+    params = [[2, 10, 100], ALIGNMENTS]
+    param_names = ['k', 'alignment']
+    timeout = 300
+    
+    def setup (self, k, alignment):
+        self.series = make_series(k, 10**5, alignment=alignment)
+    
+    def time_merge_non_na (self, k, alignment):
+        merge_non_na(list(self.series), remaining_na='ignore')
+
+class MergeNonNAStrategy:
+    
+    params = [[2, 10], ['first', 'last', 'majority', 'priority']]
+    param_names = ['k', 'strategy']
+    
+    def setup (self, k, strategy):
+        self.series = make_series(k, 10**6, placement='sparse_tail')
+        self.strategy = list(range(k)) if strategy == 'priority' else strategy
+    
+    def time_merge_non_na (self, k, strategy):
+        merge_non_na(list(self.series), remaining_na='ignore', strategy=self.strategy)
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+K = [2, 10, 100]
+N = [10**3, 10**5, 10**7]
+DTYPES = ['float', 'Int64', 'string', 'datetime', 'category']
+DENSITIES = [0.0, 0.1, 0.5, 0.9]
+PLACEMENTS = ['random', 'clustered', 'sparse_tail']
+ALIGNMENTS = ['identical', 'shuffled', 'disjoint']
+
+MAX_CELLS = 10**8
+"""Skip parameter combinations with more than k*n cells."""
+
+def skip_large (k: int, n: int) -> None:
+    """
+    Skip a benchmark that would not fit into memory comfortably.
+    
+    Raising NotImplementedError in setup() marks a parameter combination as
+    skipped, both for asv and benchmarks/run.py.
+    """
+    if k * n > MAX_CELLS:
+        raise NotImplementedError
+
+def na_mask (k: int, n: int, density: float, placement: str, rng: np.random.Generator) -> np.ndarray:
+    """
+    Create a (k, n) mask of NA positions.
+    
+    - ``random``: NA values are scattered uniformly.
+    - ``clustered``: NA values form contiguous runs of rows.
+    - ``sparse_tail``: later Series contain more NA values than earlier
+        ones, with ``density`` being the mean over all Series.
+    """
+    if placement == 'random':
+        return rng.random((k, n)) < density
+    if placement == 'clustered':
+        mask = np.zeros((k, n), dtype=bool)
+        length = max(int(n * density), 0)
+        for j in range(k):
+            start = rng.integers(0, n - length + 1)
+            mask[j, start:start+length] = True
+        return mask
+    if placement == 'sparse_tail':
+        weights = np.linspace(0, 2 * density, k).clip(0, 1)
+        return rng.random((k, n)) < weights[:, None]
+    raise ValueError(f"Unknown placement {placement}.")
+
+def convert (values: np.ndarray, dtype: str) -> pd.Series:
+    """
+    Convert float values with NaN to a Series of the given dtype.
+    """
+    s = pd.Series(values)
+    if dtype == 'float':
+        return s
+    if dtype == 'Int64':
+        return s.astype('Int64')
+    if dtype == 'string':
+        return s.map(lambda x: None if x != x else f'v{x:.0f}').astype('string')
+    if dtype == 'datetime':
+        return pd.to_datetime(s, unit='s')
+    if dtype == 'category':
+        return s.astype(pd.CategoricalDtype(np.arange(1002.0)))
+    raise ValueError(f"Unknown dtype {dtype}.")
+
+def make_series (k: int,
+                 n: int,
+                 dtype: str = 'float',
+                 density: float = 0.1,
+                 placement: str = 'random',
+                 alignment: str = 'identical',
+                 equal: bool = True,
+                 seed: int = 0
+                 ) -> list[pd.Series]:
+    """
+    Create ``k`` Series of length ``n`` for benchmarking.
+    
+    If ``equal``, all non-NA values of a row are the same. Otherwise, they
+    differ in about half of the rows, including the first one.
+    
+    - ``identical``: All Series share the same index object.
+    - ``shuffled``: All Series share the same labels in different order.
+    - ``disjoint``: Each Series holds its own slice of labels, overlapping
+        with the next one by half its length.
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 1000, n).astype(float)
+    mask = na_mask(k, n, density, placement, rng)
+    series = []
+    for j in range(k):
+        values = base.copy()
+        if not equal and j == k - 1:
+            values[::2] += 1
+        values[mask[j]] = np.nan
+        series.append(convert(values, dtype))
+    
+    if alignment == 'identical':
+        index = series[0].index
+        for s in series:
+            s.index = index
+    elif alignment == 'shuffled':
+        for s in series[1:]:
+            s.index = rng.permutation(n)
+    elif alignment == 'disjoint':
+        for j, s in enumerate(series):
+            s.index = pd.RangeIndex(j * n // 2, j * n // 2 + n)
+    else:
+        raise ValueError(f"Unknown alignment {alignment}.")
+    return series
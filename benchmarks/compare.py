@@ -0,0 +1,72 @@
+"""
+Compare the benchmarks of two commits.
+
+Both commits are checked out into temporary git worktrees. The benchmarks
+of the current working tree are then run once against the pdutils package
+of each commit, so both are measured with the same benchmark code.
+
+Usage::
+    
+    python -m benchmarks.compare BASE HEAD [--bench REGEX] [--max-n N] [--factor F]
+
+Prints a table of all benchmarks and exits with status 1, if any of them
+got slower by more than ``factor``.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def measure (commit: str, args: list[str]) -> dict[str, Optional[float]]:
+    """
+    Run benchmarks/run.py against pdutils as of ``commit``.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        worktree = Path(tmp) / 'worktree'
+        subprocess.run(['git', 'worktree', 'add', '--detach', str(worktree), commit],
+                       cwd=ROOT, check=True, capture_output=True)
+        try:
+            # the working directory precedes PYTHONPATH, so the benchmarks of the
+            # current tree are run, even if the commit contains its own ones
+            shutil.copytree(ROOT / 'benchmarks', Path(tmp) / 'benchmarks',
+                            ignore=shutil.ignore_patterns('__pycache__'))
+            env = dict(os.environ, PYTHONPATH=str(worktree))
+            print(f'Benchmarking {commit} ...', file=sys.stderr)
+            out = subprocess.run([sys.executable, '-m', 'benchmarks.run', *args],
+                                 cwd=tmp, env=env, check=True, stdout=subprocess.PIPE)
+            return json.loads(out.stdout)
+        finally:
+            subprocess.run(['git', 'worktree', 'remove', '--force', str(worktree)],
+                           cwd=ROOT, check=True, capture_output=True)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base', help='commit to compare against')
+    parser.add_argument('head', nargs='?', default='HEAD', help='commit to compare, default HEAD')
+    parser.add_argument('--bench', default='', help='only run benchmarks matching this regular expression')
+    parser.add_argument('--max-n', type=int, default=None, help='skip benchmarks with more than this many rows')
+    parser.add_argument('--factor', type=float, default=1.1, help='ratio above which a change is reported')
+    args = parser.parse_args()
+    
+    run_args = ['--bench', args.bench] + (['--max-n', str(args.max_n)] if args.max_n else [])
+    base = measure(args.base, run_args)
+    head = measure(args.head, run_args)
+    
+    slower = False
+    print(f'{"before":>10} {"after":>10} {"ratio":>7}  benchmark')
+    for key in sorted(base.keys() & head.keys()):
+        if base[key] is None or head[key] is None:
+            print(f'{base[key] or "failed":>10} {head[key] or "failed":>10} {"":>7}   {key}')
+            continue
+        ratio = head[key] / base[key]
+        mark = '+' if ratio > args.factor else '-' if ratio < 1 / args.factor else ' '
+        slower |= mark == '+'
+        print(f'{base[key]:>10.3g} {head[key]:>10.3g} {ratio:>7.2f} {mark} {key}')
+    sys.exit(1 if slower else 0)
@@ -0,0 +1,81 @@
+"""
+Run the asv-style benchmarks in this directory without asv.
+
+Benchmarks are the ``time_*`` methods of classes in ``bench_*.py``. Each is
+run for all combinations of the class' ``params``; combinations for which
+``setup()`` raises NotImplementedError are skipped. Results are printed as
+JSON, mapping ``Class.method(params)`` to the best time per call in seconds,
+or to None if the benchmark failed.
+
+Usage::
+    
+    python -m benchmarks.run [--bench REGEX] [--max-n N] [--repeat R]
+"""
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import pkgutil
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Optional
+
+def discover ():
+    """
+    Yield all benchmark classes of the modules in this package.
+    """
+    for module in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if not module.name.startswith('bench_'):
+            continue
+        bench = importlib.import_module(f'{__package__}.{module.name}')
+        for name, cls in inspect.getmembers(bench, inspect.isclass):
+            if cls.__module__ == bench.__name__:
+                yield cls
+
+def run (pattern: str = '', max_n: int = None, repeat: int = 3) -> dict[str, Optional[float]]:
+    results = {}
+    for cls in discover():
+        params = getattr(cls, 'params', [[]])
+        names = getattr(cls, 'param_names', [])
+        methods = [m for m in dir(cls) if m.startswith('time_')]
+        for combination in itertools.product(*params) if names else [()]:
+            keys = {f'{cls.__name__}.{m}({", ".join(map(repr, combination))})': m for m in methods}
+            keys = {key: m for key, m in keys.items() if re.search(pattern, key)}
+            if not keys:
+                continue
+            if max_n is not None and dict(zip(names, combination)).get('n', 0) > max_n:
+                continue
+            
+            bench = cls()
+            try:
+                if hasattr(bench, 'setup'):
+                    bench.setup(*combination)
+            except NotImplementedError:
+                continue
+            
+            for key, method in keys.items():
+                func = getattr(bench, method)
+                timer = timeit.Timer(lambda: func(*combination))
+                try:
+                    number, _ = timer.autorange()
+                    results[key] = min(timer.repeat(repeat=repeat, number=number)) / number
+                except Exception as e:
+                    results[key] = None
+                    print(f'{key}: failed with {e!r}', file=sys.stderr)
+                else:
+                    print(f'{key}: {results[key]:.3g}s', file=sys.stderr)
+            
+            if hasattr(bench, 'teardown'):
+                bench.teardown(*combination)
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bench', default='', help='only run benchmarks matching this regular expression')
+    parser.add_argument('--max-n', type=int, default=None, help='skip benchmarks with more than this many rows')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timing repeats')
+    args = parser.parse_args()
+    json.dump(run(args.bench, args.max_n, args.repeat), sys.stdout, indent=2)
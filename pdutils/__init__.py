@@ -1,4 +1,13 @@
-from ._eq import eq_multiple, equals_multiple
+from ._comparison import Comparison
+from ._dask import eq_multiple_dask, equals_multiple_dask, merge_non_na_dask
+from ._eq import eq_multiple, equals_multiple, Mismatches
+from ._files import eq_multiple_files, equals_multiple_files, merge_non_na_files
+from ._fingerprint import clear_fingerprints
+from ._frames import eq_frames, merge_non_na_frames
+from ._groups import eq_groups, merge_non_na_groups
+from ._instrument import instrument, CallReport
 from ._merge import merge_non_na
+from ._merger import NonNAMerger
+from ._stream import eq_multiple_chunks, equals_multiple_chunks, merge_non_na_chunks
 
 __version__ = '2022.08'
@@ -0,0 +1,47 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+def align (series: list[pd.Series]) -> tuple[pd.Index, Optional[list[np.ndarray]]]:
+    """
+    Align the indexes of several Series without reindexing their values.
+    
+    Returns the union of all indexes in order of first appearance, as
+    ``pd.concat(series, axis='columns')`` creates it for non-datetime-like
+    indexes, together with an indexer for each Series that maps its rows
+    to positions in the union. The union is built in a single pass over
+    all labels, instead of joining the indexes one after another.
+    
+    If all indexes are equal, the index of the first Series is returned
+    along with None instead of indexers. This allows callers to work on
+    the values directly, without copying them.
+    
+    Parameters
+    ----------
+    series : list of pd.Series
+        Series to align. All indexes must be unique, unless they are equal.
+    
+    Returns
+    -------
+    pd.Index
+        Union of all indexes.
+    list of np.ndarray or None
+        Positions of each row of each Series in the union.
+    
+    Raises
+    ------
+    ValueError
+        If indexes are not equal and contain duplicate or NA labels.
+    """
+    first = series[0].index
+    if all(s.index is first or s.index.equals(first) for s in series[1:]):
+        return first, None
+    
+    if not all(s.index.is_unique for s in series) or any(s.index.hasnans for s in series):
+        raise ValueError("Indexes must be unique and may not contain NA values.")
+    
+    labels = first.append([s.index for s in series[1:]])
+    codes, union = labels.factorize()
+    indexers = np.split(codes, np.cumsum([len(s) for s in series[:-1]]))
+    return union, indexers
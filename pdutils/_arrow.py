@@ -0,0 +1,89 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+def is_arrow (dtype) -> bool:
+    """
+    Check whether ``dtype`` is backed by a pyarrow array.
+    """
+    if pa is None:
+        return False
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == 'pyarrow'
+    arrow_dtype = getattr(pd, 'ArrowDtype', None)
+    return arrow_dtype is not None and isinstance(dtype, arrow_dtype)
+
+def supports (dtypes: list) -> bool:
+    """
+    Check whether pyarrow is available and all ``dtypes`` are the same
+    Arrow-backed dtype. Differing types are left to the numpy paths, since
+    pyarrow would silently cast them to the type of the first column.
+    """
+    return len(dtypes) > 0 and is_arrow(dtypes[0]) and all(dtype == dtypes[0] for dtype in dtypes[1:])
+
+def chunked (s: pd.Series) -> 'pa.ChunkedArray':
+    """
+    Return the pyarrow data backing a Series without copying it.
+    """
+    return s.array.__arrow_array__()
+
+def wrap (data: 'pa.ChunkedArray', like: pd.Series) -> pd.api.extensions.ExtensionArray:
+    """
+    Wrap pyarrow ``data`` in the same kind of extension array as ``like``.
+    """
+    if isinstance(data, pa.Array):
+        data = pa.chunked_array([data])
+    return type(like.array)(data)
+
+def eq_block (columns: list['pa.ChunkedArray'], na: str, start: int, stop: int) -> 'pa.ChunkedArray':
+    """
+    Compare rows ``start:stop`` of the given arrays with pyarrow compute
+    kernels, without converting them to numpy.
+    
+    Like the numpy kernel, each element is compared to the first non-NA
+    element of its row, which pc.coalesce() finds in a single pass.
+    """
+    columns = [column.slice(start, stop - start) for column in columns]
+    ref = pc.coalesce(*columns)
+    check = None
+    any_na = None
+    for column in columns:
+        # comparisons involving NA yield null, which counts as equal here
+        eq = pc.fill_null(pc.equal(column, ref), True)
+        check = eq if check is None else pc.and_(check, eq)
+        if na != 'any':
+            null = column.is_null()
+            any_na = null if any_na is None else pc.or_(any_na, null)
+    if na == 'any':
+        return check
+    check = pc.and_not(check, any_na)
+    if na == 'all':
+        check = pc.or_(check, ref.is_null())
+    return check
+
+def coalesce (columns: list['pa.ChunkedArray'],
+              indexers: Optional[list[np.ndarray]] = None,
+              n: Optional[int] = None
+              ) -> 'pa.ChunkedArray':
+    """
+    Pick the first non-NA value of each row with pc.coalesce().
+    
+    If ``indexers`` are given, each column is first scattered into ``n``
+    rows, where positions not covered by its indexer are NA.
+    """
+    if indexers is not None:
+        gathered = []
+        for column, indexer in zip(columns, indexers):
+            positions = np.full(n, -1, dtype=np.int64)
+            positions[indexer] = np.arange(len(indexer))
+            gathered.append(column.take(pa.array(positions, mask=positions < 0)))
+        columns = gathered
+    return pc.coalesce(*columns)
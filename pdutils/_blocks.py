@@ -0,0 +1,72 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TypeVar
+
+from . import _instrument
+
+T = TypeVar('T')
+
+BLOCK_SIZE = 2**16
+"""Number of rows processed at once. Must be a multiple of 8."""
+
+PARALLEL_MIN_ROWS = 2**18
+"""Number of rows below which blocks are always processed serially."""
+
+def n_workers (n_jobs: Optional[int]) -> int:
+    """
+    Translate ``n_jobs`` into a number of threads.
+    
+    None and 1 mean serial execution, negative values count backwards from
+    the number of CPUs, i.e. -1 uses all of them.
+    """
+    if n_jobs is None:
+        return 1
+    if not isinstance(n_jobs, int) or n_jobs == 0:
+        raise ValueError(f"Expected value for kwarg 'n_jobs' to be a non-zero integer "
+                         f"or None, got {n_jobs} instead.")
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+def row_blocks (n: int) -> list[tuple[int, int]]:
+    """
+    Split ``n`` rows into blocks of at most BLOCK_SIZE rows.
+    """
+    return [(start, min(start + BLOCK_SIZE, n)) for start in range(0, n, BLOCK_SIZE)]
+
+def map_blocks (func: Callable[[int, int], T],
+                n: int,
+                n_jobs: Optional[int] = None
+                ) -> Iterator[T]:
+    """
+    Lazily apply ``func(start, stop)`` to consecutive blocks of ``n`` rows.
+    
+    Results are yielded in order of the blocks. If ``n_jobs`` asks for more
+    than one worker and there are at least PARALLEL_MIN_ROWS rows, blocks
+    are processed on a thread pool. This pays off, since numpy releases
+    the GIL for most of the work done per block. Only a limited number of
+    blocks is scheduled ahead, so that callers may stop consuming results
+    early without waiting for all blocks to be processed.
+    """
+    blocks = row_blocks(n)
+    workers = n_workers(n_jobs)
+    if workers == 1 or len(blocks) == 1 or n < PARALLEL_MIN_ROWS:
+        for start, stop in blocks:
+            _instrument.iterate()
+            yield func(start, stop)
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for start, stop in blocks:
+            if len(pending) == 2 * workers:
+                _instrument.iterate()
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, start, stop))
+        while pending:
+            _instrument.iterate()
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
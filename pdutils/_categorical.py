@@ -0,0 +1,78 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+def supports (dtypes: list) -> bool:
+    """
+    Check whether all ``dtypes`` are categorical.
+    """
+    return len(dtypes) > 0 and all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes)
+
+def unify (series: list[pd.Series]) -> list[pd.Series]:
+    """
+    Recode categorical Series to identical categories.
+    
+    Series whose categories already are identical, including their order,
+    are returned as they are. Otherwise, the union of all categories is
+    built once in order of first appearance and each Series is recoded to
+    it, so that equal values share the same code afterwards. Note that
+    unordered categoricals compare equal regardless of the order of their
+    categories, while their codes do not.
+    """
+    first = series[0].dtype
+    if all(s.dtype.categories.equals(first.categories) and s.dtype.ordered == first.ordered for s in series[1:]):
+        return series
+    categories = first.categories.append([s.dtype.categories for s in series[1:]]).unique()
+    dtype = pd.CategoricalDtype(categories, ordered=False)
+    return [_recode(s, dtype) for s in series]
+
+def _recode (s: pd.Series, dtype: pd.CategoricalDtype) -> pd.Series:
+    """
+    Recode a categorical Series to ``dtype`` by mapping its codes.
+    
+    pd.Series.astype() cannot be used here, as it considers unordered
+    categoricals with the same categories in a different order equal and
+    hence keeps their codes.
+    """
+    if s.dtype.categories.equals(dtype.categories) and s.dtype.ordered == dtype.ordered:
+        return s
+    mapping = dtype.categories.get_indexer(s.dtype.categories)
+    old = codes(s)
+    new = mapping.take(old)
+    new[old == -1] = -1
+    return pd.Series(pd.Categorical.from_codes(new, dtype=dtype), index=s.index, name=s.name)
+
+def codes (s: pd.Series) -> np.ndarray:
+    """
+    Return the codes of a categorical Series without copying them. NA values
+    are represented by -1.
+    """
+    return s.array.codes
+
+def first_valid (columns: list[np.ndarray],
+                 indexers: Optional[list[np.ndarray]] = None,
+                 n: Optional[int] = None
+                 ) -> np.ndarray:
+    """
+    Pick the first non-NA code of each row.
+    
+    If ``indexers`` are given, each column is scattered into ``n`` rows,
+    where positions not covered by its indexer are NA.
+    """
+    if indexers is None:
+        result = columns[0].copy()
+        pending = np.flatnonzero(result == -1)
+        for column in columns[1:]:
+            if len(pending) == 0:
+                break
+            values = column[pending]
+            result[pending] = values
+            pending = pending[values == -1]
+        return result
+    
+    result = np.full(n, -1, dtype=np.result_type(*columns))
+    for column, indexer in zip(columns, indexers):
+        pending = result[indexer] == -1
+        result[indexer[pending]] = column[pending]
+    return result
@@ -0,0 +1,203 @@
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from . import _categorical
+
+def series_list (data, dicts: bool = False) -> Optional[list[pd.Series]]:
+    """
+    Turn a list of array-likes or the columns of a DataFrame into a new list
+    of Series. Returns None, if ``data`` is neither.
+    
+    The list of the caller is never modified. Series are kept as they are,
+    arrays and the columns of a DataFrame are wrapped without copying their
+    values. Lists and tuples, as well as dicts if ``dicts`` is True, are
+    converted once.
+    """
+    if isinstance(data, pd.DataFrame):
+        return [data.iloc[:,j] for j in range(len(data.columns))]
+    if not isinstance(data, list):
+        return None
+    
+    types = (list, tuple, dict) if dicts else (list, tuple)
+    series = []
+    for elem in data:
+        if isinstance(elem, pd.Series):
+            series.append(elem)
+        elif isinstance(elem, (np.ndarray, pd.Index, pd.api.extensions.ExtensionArray)):
+            series.append(pd.Series(elem, copy=False))
+        elif isinstance(elem, types):
+            series.append(pd.Series(elem))
+        else:
+            names = 'Series, ndarray, list, tuple or dict' if dicts else 'Series, ndarray, list or tuple'
+            raise TypeError(f"Element must be {names}, got {type(elem)} instead.")
+    return series
+
+def compare_dtype (dtype) -> np.dtype:
+    """
+    Return the numpy dtype a Series of ``dtype`` is compared in.
+    
+    Masked extension arrays (e.g. Int64, Float64, boolean) are compared in
+    their numpy counterpart, since the values at NA positions are irrelevant
+    once the mask is known. Other extension types are compared as objects.
+    """
+    if isinstance(dtype, np.dtype):
+        return dtype
+    numpy_dtype = getattr(dtype, 'numpy_dtype', None)
+    if numpy_dtype is not None and numpy_dtype.kind in 'biufc':
+        return numpy_dtype
+    return np.dtype(object)
+
+def common_dtype (dtypes: list[np.dtype]) -> np.dtype:
+    """
+    Find a dtype all columns can be compared in without changing the result
+    of their pairwise comparison. Falls back to object.
+    """
+    kinds = {dtype.kind for dtype in dtypes}
+    if kinds <= set('biufc') or kinds == {'M'} or kinds == {'m'}:
+        return np.result_type(*dtypes)
+    return np.dtype(object)
+
+_MASKED_ARRAYS = (pd.arrays.BooleanArray, pd.arrays.IntegerArray, pd.arrays.FloatingArray)
+
+def _is_masked (dtype) -> bool:
+    """
+    Check whether ``dtype`` is a masked extension dtype, e.g. Int64.
+    """
+    return isinstance(dtype, pd.api.extensions.ExtensionDtype) and \
+        issubclass(dtype.construct_array_type(), _MASKED_ARRAYS)
+
+def _masked (dtype: np.dtype):
+    """
+    Return the masked extension dtype of a numpy bool, integer or float
+    dtype, e.g. Int64 for int64.
+    """
+    if dtype.kind == 'b':
+        return pd.BooleanDtype()
+    prefix = {'i': 'Int', 'u': 'UInt', 'f': 'Float'}[dtype.kind]
+    return pd.api.types.pandas_dtype(f'{prefix}{max(dtype.itemsize, 4 if dtype.kind == "f" else 1) * 8}')
+
+def merge_dtype (dtypes: list, nullable: bool):
+    """
+    Find the narrowest dtype Series of ``dtypes`` can be merged in without
+    going through float or object, or None, if there is none.
+    
+    Bool, integer and float dtypes, including their masked counterparts,
+    are promoted like numpy does. The result is masked, if any input is
+    masked or if ``nullable`` is True, i.e. aligning the inputs introduces
+    NA values, and the result would be a bool or integer dtype otherwise.
+    Naive datetimes and timedeltas are promoted to the finest unit,
+    tz-aware datetimes of differing time zones are converted to UTC.
+    """
+    first = dtypes[0]
+    if all(dtype == first for dtype in dtypes[1:]):
+        if nullable and isinstance(first, np.dtype) and first.kind in 'biu':
+            return _masked(first)
+        return first
+    
+    if all(isinstance(dtype, np.dtype) or _is_masked(dtype) for dtype in dtypes):
+        numpy_dtypes = [compare_dtype(dtype) for dtype in dtypes]
+        kinds = {dtype.kind for dtype in numpy_dtypes}
+        if kinds == {'b'} or kinds <= set('iuf'):
+            common = np.result_type(*numpy_dtypes)
+            if (nullable and common.kind in 'biu') or any(_is_masked(dtype) for dtype in dtypes):
+                return _masked(common)
+            return common
+        if kinds == {'M'} or kinds == {'m'}:
+            return np.result_type(*numpy_dtypes)
+    
+    if all(isinstance(dtype, pd.DatetimeTZDtype) for dtype in dtypes):
+        # instants in differing time zones are merged in UTC
+        return pd.DatetimeTZDtype(tz='UTC')
+    return None
+
+def values (s: pd.Series):
+    """
+    Return the values of a Series without copying them.
+    """
+    return s.to_numpy() if isinstance(s.dtype, np.dtype) else s.array
+
+def stack_rows (columns: list, dtype: np.dtype, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stack rows ``start:stop`` of the given arrays into a 2D array of shape
+    (k, stop - start) and a matching NA mask. Columns given as None are
+    treated as consisting of NA values only.
+    """
+    result = np.empty((len(columns), stop - start), dtype=dtype)
+    mask = np.empty((len(columns), stop - start), dtype=bool)
+    for j, column in enumerate(columns):
+        if column is None:
+            mask[j] = True
+            continue
+        block = column[start:stop]
+        mask[j] = pd.isna(block)
+        if dtype == object and block.dtype.kind in 'mM':
+            # numpy turns datetime64[ns] into integers, pandas into Timestamps
+            result[j] = pd.array(block).astype(object)
+        elif isinstance(block, np.ndarray) or dtype == object:
+            result[j] = block
+        else:
+            result[j] = block.to_numpy(dtype=dtype, na_value=0)
+    return result, mask
+
+def stacked (data: Union[list[pd.Series], pd.DataFrame]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the values of several Series as a single contiguous (k, n) array
+    along with its NA mask.
+    
+    The values of a DataFrame of a single numpy dtype are held in a single
+    block already, which is returned as a view. Otherwise, all Series are
+    copied once into an array of their common dtype, as determined by
+    common_dtype(). Categorical Series are represented by their codes,
+    unified to identical categories first.
+    """
+    if isinstance(data, pd.DataFrame):
+        dtypes = set(data.dtypes)
+        if len(dtypes) == 1 and isinstance(next(iter(dtypes)), np.dtype):
+            # blocks are stored as (k, n), so the transpose is contiguous
+            result = data.to_numpy().T
+            return result, pd.isna(result)
+    
+    series = series_list(data)
+    if _categorical.supports([s.dtype for s in series]):
+        result = np.stack([_categorical.codes(s) for s in _categorical.unify(series)])
+        return result, result == -1
+    dtype = common_dtype([compare_dtype(s.dtype) for s in series])
+    return stack_rows([values(s) for s in series], dtype, 0, len(series[0]))
+
+def buffer (out, shape: tuple[int, ...]):
+    """
+    Validate an array or Series passed as ``out`` and return the values to
+    write a result of ``shape`` into, without copying them.
+    """
+    if isinstance(out, pd.Series):
+        target = values(out)
+    elif isinstance(out, np.ndarray):
+        target = out
+    else:
+        raise TypeError(f"Expected 'out' to be a Series or an ndarray, got {type(out)} instead.")
+    if target.shape != shape:
+        raise ValueError(f"Expected 'out' to be of shape {shape}, got {target.shape} instead.")
+    if isinstance(target, np.ndarray) and not target.flags.writeable:
+        raise ValueError("Expected 'out' to be writeable.")
+    return target
+
+def write (target, result) -> None:
+    """
+    Copy the values of ``result`` into a buffer returned by buffer(), unless
+    they already are the values of the buffer. Numpy buffers do not accept
+    values of a different kind, e.g. floats are not truncated to integers.
+    """
+    data = values(result) if isinstance(result, pd.Series) else result
+    if data is target:
+        return
+    if not isinstance(target, np.ndarray):
+        target[:] = data
+        return
+    if not isinstance(data, np.ndarray):
+        if target.dtype.kind in 'fc':
+            data = data.to_numpy(dtype=target.dtype, na_value=np.nan)
+        else:
+            data = np.asarray(data, dtype=target.dtype)
+    np.copyto(target, data, casting='same_kind')
@@ -0,0 +1,174 @@
+from functools import cached_property
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from . import _coerce
+from ._eq import _check_na, _eq_rows, _prepare
+
+Modes = Union[str, list[str], tuple[str, ...]]
+
+def _modes (na: Modes) -> list[str]:
+    """
+    Validate one or several values for ``na`` and return them as list.
+    """
+    modes = [na] if isinstance(na, str) else list(na)
+    for mode in modes:
+        _check_na(mode)
+    return modes
+
+class Comparison:
+    """
+    Reusable comparison of multiple Series.
+    
+    Answers eq_multiple() and equals_multiple() for any value of ``na`` on
+    the same inputs, without repeating the work shared between them. The
+    inputs are validated and converted to Series once, when the object is
+    created. Their values are stacked into a single array and their NA
+    masks are computed on first use. Both are cached along with the
+    comparison of all non-NA values, from which each value of ``na`` is
+    derived by a few boolean operations only.
+    
+    The Series must not be modified, while the object is in use.
+    
+    Parameters
+    ----------
+    series : sequence of array-like or pd.DataFrame
+        List of Series to compare with each other.
+    
+    Raises
+    ------
+    ValuesError
+        If ``series`` is empty.
+        If elements in ``series`` have different lengths.
+    TypeError
+        If elements in ``series`` are not array-like.
+    
+    See Also
+    --------
+    eq_multiple: Compare multiple Series elementwise.
+    equals_multiple: Test whether multiple Series contain the same elements.
+    
+    Examples
+    --------
+    >>> s1 = pd.Series([1.0, 2.0])
+    >>> s2 = pd.Series([1.0, np.nan])
+    >>> s3 = pd.Series([1.0, np.nan])
+    >>> c = Comparison([s1,s2,s3])
+    >>> c.eq(['any', 'all', 'none'])
+        any    all   none
+    0  True   True   True
+    1  True  False  False
+    >>> c.equals('any')
+    True
+    """
+    
+    def __init__ (self, series: Union[list[Union[pd.Series, np.ndarray, list, tuple, dict]], pd.DataFrame]):
+        prepared = _prepare(series, 'any')
+        self._n = len(series) if prepared is None else len(prepared[0])
+        self._series = prepared if prepared is not None and len(prepared) > 1 else None
+        # a homogeneous DataFrame is stacked without copying its values
+        self._data = series if isinstance(series, pd.DataFrame) else self._series
+    
+    def __len__ (self) -> int:
+        return self._n
+    
+    @cached_property
+    def _stacked (self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Values of all Series as (k, n) array and the matching NA mask.
+        Categorical Series are represented by their codes.
+        """
+        return _coerce.stacked(self._data)
+    
+    @property
+    def values (self) -> np.ndarray:
+        """
+        Values of all Series stacked into an array of shape (k, n).
+        """
+        return self._stacked[0]
+    
+    @property
+    def mask (self) -> np.ndarray:
+        """
+        NA mask of all Series of shape (k, n).
+        """
+        return self._stacked[1]
+    
+    @cached_property
+    def _check (self) -> np.ndarray:
+        """
+        Whether all non-NA values of each row are equal.
+        """
+        return _eq_rows(*self._stacked)
+    
+    @cached_property
+    def _any_na (self) -> np.ndarray:
+        """
+        Whether a row contains any NA values.
+        """
+        return self.mask.any(axis=0)
+    
+    @cached_property
+    def _all_na (self) -> np.ndarray:
+        """
+        Whether a row consists of NA values only.
+        """
+        return self.mask.all(axis=0)
+    
+    def _eq (self, na: str) -> np.ndarray:
+        """
+        Derive the elementwise result for a single value of ``na``.
+        """
+        if self._series is None:
+            return np.ones(self._n, dtype=bool)
+        if na == 'any':
+            return self._check
+        check = self._check & ~self._any_na
+        if na == 'all':
+            check |= self._all_na
+        return check
+    
+    def eq (self, na: Modes = 'any') -> Union[pd.Series, pd.DataFrame]:
+        """
+        Compare the Series elementwise, see eq_multiple().
+        
+        Parameters
+        ----------
+        na : {'all', 'any, 'none'} or list of them, default 'any'
+            Control how NA values are handled during the comparison.
+            See eq_multiple() for details.
+        
+        Returns
+        -------
+        pd.Series or pd.DataFrame
+            Elementwise results of the comparison. A DataFrame with one
+            column per value, if ``na`` is a list.
+        """
+        modes = _modes(na)
+        if isinstance(na, str):
+            return pd.Series(self._eq(na).copy())
+        return pd.DataFrame({mode: self._eq(mode) for mode in modes})
+    
+    def equals (self, na: Modes = 'any') -> Union[bool, pd.Series]:
+        """
+        Test whether the Series contain the same elements, see
+        equals_multiple().
+        
+        Parameters
+        ----------
+        na : {'all', 'any, 'none'} or list of them, default 'any'
+            Control how NA values are handled during the comparison.
+            See eq_multiple() for details.
+        
+        Returns
+        -------
+        bool or pd.Series
+            Result of the comparison. A Series indexed by the values of
+            ``na``, if it is a list.
+        """
+        modes = _modes(na)
+        if isinstance(na, str):
+            return np.bool_(self._eq(na).all())
+        return pd.Series([self._eq(mode).all() for mode in modes], index=modes, dtype=bool)
@@ -0,0 +1,223 @@
+from types import ModuleType
+from typing import Union, Optional
+
+import numpy as np
+import pandas as pd
+
+from ._align import align
+from ._eq import _check_na, eq_multiple, equals_multiple
+from ._merge import merge_non_na
+
+def _prepare (data: Union[list['dd.Series'], 'dd.DataFrame']) -> tuple[ModuleType, list['dd.Series']]:
+    """
+    Validate the arguments of the Dask adapters and return dask.dataframe
+    along with the list of Series to process.
+    
+    Dask is only imported here, since importing it takes longer than
+    importing pdutils itself.
+    """
+    try:
+        import dask.dataframe as dd
+    except ImportError:
+        raise ImportError("dask is required to process Dask collections.") from None
+    if isinstance(data, dd.DataFrame):
+        return dd, [data[column] for column in data.columns]
+    if not isinstance(data, list):
+        raise TypeError(f"Expected a list of Dask Series or a Dask DataFrame, got {type(data)} instead.")
+    if len(data) == 0:
+        raise ValueError("List of Series may not be empty.")
+    for elem in data:
+        if not isinstance(elem, dd.Series):
+            raise TypeError(f"Element must be a Dask Series, got {type(elem)} instead.")
+    return dd, data
+
+def _aligned (parts: tuple[pd.Series, ...]) -> list[pd.Series]:
+    """
+    Reindex the partitions of several Series to the union of their labels,
+    if they differ.
+    """
+    index, indexers = align(list(parts))
+    if indexers is None:
+        return list(parts)
+    return [part.reindex(index) for part in parts]
+
+def _eq_partition (*parts: pd.Series, na: str) -> pd.Series:
+    """
+    Compare the matching partitions of several Series.
+    """
+    parts = _aligned(parts)
+    check = eq_multiple(parts, na)
+    check.index = parts[0].index
+    return check
+
+def _equals_partition (*parts: pd.Series, na: str) -> pd.Series:
+    """
+    Compare the matching partitions of several Series, reduced to a single
+    row to be combined by a tree reduction.
+    """
+    return pd.Series([bool(equals_multiple(_aligned(parts), na))])
+
+def _merge_partition (*parts: pd.Series, remaining_na: str, strategy) -> pd.Series:
+    """
+    Merge the matching partitions of several Series.
+    """
+    return merge_non_na(list(parts), remaining_na, strategy=strategy)
+
+def eq_multiple_dask (series: Union[list['dd.Series'], 'dd.DataFrame'],
+                      na: Optional[str] = 'any'
+                      ) -> 'dd.Series':
+    """
+    Compare multiple Dask Series elementwise, partition by partition.
+    
+    Dask variant of eq_multiple(). The comparison is added lazily to the
+    task graph of the inputs, without materializing them, and runs on
+    whatever scheduler the result is computed with, e.g. the local
+    threaded or process scheduler.
+    
+    Series are aligned by their labels. If their divisions are known, but
+    differ, they are repartitioned to common divisions first. Labels that
+    are missing in some of the Series are treated as NA there. If divisions
+    are unknown, all Series must have the same number of partitions, which
+    are matched by their position.
+    
+    Parameters
+    ----------
+    series : list of dd.Series or dd.DataFrame
+        Series to compare with each other.
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled during the comparison.
+        See eq_multiple() for details.
+    
+    Returns
+    -------
+    dd.Series
+        Lazy elementwise results of the comparison, carrying the index of
+        the aligned Series.
+    
+    Raises
+    ------
+    ValueError
+        If ``series`` is empty.
+        If value for ``na`` is not recognized.
+    TypeError
+        If elements in ``series`` are not Dask Series.
+    ImportError
+        If dask is not installed.
+    
+    See Also
+    --------
+    eq_multiple: Compare multiple Series elementwise.
+    
+    Examples
+    --------
+    >>> ddf = dd.from_pandas(df, npartitions=4)
+    >>> eq_multiple_dask(ddf, na='all').compute(scheduler='processes')
+    """
+    dd, series = _prepare(series)
+    _check_na(na)
+    meta = _eq_partition(*[s._meta for s in series], na=na)
+    return dd.map_partitions(_eq_partition, *series, na=na, meta=meta, align_dataframes=True)
+
+def equals_multiple_dask (series: Union[list['dd.Series'], 'dd.DataFrame'],
+                          na: Optional[str] = 'any',
+                          scheduler: Optional[str] = None
+                          ) -> bool:
+    """
+    Test whether multiple Dask Series contain the same elements.
+    
+    Dask variant of equals_multiple(). Each partition is compared on its
+    own and the results are combined by a tree reduction, so only a single
+    boolean per partition is sent back to the client.
+    
+    Parameters
+    ----------
+    series : list of dd.Series or dd.DataFrame
+        Series to compare with each other. See eq_multiple_dask() for how
+        they are aligned.
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled during the comparison.
+        See eq_multiple() for details.
+    
+    scheduler : str, optional
+        Scheduler to compute the result with, e.g. ``'threads'`` or
+        ``'processes'``. Defaults to the scheduler configured in dask.
+    
+    Returns
+    -------
+    bool
+        Result of the comparison.
+    
+    See Also
+    --------
+    equals_multiple: Test whether multiple Series contain the same elements.
+    
+    Examples
+    --------
+    >>> equals_multiple_dask([ddf['a'], ddf['b']], scheduler='threads')
+    True
+    """
+    dd, series = _prepare(series)
+    _check_na(na)
+    partial = dd.map_partitions(_equals_partition, *series, na=na, meta=pd.Series(dtype=bool),
+                                align_dataframes=True)
+    return np.bool_(partial.all().compute(scheduler=scheduler))
+
+def merge_non_na_dask (data: Union[list['dd.Series'], 'dd.DataFrame'],
+                       remaining_na: Optional[str] = 'raise',
+                       strategy: Union[str, list, np.ndarray] = 'first'
+                       ) -> 'dd.Series':
+    """
+    Combine multiple Dask Series by filling NA values with non-NA values
+    from the others, partition by partition.
+    
+    Dask variant of merge_non_na(). The merge is added lazily to the task
+    graph of the inputs, without materializing them. Series are aligned
+    like in eq_multiple_dask(), each partition holds the union of the labels
+    of the matching partitions.
+    
+    Parameters
+    ----------
+    data : list of dd.Series or dd.DataFrame
+        Series to merge/choose values from.
+    
+    remaining_na : {'raise', 'warn', 'ignore'}, default 'raise
+        What to do, when NA values remain after merging. Since the result
+        is lazy, this is applied per partition once it is computed.
+        See merge_non_na() for details.
+    
+    strategy : {'first', 'last', 'majority'} or sequence of numbers, default 'first'
+        Which value to choose, if a row holds several non-NA values.
+        See merge_non_na() for details.
+    
+    Returns
+    -------
+    dd.Series
+        Lazy result of merging the combined Series.
+    
+    Raises
+    ------
+    ValueError
+        If ``data`` is empty.
+        If value for ``remaining_na`` or ``strategy`` is not recognized.
+    TypeError
+        If elements in ``data`` are not Dask Series.
+    ImportError
+        If dask is not installed.
+    
+    See Also
+    --------
+    merge_non_na: Combine multiple Series.
+    
+    Examples
+    --------
+    >>> merge_non_na_dask([ddf['a'], ddf['b']]).to_parquet('merged')
+    """
+    dd, data = _prepare(data)
+    if remaining_na not in ('raise', 'warn', 'ignore'):
+        raise ValueError(f"Expected value for kwarg 'remaining_na' to be one of "
+                         f"['raise', 'warn', 'ignore'], got {remaining_na} instead.")
+    meta = _merge_partition(*[s._meta for s in data], remaining_na='ignore', strategy=strategy)
+    return dd.map_partitions(_merge_partition, *data, remaining_na=remaining_na, strategy=strategy,
+                             meta=meta, align_dataframes=True)
@@ -1,12 +1,161 @@
-from itertools import permutations, pairwise
-from typing import Union, Optional
+from typing import NamedTuple, Union, Optional
 
 import numpy as np
 import pandas as pd
 
+from . import _arrow, _categorical, _coerce, _fingerprint, _instrument, _numba, _polars
+from ._blocks import map_blocks
+
+class Mismatches (NamedTuple):
+    """
+    Rows of a comparison that evaluated to False.
+    """
+    positions: np.ndarray
+    """Integer positions of the rows."""
+    labels: pd.Index
+    """Labels of the rows in the index of the first Series."""
+
+def _check_na (na: str) -> None:
+    """
+    Validate the ``na`` keyword argument.
+    """
+    if na not in ('any', 'all', 'none'):
+        raise ValueError(f"Expected value for kwarg 'na' to be one of "
+                         f"['any', 'all', 'none'], got {na} instead.")
+
+def _prepare (series: Union[list[Union[pd.Series, np.ndarray, list, tuple, dict]], pd.DataFrame],
+              na: str,
+              engine: Optional[str] = None
+              ) -> Optional[list[pd.Series]]:
+    """
+    Validate the arguments of eq_multiple and equals_multiple.
+    
+    Returns a new list of the Series to compare or None, if ``series`` is a
+    single element and hence trivially equal.
+    """
+    prepared = _coerce.series_list(series)
+    if prepared is None:
+        return None
+    
+    if len(prepared) == 0:
+        raise ValueError("List of Series may not be empty.")
+    
+    n = len(prepared[0])
+    if any(len(s) != n for s in prepared[1:]):
+        raise ValueError("Lengths of all Series must be equal.")
+    
+    _check_na(na)
+    _numba.check_engine(engine)
+    return prepared
+
+def _compare (series: list[pd.Series], na: str, func, n_jobs: Optional[int], engine: Optional[str]):
+    """
+    Compare ``series`` block by block and yield ``func(start, stop, check)``
+    for each block of rows.
+    """
+    if _arrow.supports([s.dtype for s in series]):
+        _instrument.path('arrow')
+        columns = [_arrow.chunked(s) for s in series]
+        
+        def compare_block (start, stop):
+            check = _arrow.eq_block(columns, na, start, stop)
+            return func(start, stop, check.to_numpy())
+        
+        return map_blocks(compare_block, len(series[0]), n_jobs)
+    
+    if _categorical.supports([s.dtype for s in series]):
+        _instrument.path('categorical')
+        columns = [_categorical.codes(s) for s in _categorical.unify(series)]
+        
+        def compare_block (start, stop):
+            values = np.stack([column[start:stop] for column in columns])
+            return func(start, stop, _eq_kernel(values, values == -1, na))
+        
+        return map_blocks(compare_block, len(series[0]), n_jobs)
+    
+    if engine == 'numba' and _numba.supports([s.dtype for s in series]):
+        _instrument.path('numba')
+        columns = [s.to_numpy() for s in series]
+        dtype = np.result_type(*columns)
+        na_kind = _numba.na_kind(dtype)
+        
+        def compare_block (start, stop):
+            ref = _numba.as_kernel_input(np.empty(stop - start, dtype=dtype), dtype)
+            has_ref = np.zeros(stop - start, dtype=bool)
+            any_na = np.zeros(stop - start, dtype=bool)
+            check = np.ones(stop - start, dtype=bool)
+            for column in columns:
+                values = _numba.as_kernel_input(column[start:stop], dtype)
+                _numba.eq_update(values, na_kind, ref, has_ref, any_na, check)
+            if na != 'any':
+                check &= ~any_na
+            if na == 'all':
+                check |= ~has_ref
+            return func(start, stop, check)
+        
+        return map_blocks(compare_block, len(series[0]), n_jobs)
+    
+    columns = [_coerce.values(s) for s in series]
+    dtype = _coerce.common_dtype([_coerce.compare_dtype(s.dtype) for s in series])
+    _instrument.path('object' if dtype == object else 'numpy')
+    if dtype == object:
+        # comparing objects holds the GIL
+        n_jobs = None
+    
+    def compare_block (start, stop):
+        values, mask = _coerce.stack_rows(columns, dtype, start, stop)
+        return func(start, stop, _eq_kernel(values, mask, na))
+    
+    return map_blocks(compare_block, len(series[0]), n_jobs)
+
+def _eq_rows (values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Compare the rows of a stacked (k, n) array in O(k*n).
+    
+    Instead of comparing all pairs of elements, each element is compared to
+    the first non-NA element of its row, which is equivalent since equality
+    is transitive. NA elements always compare as True here.
+    """
+    k, n = values.shape
+    first = np.argmax(~mask, axis=0)
+    ref = values[first, np.arange(n)]
+    
+    check = np.ones(n, dtype=bool)
+    eq = np.empty(n, dtype=bool)
+    for j in range(k):
+        if values.dtype == object:
+            # never pass NA to __eq__, as pd.NA is not convertible to bool
+            valid = ~mask[j]
+            eq.fill(True)
+            eq[valid] = values[j][valid] == ref[valid]
+        else:
+            np.equal(values[j], ref, out=eq)
+            eq |= mask[j]
+        check &= eq
+    return check
+
+def _eq_kernel (values: np.ndarray, mask: np.ndarray, na: str) -> np.ndarray:
+    """
+    Compare the rows of a stacked (k, n) array, applying ``na`` afterwards
+    based on the number of NA values in a row.
+    """
+    check = _eq_rows(values, mask)
+    if na == 'any':
+        return check
+    any_na = mask.any(axis=0)
+    check &= ~any_na
+    if na == 'all':
+        check |= mask.all(axis=0)
+    return check
+
+@_instrument.instrumented
 def eq_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple, dict]], pd.DataFrame],
-                 na: Optional[str] = 'any'
-                 ) -> pd.Series:
+                 na: Optional[str] = 'any',
+                 n_jobs: Optional[int] = None,
+                 engine: Optional[str] = None,
+                 result: Optional[str] = 'series',
+                 out: Optional[Union[np.ndarray, pd.Series]] = None
+                 ) -> Union[pd.Series, np.ndarray, Mismatches]:
     """
     Compare multiple Series elementwise.
     
@@ -19,7 +168,9 @@ def eq_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple, di
     Parameters
     ----------
     series : sequence of array-like or pd.DataFrame
-        List of Series to compare with each other.
+        List of Series to compare with each other. A list of Polars Series
+        or a Polars DataFrame is compared with Polars expressions on the
+        multithreaded engine of Polars instead, see Notes.
     
     na : {'all', 'any, 'none'}, default 'any'
         Control how NA values are handled during the comparison:
@@ -31,25 +182,64 @@ def eq_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple, di
             direct comparison of two NA elements evaluates to False.
             Equivalent to ``pd.Series.eq()``.
     
+    n_jobs : int, optional
+        Number of threads to compare blocks of rows on. Use -1 for all
+        available CPUs. Small inputs are always compared on a single thread.
+    
+    engine : {None, 'numba'}, default None
+        Use ``'numba'`` to compare numeric and datetime Series with compiled
+        kernels, which compare each row in a single pass without temporary
+        arrays. Falls back to the default engine, if numba is not installed
+        or the dtypes are not supported.
+    
+    result : {'series', 'bitmap', 'mismatches'}, default 'series'
+        Representation of the result:
+        - ``series``: A boolean Series with one element per row.
+        - ``bitmap``: A uint8 array of the results packed into bits, as
+            returned by ``np.packbits()``. Use ``np.unpackbits(bits,
+            count=n)`` to restore a boolean array of ``n`` elements.
+        - ``mismatches``: Positions and index labels of all rows that
+            evaluate to False, as a ``Mismatches`` named tuple. Labels are
+            taken from the index of the first Series.
+        Each representation is built directly block by block, without
+        building the full boolean Series first. For Arrow-backed inputs
+        of a single dtype, the Series is of dtype ``bool[pyarrow]``.
+    
+    out : np.ndarray or pd.Series, optional
+        Preallocated buffer to write the results into instead of
+        allocating a new one, e.g. to reuse it for repeated calls on
+        inputs of the same length. Must be a boolean array or Series of
+        length ``n`` for ``result='series'`` or a uint8 array of length
+        ``(n + 7) // 8`` for ``result='bitmap'``. Its index, if any, is
+        left untouched. The inputs are never modified.
+    
     Returns
     -------
-    pd.Series
-        Elementwise results of the comparison.
+    pd.Series, np.ndarray or Mismatches
+        Elementwise results of the comparison, see ``result``. If ``out``
+        is given, ``out`` itself is returned.
     
     Raises
     ------
     ValuesError
         If ``series`` is empty.
         If elements in ``series`` have different lengths.
-        If value for ``na`` is not recognized.
+        If value for ``na``, ``engine`` or ``result`` is not recognized.
+        If ``out`` does not match the shape or dtype of the result.
     TypeError
         If elements in ``series`` are not array-like.
+        If ``out`` is neither an ndarray nor a Series.
     
     Notes
     -----
     Using this function with ``na='none'`` on only two Series is
     equivalent to calling ``pd.Series.eq()`` directly.
     
+    Polars inputs are compared without converting them to pandas and the
+    result is returned as Polars Series. NaN is treated as NA, like in
+    pandas. ``n_jobs`` and ``engine`` are ignored, only ``result='series'``
+    is supported and ``out`` is not.
+    
     See Also
     --------
     equals_multiple: Return True, if all elements are true.
@@ -76,6 +266,17 @@ def eq_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple, di
     1 False
     dtype: bool
     
+    Only report the rows that differ:
+    
+    >>> eq_multiple([s1,s2,s3], na='none', result='mismatches')
+    Mismatches(positions=array([1]), labels=Int64Index([1], dtype='int64'))
+    
+    Reuse a buffer for repeated comparisons:
+    
+    >>> check = np.empty(2, dtype=bool)
+    >>> for batch in batches:
+    ...     eq_multiple(batch, out=check)
+    
     Opposed to the build-in function ``pd.Series.eq()``, eq_multiple
     can consider all-NA rows as True, if provided with ``na='all':
     
@@ -105,44 +306,86 @@ def eq_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple, di
     1 True
     dtype: bool
     """
-    if isinstance(series, pd.DataFrame):
-        series = [s for _, s in series.iteritems()]
-    
-    if not isinstance(series, list):
-        return pd.Series([True for _ in range(len(series))])
-    
-    if len(series) == 0:
-        raise ValueError("List of Series may not be empty.")
-    
-    n = len(series[0])
-    for i, elem in enumerate(series):
-        if len(elem) != n:
-            raise ValueError("Lengths of all Series must be equal.")
-        if isinstance(elem, pd.Series):
-            continue
-        elif isinstance(elem, (np.ndarray, list, tuple)):
-            series.append(pd.Series(series.pop(i)))
-        else:
-            raise TypeError(f"Element must be Series, ndarray, list or tuple, "
-                            "got {type(elem)} instead.")
-    
-    check = pd.Series([True for _ in range(n)])
-    if na == 'any':
-        for a, b in permutations(series, r=2):
-            check &= pd.Series.eq(a, b) | a.isna() | b.isna()
-    elif na == 'all':
-        for a, b in pairwise(series):
-            check &= pd.Series.eq(a, b) | (a.isna() & b.isna())
-    elif na == 'none':
-        for a, b in pairwise(series):
-            check &= pd.Series.eq(a, b)
-    else:
-        raise ValueError(f"Expected value for kwarg 'na' to be one of "
-                         "['any', 'all', 'none'], got {na} instead.")
-    return check
+    if result not in ('series', 'bitmap', 'mismatches'):
+        raise ValueError(f"Expected value for kwarg 'result' to be one of "
+                         f"['series', 'bitmap', 'mismatches'], got {result} instead.")
+    
+    if out is not None and result == 'mismatches':
+        raise ValueError("Kwarg 'out' is not supported for result='mismatches'.")
+    
+    if _polars.accepts(series):
+        _instrument.path('polars')
+        check = _polars.eq_multiple(series, na, result, out)
+        _instrument.mark('compare')
+        return check
+    
+    prepared = _prepare(series, na, engine)
+    n = len(series) if prepared is None else len(prepared[0])
+    target = None
+    if out is not None:
+        shape, dtype = ((n,), bool) if result == 'series' else (((n + 7) // 8,), np.uint8)
+        target = _coerce.buffer(out, shape)
+        if target.dtype != dtype:
+            raise ValueError(f"Expected 'out' to be of dtype {np.dtype(dtype)}, got {target.dtype} instead.")
+    _instrument.mark('coerce')
+    
+    if prepared is None or len(prepared) == 1:
+        if result == 'mismatches':
+            index = pd.RangeIndex(n) if prepared is None else prepared[0].index
+            return Mismatches(np.array([], dtype=np.intp), index[:0])
+        elif target is not None:
+            target[:] = True if result == 'series' else np.packbits(np.ones(n, dtype=bool))
+            return out
+        elif result == 'series':
+            return pd.Series(np.ones(n, dtype=bool))
+        return np.packbits(np.ones(n, dtype=bool))
+    series = prepared
+    
+    if result == 'series' and out is None and _arrow.supports([s.dtype for s in series]):
+        _instrument.path('arrow')
+        columns = [_arrow.chunked(s) for s in series]
+        blocks = map_blocks(lambda start, stop: _arrow.eq_block(columns, na, start, stop), n, n_jobs)
+        chunks = [chunk for block in blocks for chunk in block.chunks]
+        _instrument.mark('compare')
+        check = _arrow.pa.chunked_array(chunks, type=_arrow.pa.bool_())
+        return pd.Series(pd.arrays.ArrowExtensionArray(check))
+    
+    if result == 'series':
+        check = np.empty(n, dtype=bool) if target is None else target
+        
+        def fill (start, stop, block):
+            check[start:stop] = block
+        
+        for _ in _compare(series, na, fill, n_jobs, engine):
+            pass
+        _instrument.mark('compare')
+        return pd.Series(check) if out is None else out
+    
+    elif result == 'bitmap':
+        # blocks hold a multiple of 8 rows, so their bytes do not overlap
+        bits = np.empty((n + 7) // 8, dtype=np.uint8) if target is None else target
+        
+        def pack (start, stop, block):
+            bits[start//8:(stop+7)//8] = np.packbits(block)
+        
+        for _ in _compare(series, na, pack, n_jobs, engine):
+            pass
+        _instrument.mark('compare')
+        return bits if out is None else out
+    
+    def locate (start, stop, block):
+        return start + np.flatnonzero(~block)
+    
+    positions = np.concatenate([np.array([], dtype=np.intp), *_compare(series, na, locate, n_jobs, engine)])
+    _instrument.mark('compare')
+    return Mismatches(positions, series[0].index[positions])
 
+@_instrument.instrumented
 def equals_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple, dict]], pd.DataFrame],
-                     na: Optional[str] = 'any'
+                     na: Optional[str] = 'any',
+                     n_jobs: Optional[int] = None,
+                     engine: Optional[str] = None,
+                     fingerprint: bool = False
                      ) -> pd.Series:
     """
     Test whether multiple Series contain the same elements.
@@ -156,7 +399,9 @@ def equals_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple
     Parameters
     ----------
     series : sequence of array-like or pd.DataFrame
-        List of Series to compare with each other.
+        List of Series to compare with each other. A list of Polars Series
+        or a Polars DataFrame is compared with Polars expressions on the
+        multithreaded engine of Polars instead, see Notes.
     
     na : {'all', 'any, 'none'}, default 'any'
         Control how NA values are handled during the comparison:
@@ -168,6 +413,25 @@ def equals_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple
             comparison of two NA elements evaluates to False.
             Equivalent to ``pd.Series.equals()``.
     
+    n_jobs : int, optional
+        Number of threads to compare blocks of rows on. Use -1 for all
+        available CPUs. Small inputs are always compared on a single thread.
+    
+    engine : {None, 'numba'}, default None
+        Use ``'numba'`` to compare numeric and datetime Series with compiled
+        kernels, which compare each row in a single pass without temporary
+        arrays. Falls back to the default engine, if numba is not installed
+        or the dtypes are not supported.
+    
+    fingerprint : bool, default False
+        Hash the content of each Series, including its NA pattern, and try
+        to decide the comparison from these hashes first. Differing hashes
+        prove a mismatch without comparing the Series. Equal hashes are
+        always confirmed by a full comparison, so Series that turn out to
+        be equal cost a hash on top of it. Hashes are only cached for
+        Series backed by read-only arrays, e.g. memory-mapped files, which
+        are then hashed only once. See clear_fingerprints().
+    
     Returns
     -------
     bool
@@ -178,7 +442,7 @@ def equals_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple
     ValuesError
         If ``series`` is empty.
         If elements in ``series`` have different lengths.
-        If value for ``na`` is not recognized.
+        If value for ``na`` or ``engine`` is not recognized.
     TypeError
         If elements in ``series`` are not array-like.
     
@@ -187,6 +451,9 @@ def equals_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple
     Using this function with ``na='none'`` on only two Series is
     equivalent to calling ``pd.Series.equals()`` directly.
     
+    Polars inputs are compared without converting them to pandas, see
+    eq_multiple(). ``n_jobs``, ``engine`` and ``fingerprint`` are ignored.
+    
     See Also
     --------
     eq_multiple: Elementwise comparison that returns a Series.
@@ -229,4 +496,27 @@ def equals_multiple (series: Union[list[Union[pd.Series, np.ndarray, list, tuple
     >>> eq_multiple([s1,s2,s3], na='any')
     True
     """
-    return eq_multiple(series, na).all()
+    if _polars.accepts(series):
+        _instrument.path('polars')
+        equal = _polars.equals_multiple(series, na)
+        _instrument.mark('compare')
+        return equal
+    
+    series = _prepare(series, na, engine)
+    _instrument.mark('coerce')
+    if series is None or len(series) == 1:
+        return np.True_
+    
+    if fingerprint:
+        mismatch = _fingerprint.mismatch(series, [_coerce.compare_dtype(s.dtype) for s in series], na)
+        _instrument.mark('fingerprint')
+        if mismatch:
+            _instrument.path('fingerprint')
+            return np.False_
+    
+    for equal in _compare(series, na, lambda start, stop, block: block.all(), n_jobs, engine):
+        if not equal:
+            _instrument.mark('compare')
+            return np.False_
+    _instrument.mark('compare')
+    return np.True_
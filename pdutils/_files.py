@@ -0,0 +1,349 @@
+import os
+from typing import Union, Optional, Iterator
+
+import numpy as np
+import pandas as pd
+
+from . import _arrow, _coerce
+from ._blocks import BLOCK_SIZE
+from ._stream import eq_multiple_chunks, equals_multiple_chunks, merge_non_na_chunks
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+Source = Union[tuple[Union[str, os.PathLike], str], np.ndarray]
+Target = Union[str, os.PathLike, np.ndarray]
+
+def _require_parquet () -> None:
+    """
+    Raise an ImportError, if parquet files cannot be read or written.
+    """
+    if pq is None:
+        raise ImportError("pyarrow is required to read and write parquet files.")
+
+def _open (source: Source) -> tuple[int, 'pa.DataType']:
+    """
+    Validate a source and return its number of rows and its Arrow type.
+    
+    A source is either a tuple of the path of a parquet file and the name of
+    a column in it, or an array, typically an np.memmap of a raw binary
+    column. Only metadata is read.
+    """
+    if isinstance(source, np.ndarray):
+        if source.ndim != 1:
+            raise ValueError("Arrays must be one-dimensional.")
+        return len(source), _arrow.pa.from_numpy_dtype(source.dtype) if _arrow.pa is not None else None
+    if isinstance(source, tuple) and len(source) == 2:
+        _require_parquet()
+        path, column = source
+        schema = pq.read_schema(path)
+        if column not in schema.names:
+            raise KeyError(f"Column {column} not found in {path}.")
+        return pq.ParquetFile(path).metadata.num_rows, schema.field(column).type
+    raise TypeError(f"Source must be a tuple of a path and a column name or an ndarray, "
+                    f"got {type(source)} instead.")
+
+def _types_mapper (dtype: 'pa.DataType'):
+    """
+    Map Arrow integer and boolean types to masked dtypes, e.g. Int64, so
+    that nulls do not turn their values into floats.
+    """
+    if _arrow.pa.types.is_integer(dtype) or _arrow.pa.types.is_boolean(dtype):
+        return _coerce._masked(np.dtype(dtype.to_pandas_dtype()))
+    return None
+
+def _to_values (data: 'pa.ChunkedArray'):
+    """
+    Convert a block read from a parquet file to a numpy or masked array.
+    """
+    return _coerce.values(data.to_pandas(types_mapper=_types_mapper))
+
+def _read (source: Source, block_size: int) -> Iterator[Union[np.ndarray, pd.api.extensions.ExtensionArray]]:
+    """
+    Lazily read a source in consecutive blocks of ``block_size`` rows.
+    
+    Parquet files are read batch by batch. Since batches end at the
+    boundaries of row groups, which differ between files, they are buffered
+    and re-split, so that the blocks of all sources are aligned. Integer and
+    boolean columns are read as masked arrays, which hold nulls without
+    losing precision.
+    """
+    if isinstance(source, np.ndarray):
+        for start in range(0, len(source), block_size):
+            yield source[start:start+block_size]
+        return
+    
+    path, column = source
+    buffer = []
+    buffered = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=block_size, columns=[column]):
+        buffer.append(batch.column(0))
+        buffered += len(batch)
+        while buffered >= block_size:
+            data = _arrow.pa.chunked_array(buffer)
+            yield _to_values(data.slice(0, block_size))
+            buffer = data.slice(block_size).chunks
+            buffered -= block_size
+    if buffered > 0:
+        yield _to_values(_arrow.pa.chunked_array(buffer))
+
+def _common_type (dtypes: list['pa.DataType']) -> Optional['pa.DataType']:
+    """
+    Find the Arrow type numeric and datetime sources of differing types are
+    merged in, as numpy would promote them. Returns None for other types.
+    """
+    if _arrow.pa is None or any(dtype is None for dtype in dtypes):
+        return None
+    try:
+        numpy_dtypes = [np.dtype(dtype.to_pandas_dtype()) for dtype in dtypes]
+    except (NotImplementedError, TypeError):
+        return None
+    kinds = {dtype.kind for dtype in numpy_dtypes}
+    if not (kinds <= set('biuf') or kinds == {'M'} or kinds == {'m'}):
+        return None
+    return _arrow.pa.from_numpy_dtype(np.result_type(*numpy_dtypes))
+
+def _chunks (sources: list[Source],
+             block_size: Optional[int]
+             ) -> tuple[int, list['pa.DataType'], Iterator[list[pd.Series]]]:
+    """
+    Validate ``sources`` and return their number of rows and Arrow types
+    along with an iterator over aligned blocks of them. The Series of each
+    block carry the positions of their rows as index.
+    """
+    if not isinstance(sources, list):
+        raise TypeError(f"Expected a list of sources, got {type(sources)} instead.")
+    if len(sources) == 0:
+        raise ValueError("List of sources may not be empty.")
+    if block_size is None:
+        block_size = BLOCK_SIZE
+    if not isinstance(block_size, int) or block_size <= 0:
+        raise ValueError(f"Expected value for kwarg 'block_size' to be a positive integer, "
+                         f"got {block_size} instead.")
+    
+    lengths, dtypes = zip(*[_open(source) for source in sources])
+    n = lengths[0]
+    if any(length != n for length in lengths[1:]):
+        raise ValueError("Lengths of all sources must be equal.")
+    
+    def chunks ():
+        start = 0
+        for blocks in zip(*[_read(source, block_size) for source in sources]):
+            index = pd.RangeIndex(start, start + len(blocks[0]))
+            yield [pd.Series(block, index=index, copy=False) for block in blocks]
+            start += len(blocks[0])
+    
+    return n, list(dtypes), chunks()
+
+def _write (results: Iterator[pd.Series], out: Target, n: int, name: str, dtype: Optional['pa.DataType']) -> None:
+    """
+    Write blocks of results to ``out`` as they are computed.
+    
+    Arrays, e.g. np.memmap, are filled in place. Paths are written as a
+    parquet file with a single column ``name`` of Arrow type ``dtype``,
+    with one row group per block. If ``dtype`` is None, the type of the
+    first block is used for all blocks.
+    """
+    if isinstance(out, np.ndarray):
+        if out.shape != (n,):
+            raise ValueError(f"Expected 'out' to be of shape ({n},), got {out.shape} instead.")
+        start = 0
+        for result in results:
+            data = _coerce.values(result)
+            if not isinstance(data, np.ndarray):
+                # integers are written exactly, NA values only fit into floats
+                data = data.to_numpy(dtype=out.dtype, na_value=np.nan if out.dtype.kind in 'fc' else None)
+            out[start:start+len(result)] = data
+            start += len(result)
+        if isinstance(out, np.memmap):
+            out.flush()
+        return
+    
+    _require_parquet()
+    writer = None
+    try:
+        for result in results:
+            data = _arrow.pa.Array.from_pandas(result, type=dtype)
+            if writer is None:
+                dtype = data.type
+                writer = pq.ParquetWriter(out, _arrow.pa.schema([(name, dtype)]))
+            writer.write_table(_arrow.pa.table({name: data}))
+        if writer is None:
+            schema = _arrow.pa.schema([(name, dtype if dtype is not None else _arrow.pa.null())])
+            writer = pq.ParquetWriter(out, schema)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def eq_multiple_files (sources: list[Source],
+                       out: Target,
+                       na: Optional[str] = 'any',
+                       name: str = 'eq',
+                       block_size: Optional[int] = None
+                       ) -> None:
+    """
+    Compare multiple columns stored in files elementwise, without loading
+    them into memory.
+    
+    Out-of-core variant of eq_multiple(). All sources are read in aligned
+    blocks of rows, each block is compared and its result is written to
+    ``out`` right away. Memory use hence depends on ``block_size`` and the
+    number of sources only.
+    
+    Parameters
+    ----------
+    sources : list of tuple or np.ndarray
+        Columns to compare. Either a tuple of the path of a parquet file and
+        the name of a column in it, or an array, e.g. an np.memmap of a raw
+        binary column. All sources must have the same number of rows.
+    
+    out : str, path or np.ndarray
+        Where to write the results to. Either the path of a parquet file to
+        create or a boolean array of matching length, e.g. an np.memmap.
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled during the comparison.
+        See eq_multiple() for details.
+    
+    name : str, default 'eq'
+        Name of the column written to a parquet file.
+    
+    block_size : int, optional
+        Number of rows read from each source at once.
+    
+    Raises
+    ------
+    ValueError
+        If ``sources`` is empty.
+        If sources have different lengths or ``out`` does not match them.
+        If value for ``na`` or ``block_size`` is not recognized.
+    TypeError
+        If a source is neither a tuple of a path and a column nor an array.
+    ImportError
+        If parquet files are used, but pyarrow is not installed.
+    
+    See Also
+    --------
+    eq_multiple: Compare multiple Series elementwise.
+    eq_multiple_chunks: Compare chunks of Series elementwise.
+    
+    Examples
+    --------
+    >>> eq_multiple_files([('a.parquet', 'price'), ('b.parquet', 'price')], 'eq.parquet')
+    >>> pd.read_parquet('eq.parquet')['eq'].all()
+    True
+    """
+    n, _, chunks = _chunks(sources, block_size)
+    _write(eq_multiple_chunks(chunks, na), out, n, name, _arrow.pa.bool_() if _arrow.pa is not None else None)
+
+def equals_multiple_files (sources: list[Source],
+                           na: Optional[str] = 'any',
+                           block_size: Optional[int] = None
+                           ) -> bool:
+    """
+    Test whether multiple columns stored in files contain the same elements,
+    without loading them into memory.
+    
+    Out-of-core variant of equals_multiple(). Stops reading at the first
+    block containing a mismatch.
+    
+    Parameters
+    ----------
+    sources : list of tuple or np.ndarray
+        Columns to compare, see eq_multiple_files().
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled during the comparison.
+        See eq_multiple() for details.
+    
+    block_size : int, optional
+        Number of rows read from each source at once.
+    
+    Returns
+    -------
+    bool
+        Result of the comparison.
+    
+    See Also
+    --------
+    equals_multiple: Test whether multiple Series contain the same elements.
+    
+    Examples
+    --------
+    >>> equals_multiple_files([('a.parquet', 'price'), ('b.parquet', 'price')], na='all')
+    True
+    """
+    return equals_multiple_chunks(_chunks(sources, block_size)[2], na)
+
+def merge_non_na_files (sources: list[Source],
+                        out: Target,
+                        remaining_na: Optional[str] = 'raise',
+                        name: str = 'merged',
+                        block_size: Optional[int] = None
+                        ) -> None:
+    """
+    Combine multiple columns stored in files by filling NA values with
+    non-NA values from the others, without loading them into memory.
+    
+    Out-of-core variant of merge_non_na(). All sources are read in aligned
+    blocks of rows, each block is merged and its result is written to
+    ``out`` right away. Memory use hence depends on ``block_size`` and the
+    number of sources only. Rows are aligned by their position.
+    
+    Parameters
+    ----------
+    sources : list of tuple or np.ndarray
+        Columns to merge, see eq_multiple_files().
+    
+    out : str, path or np.ndarray
+        Where to write the result to. Either the path of a parquet file to
+        create or an array of matching length, e.g. an np.memmap. If all
+        sources share the same type, the parquet column is of that type,
+        e.g. integer columns stay integers even if some blocks contain NA
+        values.
+    
+    remaining_na : {'raise', 'warn', 'ignore'}, default 'raise
+        What to do, when NA values remain after merging.
+        See merge_non_na() for details. With ``raise``, blocks written
+        before the first remaining NA value are kept in ``out``.
+    
+    name : str, default 'merged'
+        Name of the column written to a parquet file.
+    
+    block_size : int, optional
+        Number of rows read from each source at once.
+    
+    Raises
+    ------
+    ValueError
+        If ``sources`` is empty.
+        If sources have different lengths or ``out`` does not match them.
+        If NA values remain and ``remaining_na`` is ``raise``.
+        If value for ``remaining_na`` or ``block_size`` is not recognized.
+    TypeError
+        If a source is neither a tuple of a path and a column nor an array.
+    ImportError
+        If parquet files are used, but pyarrow is not installed.
+    
+    See Also
+    --------
+    merge_non_na: Combine multiple Series.
+    merge_non_na_chunks: Combine chunks of Series.
+    
+    Examples
+    --------
+    >>> a = np.memmap('a.bin', dtype='float64', mode='r')
+    >>> merge_non_na_files([a, ('b.parquet', 'price')], 'merged.parquet')
+    """
+    if remaining_na not in ('raise', 'warn', 'ignore'):
+        raise ValueError(f"Expected value for kwarg 'remaining_na' to be one of "
+                         f"['raise', 'warn', 'ignore'], got {remaining_na} instead.")
+    n, dtypes, chunks = _chunks(sources, block_size)
+    
+    # keep the type of the sources, even if a block contains NA values
+    dtype = dtypes[0] if all(dtype == dtypes[0] for dtype in dtypes[1:]) else _common_type(dtypes)
+    
+    _write(merge_non_na_chunks(chunks, remaining_na), out, n, name, dtype)
+    
\ No newline at end of file
@@ -0,0 +1,132 @@
+import hashlib
+import weakref
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_SIZE = 64
+"""Number of evenly spaced elements checked to detect modified data."""
+
+class Fingerprint (NamedTuple):
+    """
+    Content hash of a Series.
+    """
+    dtype: np.dtype
+    """Dtype the Series is compared in."""
+    has_na: bool
+    """Whether the Series contains NA values."""
+    na_digest: bytes
+    """Hash of the positions of NA values."""
+    value_digest: Optional[bytes]
+    """Hash of the non-NA values or None, if the dtype cannot be hashed such
+    that equal values always have equal hashes (e.g. objects)."""
+
+class _Entry (NamedTuple):
+    """
+    Cached fingerprint along with what is needed to validate it.
+    """
+    series: weakref.ref
+    values: weakref.ref
+    sample: bytes
+    fingerprint: Fingerprint
+
+_cache: dict[int, _Entry] = {}
+
+def clear_fingerprints () -> None:
+    """
+    Drop all cached fingerprints.
+    
+    Fingerprints used by ``equals_multiple(..., fingerprint=True)`` are
+    only cached for Series backed by read-only arrays, and invalidated
+    automatically, when the data of a Series is replaced or one of a sample
+    of its elements changes. Call this function after modifying the memory
+    of such an array in other ways, e.g. through a writeable view of it.
+    
+    See Also
+    --------
+    equals_multiple: Test whether multiple Series contain the same elements.
+    """
+    _cache.clear()
+
+def _digest (data) -> bytes:
+    """
+    Hash the bytes of an array.
+    """
+    return hashlib.blake2b(np.ascontiguousarray(data).data, digest_size=16).digest()
+
+def _sample (s: pd.Series) -> bytes:
+    """
+    Hash a small, evenly spaced sample of the elements of ``s``.
+    """
+    positions = np.unique(np.linspace(0, len(s) - 1, SAMPLE_SIZE).astype(np.intp)) if len(s) > 0 else []
+    sample = s.iloc[positions]
+    return _digest(pd.util.hash_pandas_object(sample, index=False).to_numpy())
+
+def _compute (s: pd.Series, dtype: np.dtype) -> Fingerprint:
+    """
+    Hash the NA pattern and the values of ``s`` in a single pass each.
+    
+    Values are canonicalized first, so that equal values always have the
+    same bytes: NA positions are zeroed and -0.0 is replaced by 0.0.
+    """
+    mask = s.isna().to_numpy()
+    value_digest = None
+    if dtype.kind in 'biufmM':
+        if isinstance(s.dtype, np.dtype):
+            values = s.to_numpy().copy()
+        else:
+            values = s.array.to_numpy(dtype=dtype, na_value=0)
+        if dtype.kind in 'mM':
+            values = values.view('i8')
+        values[mask] = 0
+        if dtype.kind == 'f':
+            # -0.0 and 0.0 are equal, but differ in their bits
+            values += 0.0
+        value_digest = _digest(values)
+    return Fingerprint(dtype, bool(mask.any()), _digest(np.packbits(mask)), value_digest)
+
+def fingerprint (s: pd.Series, dtype: np.dtype) -> Fingerprint:
+    """
+    Return the fingerprint of ``s``, if possible from the cache.
+    
+    Fingerprints are only cached for Series backed by a read-only ndarray,
+    since writes to any other Series, e.g. ``s[i] = v``, cannot be detected
+    reliably. Entries only hold weak references to the Series, so they are
+    dropped along with it. An entry is recomputed, if the array backing the
+    Series has been replaced or a sample of its elements has changed since.
+    """
+    values = s.to_numpy() if isinstance(s.dtype, np.dtype) else s.array
+    if not isinstance(values, np.ndarray) or values.flags.writeable:
+        return _compute(s, dtype)
+    
+    key = id(s)
+    entry = _cache.get(key)
+    sample = _sample(s)
+    if entry is not None and entry.series() is s and entry.values() is values and entry.sample == sample:
+        return entry.fingerprint
+    
+    result = _compute(s, dtype)
+    _cache[key] = _Entry(weakref.ref(s, lambda _: _cache.pop(key, None)), weakref.ref(values), sample, result)
+    return result
+
+def mismatch (series: list[pd.Series], dtypes: list[np.dtype], na: str) -> bool:
+    """
+    Check whether the fingerprints of ``series`` prove, that they are not
+    all equal under ``na``.
+    
+    Equal fingerprints prove nothing, since they may stem from a hash
+    collision. Callers have to compare the Series in that case.
+    """
+    prints = [fingerprint(s, dtype) for s, dtype in zip(series, dtypes)]
+    has_na = any(p.has_na for p in prints)
+    if na == 'none' and has_na:
+        return True
+    if na == 'any' and has_na:
+        # NA values may hide arbitrary differences
+        return False
+    if any(p.na_digest != prints[0].na_digest for p in prints[1:]):
+        return True
+    if len(set(dtypes)) > 1 or prints[0].value_digest is None:
+        return False
+    return any(p.value_digest != prints[0].value_digest for p in prints[1:])
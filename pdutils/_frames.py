@@ -0,0 +1,284 @@
+from typing import Optional, Union
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from . import _coerce
+from ._align import align
+from ._blocks import map_blocks
+from ._eq import _check_na, _eq_kernel
+from ._merge import merge_non_na
+
+def _validate_frames (frames: list[pd.DataFrame]) -> pd.Index:
+    """
+    Validate a list of DataFrames and return the union of their columns in
+    order of first appearance.
+    """
+    if not isinstance(frames, list):
+        raise TypeError(f"Expected a list of DataFrames, got {type(frames)} instead.")
+    if len(frames) == 0:
+        raise ValueError("List of DataFrames may not be empty.")
+    for df in frames:
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(f"Element must be DataFrame, got {type(df)} instead.")
+        if not df.columns.is_unique:
+            raise ValueError("Column labels of all DataFrames must be unique.")
+    return frames[0].columns.append([df.columns for df in frames[1:]]).unique()
+
+def eq_frames (frames: list[pd.DataFrame],
+               na: Optional[str] = 'any',
+               summary: Optional[str] = None,
+               n_jobs: Optional[int] = None
+               ) -> pd.DataFrame:
+    """
+    Compare multiple DataFrames elementwise.
+    
+    Equivalent to calling eq_multiple() on each column of the given frames,
+    but columns are aligned only once and all columns of the same dtype
+    are compared together in a single pass over blocks of rows.
+    
+    Columns are aligned by their labels, rows by their position. Columns
+    missing in some of the frames are treated as consisting of NA values
+    only.
+    
+    Parameters
+    ----------
+    frames : list of pd.DataFrame
+        DataFrames to compare with each other. All frames must have the
+        same number of rows and unique column labels.
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled during the comparison.
+        See eq_multiple() for details.
+    
+    summary : {None, 'columns', 'rows'}, default None
+        Reduce the elementwise results:
+        - ``None``: Return the elementwise results as DataFrame.
+        - ``columns``: Return whether all rows are equal for each column.
+        - ``rows``: Return whether all columns are equal for each row.
+    
+    n_jobs : int, optional
+        Number of threads to compare blocks of rows on. Use -1 for all
+        available CPUs. Small inputs are always compared on a single thread.
+    
+    Returns
+    -------
+    pd.DataFrame or pd.Series
+        Elementwise results of the comparison, carrying the index of the
+        first frame and the union of all columns. Reduced to a Series if
+        ``summary`` is given.
+    
+    Raises
+    ------
+    ValueError
+        If ``frames`` is empty.
+        If frames have different lengths or duplicate column labels.
+        If value for ``na`` or ``summary`` is not recognized.
+    TypeError
+        If ``frames`` is not a list of DataFrames.
+    
+    See Also
+    --------
+    eq_multiple: Compare multiple Series elementwise.
+    
+    Examples
+    --------
+    >>> df1 = pd.DataFrame({'A': [1.0, 2.0], 'B': ['x', 'y']})
+    >>> df2 = pd.DataFrame({'A': [1.0, np.nan], 'B': ['x', 'z']})
+    >>> eq_frames([df1, df2])
+          A      B
+    0  True   True
+    1  True  False
+    
+    >>> eq_frames([df1, df2], summary='columns')
+    A     True
+    B    False
+    dtype: bool
+    
+    >>> eq_frames([df1, df2], na='none', summary='rows')
+    0     True
+    1    False
+    dtype: bool
+    """
+    columns = _validate_frames(frames)
+    
+    n = len(frames[0])
+    if any(len(df) != n for df in frames[1:]):
+        raise ValueError("Lengths of all DataFrames must be equal.")
+    _check_na(na)
+    if summary not in (None, 'columns', 'rows'):
+        raise ValueError(f"Expected value for kwarg 'summary' to be one of "
+                         f"[None, 'columns', 'rows'], got {summary} instead.")
+    
+    k = len(frames)
+    check = np.ones((len(columns), n), dtype=bool)
+    
+    # group columns by the dtype they are compared in
+    groups = {}
+    for i, column in enumerate(columns):
+        dtypes = [_coerce.compare_dtype(df[column].dtype) for df in frames if column in df.columns]
+        groups.setdefault(_coerce.common_dtype(dtypes), []).append(i)
+    
+    for dtype, positions in groups.items() if k > 1 else []:
+        # frame-major order, so that the stacked rows reshape to (k, m * rows)
+        arrays = [_coerce.values(df[columns[i]]) if columns[i] in df.columns else None
+                  for df in frames for i in positions]
+        
+        def compare_block (start, stop, arrays=arrays, dtype=dtype, positions=positions):
+            values, mask = _coerce.stack_rows(arrays, dtype, start, stop)
+            block = _eq_kernel(values.reshape(k, -1), mask.reshape(k, -1), na)
+            check[positions, start:stop] = block.reshape(len(positions), -1)
+        
+        for _ in map_blocks(compare_block, n, None if dtype == object else n_jobs):
+            pass
+    
+    if summary == 'columns':
+        return pd.Series(check.all(axis=1), index=columns)
+    elif summary == 'rows':
+        return pd.Series(check.all(axis=0), index=frames[0].index)
+    return pd.DataFrame(check.T, index=frames[0].index, columns=columns)
+
+def _fill_block (frames: list[pd.DataFrame],
+                 labels: list,
+                 dtype: np.dtype,
+                 n: int,
+                 indexers: Optional[list[np.ndarray]]
+                 ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Coalesce the given columns of all frames into a single (m, n) block of
+    ``dtype``, taking the first non-NA value of each cell.
+    
+    The block is filled frame by frame, and each frame only writes to the
+    cells that are still NA, so every frame is read once for all columns.
+    Returns the block along with the mask of the cells that remain NA.
+    """
+    result = np.empty((len(labels), n), dtype=dtype)
+    mask = np.ones((len(labels), n), dtype=bool)
+    for j, df in enumerate(frames):
+        arrays = [_coerce.values(df[label]) if label in df.columns else None for label in labels]
+        if all(array is None for array in arrays):
+            continue
+        values, missing = _coerce.stack_rows(arrays, dtype, 0, len(df))
+        if indexers is None:
+            np.copyto(result, values, where=mask & ~missing)
+            mask &= missing
+        else:
+            rows = indexers[j]
+            i, r = np.nonzero(mask[:, rows] & ~missing)
+            result[i, rows[r]] = values[i, r]
+            mask[i, rows[r]] = False
+    return result, mask
+
+def merge_non_na_frames (frames: list[pd.DataFrame],
+                         remaining_na: Optional[str] = 'raise',
+                         return_remaining: bool = False
+                         ) -> Union[pd.DataFrame, tuple[pd.DataFrame, pd.Index]]:
+    """
+    Combine multiple DataFrames by taking the first non-NA value of each cell.
+    
+    Equivalent to calling merge_non_na() on each column of the given frames,
+    but rows and columns are aligned only once, and all columns that are
+    merged in the same dtype are coalesced together as a single block.
+    
+    Columns are aligned by their labels, rows by their index like in
+    merge_non_na(). Columns missing in some of the frames are treated as
+    consisting of NA values only.
+    
+    Parameters
+    ----------
+    frames : list of pd.DataFrame
+        DataFrames to merge, in order of priority. All frames must have
+        unique column labels.
+    
+    remaining_na : {'raise', 'warn', 'ignore'}, default 'raise
+        What to do, when NA values remain in any column after merging.
+        See merge_non_na() for details.
+    
+    return_remaining : bool, default False
+        Also return the labels of the columns that still contain NA values.
+    
+    Returns
+    -------
+    pd.DataFrame
+        Merged values, carrying the union of all indexes and columns.
+        Each column is of the dtype merge_non_na() would return for it.
+    pd.Index
+        Columns that still contain NA values, if ``return_remaining`` is
+        True.
+    
+    Raises
+    ------
+    ValueError
+        If ``frames`` is empty.
+        If frames have duplicate column labels.
+        If indexes differ and contain duplicate or NA labels.
+        If NA values remain and ``remaining_na`` is ``raise``.
+        If value for ``remaining_na`` is not recognized.
+    TypeError
+        If ``frames`` is not a list of DataFrames.
+    
+    See Also
+    --------
+    merge_non_na: Combine multiple Series.
+    eq_frames: Compare multiple DataFrames elementwise.
+    
+    Examples
+    --------
+    >>> df1 = pd.DataFrame({'A': [1.0, np.nan], 'B': ['x', None]})
+    >>> df2 = pd.DataFrame({'A': [3.0, 4.0], 'C': [5, 6]}, index=[1, 2])
+    >>> merge_non_na_frames([df1, df2], remaining_na='ignore')
+         A    B     C
+    0  1.0    x  <NA>
+    1  3.0  NaN     5
+    2  4.0  NaN     6
+    
+    >>> merge_non_na_frames([df1, df2], remaining_na='ignore', return_remaining=True)[1]
+    Index(['B', 'C'], dtype='object')
+    """
+    columns = _validate_frames(frames)
+    if remaining_na not in ('raise', 'warn', 'ignore'):
+        raise ValueError(f"Expected value for kwarg 'remaining_na' to be one of "
+                         f"['raise', 'warn', 'ignore'], got {remaining_na} instead.")
+    
+    index, indexers = align(frames)
+    n = len(index)
+    merged = [None] * len(columns)
+    remaining = np.zeros(len(columns), dtype=bool)
+    
+    # group columns by the dtype they are merged in
+    groups = {}
+    for i, label in enumerate(columns):
+        dtypes = [df[label].dtype for df in frames if label in df.columns]
+        dtype = _coerce.merge_dtype(dtypes, indexers is not None)
+        if isinstance(dtype, np.dtype) or (dtype is not None and _coerce._is_masked(dtype)):
+            groups.setdefault(dtype, []).append(i)
+            continue
+        # other extension dtypes are merged column by column
+        result = merge_non_na([df[label] for df in frames if label in df.columns], remaining_na='ignore')
+        merged[i] = result.reindex(index) if indexers is not None else result.array
+        remaining[i] = merged[i].isna().any()
+    
+    for dtype, positions in groups.items():
+        block, mask = _fill_block(frames, [columns[i] for i in positions], _coerce.compare_dtype(dtype), n, indexers)
+        remaining[positions] = mask.any(axis=1)
+        for row, i in enumerate(positions):
+            if isinstance(dtype, np.dtype):
+                if remaining[i]:
+                    block[row, mask[row]] = np.datetime64('NaT') if dtype.kind in 'mM' else np.nan
+                merged[i] = block[row]
+            else:
+                merged[i] = dtype.construct_array_type()(block[row], mask[row])
+    
+    result = pd.DataFrame({i: array for i, array in enumerate(merged)}, index=index)
+    result.columns = columns
+    
+    remaining = columns[remaining]
+    if len(remaining) > 0 and remaining_na != 'ignore':
+        message = f"NA values still remain in columns {list(remaining)} after merging."
+        if remaining_na == 'raise':
+            raise ValueError(message)
+        warnings.warn(message)
+    if return_remaining:
+        return result, remaining
+    return result
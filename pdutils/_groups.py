@@ -0,0 +1,285 @@
+from typing import Union, Optional, Hashable
+
+import numpy as np
+import pandas as pd
+
+from . import _categorical, _coerce
+from ._eq import _check_na
+from ._merge import _check_remaining
+
+Keys = Union[Hashable, list, pd.Series, pd.Index, np.ndarray]
+
+def _factorize (data: Union[pd.Series, pd.DataFrame],
+                by: Keys,
+                sort: bool
+                ) -> tuple[list[pd.Series], np.ndarray, pd.Index]:
+    """
+    Validate the arguments of the group-wise functions and factorize the
+    keys once.
+    
+    Returns the Series to reduce, the group code of each row, which is -1
+    for rows with NA keys, and the keys of the groups.
+    """
+    if isinstance(data, pd.Series):
+        series = [data]
+    elif isinstance(data, pd.DataFrame):
+        series = None
+    else:
+        raise TypeError(f"Expected a Series or a DataFrame, got {type(data)} instead.")
+    
+    if isinstance(by, (pd.Series, pd.Index, np.ndarray)):
+        keys = by
+    elif isinstance(data, pd.DataFrame) and isinstance(by, list) and len(by) > 0 \
+            and all(label in data.columns for label in by):
+        keys = [data[label] for label in by] if len(by) > 1 else data[by[0]]
+        data = data.drop(columns=by)
+    elif isinstance(by, list):
+        keys = np.asarray(by)
+    elif isinstance(data, pd.DataFrame) and by in data.columns:
+        keys = data[by]
+        data = data.drop(columns=by)
+    else:
+        raise KeyError(f"Expected keys or column labels for kwarg 'by', got {by} instead.")
+    if len(keys[0] if isinstance(keys, list) else keys) != len(data):
+        raise ValueError("Length of keys must match the length of the data.")
+    
+    if series is None:
+        series = _coerce.series_list(data)
+    if isinstance(keys, list):
+        codes, uniques = _factorize_columns(keys, sort)
+        return series, codes, uniques
+    codes, uniques = pd.factorize(keys, sort=sort)
+    return series, codes, pd.Index(uniques, name=getattr(keys, 'name', None))
+
+def _factorize_columns (keys: list[pd.Series], sort: bool) -> tuple[np.ndarray, pd.MultiIndex]:
+    """
+    Factorize several columns of keys into a single group code per row.
+    
+    Each column is factorized on its own and the codes are combined into
+    a flat position in the product of all levels, which is factorized once
+    more. Rows with NA in any column are coded as -1.
+    """
+    codes, levels = zip(*[pd.factorize(key, sort=sort) for key in keys])
+    na = np.logical_or.reduce([c < 0 for c in codes])
+    shape = tuple(len(level) for level in levels)
+    flat = np.ravel_multi_index([np.maximum(c, 0) for c in codes], shape)
+    
+    combined = np.full(len(flat), -1)
+    combined[~na], uniques = pd.factorize(flat[~na], sort=sort)
+    index = pd.MultiIndex(levels=levels, codes=np.unravel_index(uniques, shape), names=[key.name for key in keys])
+    return combined, index
+
+def _comparable (s: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the values of a Series in the dtype they are compared in, along
+    with their NA mask. Categorical Series are represented by their codes.
+    """
+    if _categorical.supports([s.dtype]):
+        codes = _categorical.codes(s)
+        return codes, codes == -1
+    values, mask = _coerce.stack_rows([_coerce.values(s)], _coerce.compare_dtype(s.dtype), 0, len(s))
+    return values[0], mask[0]
+
+def _eq_segments (s: pd.Series, codes: np.ndarray, n_groups: int, na: str) -> np.ndarray:
+    """
+    Check whether all values of each group are equal in O(n).
+    
+    Each non-NA value is compared to a single non-NA value of its group,
+    which is equivalent to comparing all pairs since equality is transitive.
+    Mismatches and NA values are then counted per group.
+    """
+    values, mask = _comparable(s)
+    keyed = codes >= 0
+    valid = np.flatnonzero(keyed & ~mask)
+    ref = np.empty(n_groups, dtype=np.intp)
+    # any non-NA row of a group can serve as its reference
+    ref[codes[valid]] = valid
+    
+    # never pass NA to __eq__, as pd.NA is not convertible to bool
+    differ = values[valid] != values[ref[codes[valid]]]
+    check = np.bincount(codes[valid][differ], minlength=n_groups) == 0
+    if na == 'any':
+        return check
+    n_na = np.bincount(codes[keyed & mask], minlength=n_groups)
+    sizes = np.bincount(codes[keyed], minlength=n_groups)
+    check &= n_na == 0
+    if na == 'all':
+        check |= n_na == sizes
+    # a single row is always equal, like a single Series in eq_multiple()
+    check |= sizes == 1
+    return check
+
+def _first_valid_segments (s: pd.Series, codes: np.ndarray, n_groups: int) -> tuple[pd.Series, bool]:
+    """
+    Pick the first non-NA value of each group in a single gather.
+    
+    The position of the first non-NA row of each group is found by an
+    unbuffered minimum over the positions of all non-NA rows, which is
+    O(n) and hence cheaper than sorting the rows by their group. Returns
+    the values of the groups and whether NA values remain in them.
+    """
+    n = len(s)
+    valid = np.flatnonzero((codes >= 0) & ~s.isna().to_numpy())
+    rows = np.full(n_groups, n)
+    np.minimum.at(rows, codes[valid], valid)
+    rows[rows == n] = -1
+    result = pd.api.extensions.take(_coerce.values(s), rows, allow_fill=True)
+    return result, (rows < 0).any()
+
+def _frame (columns: list, series: list[pd.Series], keys: pd.Index) -> pd.DataFrame:
+    """
+    Combine the results of several columns into a DataFrame indexed by the
+    keys of the groups, keeping duplicate column labels.
+    """
+    frame = pd.DataFrame(dict(enumerate(columns)), index=keys)
+    frame.columns = pd.Index([s.name for s in series])
+    return frame
+
+def eq_groups (data: Union[pd.Series, pd.DataFrame],
+               by: Keys,
+               na: Optional[str] = 'any',
+               sort: bool = True
+               ) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Check whether all values within each group are equal.
+    
+    Group-wise variant of eq_multiple(), with the rows of each group taking
+    the place of the Series to compare, e.g. to verify that duplicated
+    rows of a key agree before dropping them. Equivalent to applying
+    eq_multiple() to the values of each group, but the keys are factorized
+    only once and all groups are checked by a few vectorized passes over
+    all rows, instead of one call per group.
+    
+    Parameters
+    ----------
+    data : pd.Series or pd.DataFrame
+        Values to compare. Each column of a DataFrame is checked on its own.
+    
+    by : array-like, column label or list of column labels
+        Keys to group the rows by, either of the same length as ``data``
+        or the labels of columns of ``data``, which are not compared then.
+        Rows with NA keys are dropped, like in pd.DataFrame.groupby().
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled within each group.
+        See eq_multiple() for details.
+    
+    sort : bool, default True
+        Sort the groups by their keys. Otherwise, groups appear in the
+        order of their first row.
+    
+    Returns
+    -------
+    pd.Series or pd.DataFrame
+        Result of the comparison for each group, indexed by the keys of
+        the groups. A DataFrame with one column per column of ``data``, if
+        ``data`` is a DataFrame.
+    
+    Raises
+    ------
+    ValueError
+        If the keys do not match the length of ``data``.
+        If value for ``na`` is not recognized.
+    KeyError
+        If ``by`` is neither array-like nor a column of ``data``.
+    TypeError
+        If ``data`` is neither a Series nor a DataFrame.
+    
+    See Also
+    --------
+    eq_multiple: Compare multiple Series elementwise.
+    merge_non_na_groups: Pick the first non-NA value of each group.
+    
+    Examples
+    --------
+    >>> df = pd.DataFrame({'key': ['a', 'a', 'b', 'b'], 'value': [1.0, np.nan, 2.0, 3.0]})
+    >>> eq_groups(df, by='key')
+         value
+    key
+    a     True
+    b    False
+    
+    >>> eq_groups(df['value'], by=df['key'], na='none')
+    key
+    a    False
+    b    False
+    Name: value, dtype: bool
+    """
+    _check_na(na)
+    series, codes, keys = _factorize(data, by, sort)
+    checks = [_eq_segments(s, codes, len(keys), na) for s in series]
+    if isinstance(data, pd.Series):
+        return pd.Series(checks[0], index=keys, name=data.name)
+    return _frame(checks, series, keys)
+
+def merge_non_na_groups (data: Union[pd.Series, pd.DataFrame],
+                         by: Keys,
+                         remaining_na: Optional[str] = 'raise',
+                         sort: bool = True
+                         ) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Pick the first non-NA value within each group.
+    
+    Group-wise variant of merge_non_na(), with the rows of each group taking
+    the place of the Series to merge, e.g. to coalesce duplicated rows of a
+    key into a single one. The keys are factorized only once, and the
+    first non-NA value of each group is then found by a single pass over
+    each column, instead of one call per group.
+    
+    Parameters
+    ----------
+    data : pd.Series or pd.DataFrame
+        Values to merge. Each column of a DataFrame is merged on its own.
+    
+    by : array-like, column label or list of column labels
+        Keys to group the rows by, see eq_groups().
+    
+    remaining_na : {'raise', 'warn', 'ignore'}, default 'raise
+        What to do, when a group consists of NA values only.
+        See merge_non_na() for details.
+    
+    sort : bool, default True
+        Sort the groups by their keys. Otherwise, groups appear in the
+        order of their first row.
+    
+    Returns
+    -------
+    pd.Series or pd.DataFrame
+        Merged values of each group, indexed by the keys of the groups.
+        Columns keep their dtype, unless NA values remain in columns that
+        cannot hold them.
+    
+    Raises
+    ------
+    ValueError
+        If the keys do not match the length of ``data``.
+        If NA values remain and ``remaining_na`` is ``raise``.
+        If value for ``remaining_na`` is not recognized.
+    KeyError
+        If ``by`` is neither array-like nor a column of ``data``.
+    TypeError
+        If ``data`` is neither a Series nor a DataFrame.
+    
+    See Also
+    --------
+    merge_non_na: Combine multiple Series.
+    eq_groups: Check whether all values within each group are equal.
+    
+    Examples
+    --------
+    >>> df = pd.DataFrame({'key': ['a', 'a', 'b'], 'x': [np.nan, 1.0, 2.0], 'y': ['u', 'v', None]})
+    >>> merge_non_na_groups(df, by='key', remaining_na='ignore')
+           x     y
+    key
+    a    1.0    u
+    b    2.0  NaN
+    """
+    if remaining_na not in ('raise', 'warn', 'ignore'):
+        raise ValueError(f"Expected value for kwarg 'remaining_na' to be one of "
+                         f"['raise', 'warn', 'ignore'], got {remaining_na} instead.")
+    series, codes, keys = _factorize(data, by, sort)
+    results = [_first_valid_segments(s, codes, len(keys)) for s in series]
+    _check_remaining(any(remaining for _, remaining in results), remaining_na)
+    if isinstance(data, pd.Series):
+        return pd.Series(results[0][0], index=keys, name=data.name)
+    return _frame([result for result, _ in results], series, keys)
@@ -0,0 +1,186 @@
+import functools
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+class CallReport (NamedTuple):
+    """
+    Details of a single instrumented call.
+    """
+    function: str
+    """Name of the function called."""
+    path: Optional[str]
+    """Fast path taken, e.g. ``'numpy'``, ``'arrow'`` or ``'aligned'``."""
+    timings: dict[str, float]
+    """Seconds spent in each phase of the call, in order of the phases."""
+    shapes: list[tuple[int, ...]]
+    """Shapes of the inputs."""
+    dtypes: list
+    """Dtypes of the inputs, or type names of inputs without a dtype."""
+    iterations: int
+    """Number of loop passes, i.e. blocks of rows processed or
+    pd.Series.where() calls made."""
+    allocated: Optional[int]
+    """Peak number of bytes allocated during the call, as traced by
+    tracemalloc, or None if memory was not traced."""
+    total: float
+    """Seconds spent in the call."""
+
+class _Recorder:
+    """
+    Collects the details of a call, while it is running.
+    """
+    
+    def __init__ (self, function: str):
+        self.function = function
+        self.path = None
+        self.timings = {}
+        self.iterations = 0
+        self.start = self.last = time.perf_counter()
+    
+    def mark (self, phase: str) -> None:
+        now = time.perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self.last
+        self.last = now
+
+_listeners: list[tuple[Callable[[CallReport], None], bool]] = []
+_local = threading.local()
+
+def _recorder () -> Optional[_Recorder]:
+    """
+    Return the recorder of the instrumented call running in this thread.
+    """
+    return getattr(_local, 'recorder', None)
+
+def mark (phase: str) -> None:
+    """
+    End the current phase of an instrumented call. Time since the previous
+    mark is attributed to ``phase``. Does nothing, if not instrumented.
+    """
+    recorder = _recorder()
+    if recorder is not None:
+        recorder.mark(phase)
+
+def path (name: str) -> None:
+    """
+    Record the fast path taken by an instrumented call.
+    """
+    recorder = _recorder()
+    if recorder is not None:
+        recorder.path = name
+
+def iterate (n: int = 1) -> None:
+    """
+    Count ``n`` loop passes of an instrumented call.
+    """
+    recorder = _recorder()
+    if recorder is not None:
+        recorder.iterations += n
+
+def _describe (data) -> tuple[list[tuple[int, ...]], list]:
+    """
+    Return the shapes and dtypes of the inputs of a call.
+    """
+    if isinstance(data, pd.DataFrame) or (hasattr(data, 'shape') and hasattr(data, 'dtypes')):
+        # DataFrames of other libraries, e.g. Polars, are described the same way
+        return [data.shape], list(data.dtypes)
+    if not isinstance(data, list):
+        return [np.shape(data)], [getattr(data, 'dtype', type(data).__name__)]
+    shapes = [getattr(elem, 'shape', (len(elem),)) for elem in data]
+    return shapes, [getattr(elem, 'dtype', type(elem).__name__) for elem in data]
+
+def instrumented (func):
+    """
+    Report calls of ``func`` to the listeners registered by instrument().
+    
+    Without listeners, ``func`` is called directly. Calls made from within
+    an instrumented call are attributed to the outer one.
+    """
+    @functools.wraps(func)
+    def wrapper (*args, **kwargs):
+        if not _listeners or _recorder() is not None:
+            return func(*args, **kwargs)
+        
+        shapes, dtypes = _describe(args[0] if args else next(iter(kwargs.values()), None))
+        memory = any(trace for _, trace in _listeners)
+        started = memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        if memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        
+        recorder = _local.recorder = _Recorder(func.__name__)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.recorder = None
+            recorder.mark('result')
+            allocated = tracemalloc.get_traced_memory()[1] - baseline if memory else None
+            if started:
+                tracemalloc.stop()
+            report = CallReport(recorder.function, recorder.path, recorder.timings, shapes, dtypes,
+                                recorder.iterations, allocated, recorder.last - recorder.start)
+            for callback, _ in list(_listeners):
+                callback(report)
+    
+    return wrapper
+
+@contextmanager
+def instrument (callback: Optional[Callable[[CallReport], None]] = None,
+                memory: bool = True
+                ) -> Iterator[list[CallReport]]:
+    """
+    Collect reports on calls of eq_multiple(), equals_multiple() and
+    merge_non_na() made within the context.
+    
+    Each report holds the time spent in each phase of a call (e.g.
+    ``coerce`` for converting the inputs, ``align`` for aligning their
+    indexes, ``compare`` or ``fill`` for the main loop and ``result`` for
+    building the result), the shapes and dtypes of the inputs, the number
+    of loop passes, the fast path taken and the peak number of bytes
+    allocated. Instrumentation is opt-in, calls made outside of the context
+    are not affected.
+    
+    Parameters
+    ----------
+    callback : callable, optional
+        Function called with the CallReport of each call, as soon as it
+        returns or raises. Calls made in other threads, e.g. by a
+        scheduler, are reported as well.
+    
+    memory : bool, default True
+        Trace allocations with tracemalloc to report the peak number of
+        bytes allocated. This slows down calls noticeably, so disable it to
+        measure timings.
+    
+    Yields
+    ------
+    list of CallReport
+        Reports of all calls made so far, appended as calls return.
+    
+    Examples
+    --------
+    >>> with instrument(memory=False) as reports:
+    ...     merge_non_na([s1, s2, s3])
+    >>> reports[0].path, reports[0].timings
+    ('aligned', {'coerce': 1.2e-05, 'align': 3.1e-06, 'fill': 4.3e-05, 'result': 1.1e-06})
+    """
+    reports = []
+    
+    def collect (report: CallReport) -> None:
+        reports.append(report)
+        if callback is not None:
+            callback(report)
+    
+    listener = (collect, memory)
+    _listeners.append(listener)
+    try:
+        yield reports
+    finally:
+        _listeners.remove(listener)
@@ -4,9 +4,346 @@ from typing import Union, Optional
 import numpy as np
 import pandas as pd
 
+from . import _arrow, _categorical, _coerce, _instrument, _numba, _polars
+from ._align import align
+from ._blocks import map_blocks
+
+def _first_valid (data: pd.DataFrame,
+                  n_jobs: Optional[int] = None,
+                  target: Optional[np.ndarray] = None
+                  ) -> tuple[pd.Series, bool]:
+    """
+    Pick the first non-NA value of each row in a single gather.
+    
+    All columns of ``data`` must share the same dtype. Rows consisting of NA
+    values only are taken from the first column. Returns the result and
+    whether NA values remain in it. The result is gathered into ``target``
+    directly, if it is of the same dtype.
+    """
+    n, k = data.shape
+    column = data.iloc[:,0]
+    if isinstance(column.dtype, np.dtype):
+        _instrument.path('gather')
+        values = data.to_numpy()
+        result = target if _fits(target, values.dtype) else np.empty(n, dtype=values.dtype)
+        
+        def gather (start, stop):
+            block = values[start:stop]
+            mask = pd.isna(block)
+            result[start:stop] = block[np.arange(stop - start), np.argmax(~mask, axis=1)]
+            return mask.all(axis=1).any()
+        
+        if values.dtype == object:
+            n_jobs = None
+        remaining = any(list(map_blocks(gather, n, n_jobs)))
+    elif _arrow.is_arrow(column.dtype):
+        _instrument.path('arrow')
+        merged = _arrow.coalesce([_arrow.chunked(data.iloc[:,i]) for i in range(k)])
+        result = _arrow.wrap(merged, column)
+        remaining = merged.null_count > 0
+    else:
+        _instrument.path('gather')
+        mask = data.isna().to_numpy()
+        flat = pd.concat([data.iloc[:,i] for i in range(k)], ignore_index=True)
+        result = flat.array.take(np.argmax(~mask, axis=1) * n + np.arange(n))
+        remaining = mask.all(axis=1).any()
+    return pd.Series(result, index=data.index, name=column.name), remaining
+
+def _first_valid_numba (columns: list[np.ndarray],
+                        n_jobs: Optional[int] = None,
+                        target: Optional[np.ndarray] = None
+                        ) -> tuple[np.ndarray, bool]:
+    """
+    Pick the first non-NA value of each row with a compiled kernel.
+    
+    Returns the result and whether NA values remain in it. The result is
+    written into ``target`` directly, if it is of the same dtype.
+    """
+    dtype = np.result_type(*columns)
+    na_kind = _numba.na_kind(dtype)
+    n = len(columns[0])
+    result = target if _fits(target, dtype) else np.empty(n, dtype=dtype)
+    out = _numba.as_kernel_input(result, dtype)
+    
+    def gather (start, stop):
+        filled = np.zeros(stop - start, dtype=bool)
+        n_filled = 0
+        for column in columns:
+            values = _numba.as_kernel_input(column[start:stop], dtype)
+            n_filled += _numba.first_valid_update(values, na_kind, out[start:stop], filled)
+            if n_filled == stop - start:
+                break
+        else:
+            # rows consisting of NA values only are taken from the first column
+            out[start:stop][~filled] = _numba.as_kernel_input(columns[0][start:stop], dtype)[~filled]
+        return n_filled < stop - start
+    
+    remaining = any(list(map_blocks(gather, n, n_jobs)))
+    return result, remaining
+
+def _fits (target, dtype) -> bool:
+    """
+    Check whether a result of ``dtype`` can be written into ``target``
+    directly, instead of being copied into it afterwards.
+    """
+    return target is not None and target.dtype == dtype
+
+def _first_valid_where (data: pd.DataFrame) -> tuple[pd.Series, bool]:
+    """
+    Fill NA values column by column using pd.Series.where().
+    
+    Used for columns of differing dtypes, where the dtype of the result is
+    determined by successively upcasting the first column. Returns the
+    result and whether NA values remain in it.
+    """
+    result = data.iloc[:,0]
+    na = result.isna()
+    for i in range(1, len(data.columns)):
+        if not na.any():
+            break
+        _instrument.iterate()
+        result = result.where(~na, data.iloc[:,i])
+        na = result.isna()
+    return result, na.any()
+
+def _order (strategy: Union[str, list, np.ndarray], k: int) -> Optional[np.ndarray]:
+    """
+    Validate ``strategy`` and translate it into the order in which ``k``
+    sources are visited. Returns None, if they are visited as given.
+    """
+    if isinstance(strategy, str):
+        if strategy not in ('first', 'last', 'majority'):
+            raise ValueError(f"Expected value for kwarg 'strategy' to be one of "
+                             f"['first', 'last', 'majority'] or a sequence of priorities, "
+                             f"got {strategy} instead.")
+        return np.arange(k)[::-1] if strategy == 'last' and k > 0 else None
+    priority = np.asarray(strategy)
+    if priority.shape != (k,) or priority.dtype.kind not in 'biuf':
+        raise ValueError(f"Expected one numeric priority per Series, got {strategy} instead.")
+    if k == 0:
+        return None
+    # higher priorities first, ties in the given order
+    return np.argsort(-priority.astype(float), kind='stable')
+
+def _first_choice (mask: np.ndarray) -> np.ndarray:
+    """
+    Return the position of the first non-NA Series of each row of a (k, n)
+    NA mask, or -1 for rows consisting of NA values only.
+    """
+    choice = np.argmax(~mask, axis=0)
+    choice[mask.all(axis=0)] = -1
+    return choice
+
+def _majority_choice (values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Return the position of the most frequent non-NA value of each row of a
+    (k, n) array, or -1 for rows consisting of NA values only.
+    
+    Occurrences are counted by comparing all pairs of columns, i.e. in
+    k*(k-1)/2 vectorized passes. Ties are resolved in favour of the value
+    found in the first column.
+    """
+    k, n = values.shape
+    valid = ~mask
+    if values.dtype == object:
+        # never pass NA to __eq__, as pd.NA is not convertible to bool
+        values = values.copy()
+        values[~valid] = None
+    counts = np.zeros((k, n), dtype=np.intp)
+    eq = np.empty(n, dtype=bool)
+    for j in range(k):
+        for l in range(j + 1, k):
+            np.equal(values[j], values[l], out=eq)
+            eq &= valid[j]
+            eq &= valid[l]
+            counts[j] += eq
+            counts[l] += eq
+    counts[~valid] = -1
+    choice = np.argmax(counts, axis=0)
+    choice[~valid.any(axis=0)] = -1
+    return choice
+
+def _take (data: pd.DataFrame, choice: np.ndarray) -> pd.Series:
+    """
+    Take the value of each row from the column at position ``choice`` in a
+    single gather. Rows with a negative choice are taken from the first
+    column. Columns of differing dtypes are combined using pd.Series.where(),
+    upcasting the first column like _first_valid_where().
+    """
+    n, k = data.shape
+    rows = np.arange(n)
+    columns = np.maximum(choice, 0)
+    dtypes = list(data.dtypes)
+    if _categorical.supports(dtypes):
+        unified = _categorical.unify([data.iloc[:,j] for j in range(k)])
+        codes = np.stack([_categorical.codes(s) for s in unified], axis=1)
+        result = pd.Categorical.from_codes(codes[rows, columns], dtype=unified[0].dtype)
+    elif len(set(dtypes)) == 1 and isinstance(dtypes[0], np.dtype):
+        result = data.to_numpy()[rows, columns]
+    elif len(set(dtypes)) == 1:
+        flat = pd.concat([data.iloc[:,j] for j in range(k)], ignore_index=True)
+        result = flat.array.take(columns * n + rows)
+    else:
+        result = data.iloc[:,0]
+        for j in range(1, k):
+            result = result.where(columns != j, data.iloc[:,j])
+        return result
+    return pd.Series(result, index=data.index, name=data.columns[0])
+
+def _first_valid_aligned (series: list[pd.Series],
+                          n_jobs: Optional[int] = None,
+                          engine: Optional[str] = None,
+                          out: Optional[Union[np.ndarray, pd.Series]] = None
+                          ) -> tuple[pd.Series, bool]:
+    """
+    Pick the first non-NA value for each label of several Series without
+    concatenating them.
+    
+    All Series must share the same dtype, which has to be able to hold NA
+    values if their indexes differ. Returns the result and whether NA values
+    remain in it. Series of equal indexes are merged in ``out`` directly,
+    if it is of the same dtype.
+    """
+    index, indexers = align(series)
+    name = series[0].name if series[0].name is not None else 0
+    target = None if out is None else _coerce.buffer(out, (len(index),))
+    _instrument.mark('align')
+    
+    if _arrow.supports([s.dtype for s in series]):
+        _instrument.path('arrow')
+        merged = _arrow.coalesce([_arrow.chunked(s) for s in series], indexers, len(index))
+        return pd.Series(_arrow.wrap(merged, series[0]), index=index, name=name), merged.null_count > 0
+    
+    if _categorical.supports([s.dtype for s in series]):
+        _instrument.path('categorical')
+        codes = _categorical.first_valid([_categorical.codes(s) for s in series], indexers, len(index))
+        result = pd.Categorical.from_codes(codes, dtype=series[0].dtype)
+        return pd.Series(result, index=index, name=name), (codes == -1).any()
+    
+    columns = [_coerce.values(s) for s in series]
+    
+    if indexers is None and engine == 'numba' and _numba.supports([s.dtype for s in series]):
+        _instrument.path('numba')
+        result, remaining = _first_valid_numba(columns, n_jobs, target)
+        return pd.Series(result, index=index, name=name), remaining
+    
+    if indexers is None:
+        _instrument.path('aligned')
+        if _fits(target, columns[0].dtype):
+            target[:] = columns[0]
+            result = target
+        else:
+            result = columns[0].copy()
+        
+        def fill (start, stop):
+            # only visit positions that are still NA
+            pending = start + np.flatnonzero(pd.isna(result[start:stop]))
+            for column in columns[1:]:
+                if len(pending) == 0:
+                    break
+                values = column[pending]
+                valid = ~pd.isna(values)
+                result[pending[valid]] = values[valid]
+                pending = pending[~valid]
+            return len(pending) > 0
+        
+        if not isinstance(result, np.ndarray) or result.dtype == object:
+            # extension arrays are not necessarily safe to write from threads
+            n_jobs = None
+        remaining = any(list(map_blocks(fill, len(result), n_jobs)))
+        return pd.Series(result, index=index, name=name), remaining
+    
+    _instrument.path('scattered')
+    result = pd.api.extensions.take(columns[0], np.full(len(index), -1), allow_fill=True)
+    filled = np.zeros(len(index), dtype=bool)
+    n_filled = 0
+    for column, indexer in zip(columns, indexers):
+        _instrument.iterate()
+        valid = ~pd.isna(column)
+        positions = indexer[valid]
+        new = ~filled[positions]
+        result[positions[new]] = column[valid][new]
+        filled[positions[new]] = True
+        n_filled += new.sum()
+        if n_filled == len(index):
+            break
+    return pd.Series(result, index=index, name=name), n_filled < len(index)
+
+def _into (out: Optional[Union[np.ndarray, pd.Series]], result: pd.Series) -> Union[pd.Series, np.ndarray]:
+    """
+    Copy ``result`` into ``out``, unless it was merged in it directly, and
+    return ``out``. Returns ``result``, if ``out`` is None.
+    """
+    if out is None:
+        return result
+    _coerce.write(_coerce.buffer(out, (len(result),)), result)
+    return out
+
+def _check_remaining (remaining: bool, remaining_na: str) -> None:
+    """
+    Apply the ``remaining_na`` policy of merge_non_na.
+    """
+    if not remaining:
+        return
+    if remaining_na == 'raise':
+        raise ValueError('NA values still remain in Series after merging.')
+    elif remaining_na == 'warn':
+        warnings.warn('NA values still remain in Series after merging.')
+    elif remaining_na != 'ignore':
+        raise ValueError(f"Expected value for kwarg 'remaining_na' to be one of "
+                         "['raise', 'warn', 'ignore'], got {remaining_na} instead.")
+
+def _resolve_dtype (series: list[pd.Series]):
+    """
+    Return the narrowest dtype Series can be merged in, see
+    _coerce.merge_dtype(), or None, if there is none.
+    """
+    first = series[0].index
+    nullable = False
+    if not all(s.index is first or s.index.equals(first) for s in series[1:]):
+        # aligning introduces NA values, unless all Series share their labels
+        nullable = not all(len(s) == len(first) and s.index.isin(first).all() for s in series[1:])
+    return _coerce.merge_dtype([s.dtype for s in series], nullable)
+
+def _resolve (series: list[pd.Series]) -> list[pd.Series]:
+    """
+    Convert Series to the narrowest dtype they can be merged in, so that
+    the fill never goes through float or object. Series already of that
+    dtype are not copied.
+    """
+    dtype = _resolve_dtype(series)
+    if dtype is None:
+        return series
+    return [s if s.dtype == dtype else s.astype(dtype) for s in series]
+
+def _can_align (series: list[pd.Series]) -> bool:
+    """
+    Check whether Series can be merged without building a DataFrame first.
+    """
+    dtype = series[0].dtype
+    if not all(s.dtype == dtype for s in series[1:]):
+        return False
+    first = series[0].index
+    if all(s.index is first or s.index.equals(first) for s in series[1:]):
+        return True
+    if isinstance(dtype, np.dtype) and dtype.kind not in 'fcmMO':
+        # reindexing would upcast, leave that to pd.concat()
+        return False
+    if isinstance(first, (pd.DatetimeIndex, pd.TimedeltaIndex, pd.PeriodIndex)):
+        # pd.concat() sorts some datetime-like unions
+        return False
+    # leave raising on duplicate labels to pd.concat()
+    return all(s.index.is_unique and not s.index.hasnans for s in series)
+
+@_instrument.instrumented
 def merge_non_na (data: Union[list[Union[pd.Series, np.ndarray, list, tuple, dict]], pd.DataFrame],
-                  remaining_na: Optional[str] = 'raise'
-                  ) -> pd.Series:
+                  remaining_na: Optional[str] = 'raise',
+                  n_jobs: Optional[int] = None,
+                  engine: Optional[str] = None,
+                  strategy: Union[str, list, np.ndarray] = 'first',
+                  return_source: bool = False,
+                  out: Optional[Union[np.ndarray, pd.Series]] = None
+                  ) -> Union[pd.Series, np.ndarray, tuple[Union[pd.Series, np.ndarray], np.ndarray]]:
     """
     Combine multiple Series by filling NA values with non-NA values from
     the others.
@@ -21,7 +358,9 @@ def merge_non_na (data: Union[list[Union[pd.Series, np.ndarray, list, tuple, dic
     Parameters
     ----------
     data : sequence of array-like or pd.DataFrame
-        Series to merge/choose values from.
+        Series to merge/choose values from. A list of Polars Series or a
+        Polars DataFrame is merged with Polars expressions on the
+        multithreaded engine of Polars instead, see Notes.
     
     remaining_na : {'raise', 'warn', 'ignore'}, default 'raise
         What to do, when NA values remain after merging:
@@ -30,13 +369,66 @@ def merge_non_na (data: Union[list[Union[pd.Series, np.ndarray, list, tuple, dic
             the remaining NA values.
         - ``ignore``: Return resulting Series with the remaining NA values.
     
+    n_jobs : int, optional
+        Number of threads to merge blocks of rows on. Use -1 for all
+        available CPUs. Small inputs are always merged on a single thread.
+    
+    engine : {None, 'numba'}, default None
+        Use ``'numba'`` to merge numeric and datetime Series with equal
+        indexes with a compiled kernel, which visits each row only once.
+        Falls back to the default engine, if numba is not installed or the
+        dtypes are not supported.
+    
+    strategy : {'first', 'last', 'majority'} or sequence of numbers, default 'first'
+        Which value to choose, if a row holds several non-NA values:
+        - ``first``: The value of the first Series containing one.
+        - ``last``: The value of the last Series containing one.
+        - ``majority``: The most frequent value. Ties are resolved in
+            favour of the value found in the first Series.
+        - A sequence of one priority per Series: The value of the Series
+            with the highest priority. Ties keep the order of the Series.
+        All strategies are evaluated as vectorized operations on all rows
+        at once. ``majority`` compares all pairs of Series.
+    
+    return_source : bool, default False
+        Also return which Series each value was taken from.
+    
+    out : np.ndarray or pd.Series, optional
+        Preallocated buffer to write the result into instead of allocating
+        a new one, e.g. to reuse it for repeated calls on inputs of the
+        same shape. Its length must match the result, whose values are
+        written in the order of the labels of the result. Its index, if
+        any, is left untouched. If it is of the dtype of the result, the
+        values are merged in it directly, otherwise they are copied into
+        it, as long as they are of the same kind. It must not share memory
+        with the inputs, which are never modified.
+    
     Returns
     -------
     pd.Series
-        Result of merging the combined Series.
+        Result of merging the combined Series, in the narrowest dtype that
+        holds all values. Numeric inputs are promoted like numpy does, but
+        integers and bools become nullable (e.g. Int64) instead of float,
+        if any input is nullable or aligning the inputs introduces NA
+        values. Datetimes keep their dtype, tz-aware datetimes of differing
+        time zones are merged in UTC. Other mixtures of dtypes are upcast
+        like pd.Series.where() does. Arrow-backed inputs of a
+        single dtype are merged with pyarrow and keep their dtype.
+        Categorical inputs are merged on their codes and stay categorical,
+        with differing categories being unified first. If ``out`` is
+        given, ``out`` itself is returned.
+    np.ndarray
+        Only returned, if ``return_source`` is True. Position of the Series
+        each value was taken from, or -1 for rows without non-NA values.
     
     Notes
     -----
+    Polars inputs are merged by pl.coalesce() without converting them to
+    pandas, and the result and the sources are returned as Polars Series.
+    NaN is treated as NA, like in pandas. Rows are aligned by their
+    position. ``n_jobs`` and ``engine`` are ignored, ``strategy='majority'``
+    and ``out`` are not supported.
+    
     When providing are mixture of different types of iterables, one has to keep
     in mind that only pd.Series and dicts have an intrinsic index, while the
     index of a list, tuple or ndarray will be numeric. This might lead to
@@ -67,6 +459,17 @@ def merge_non_na (data: Union[list[Union[pd.Series, np.ndarray, list, tuple, dic
     C 3.0
     dtype: float64
     
+    Prefer later Series or use a vote instead:
+    >>> s4 = pd.Series([1.0, 3.0])
+    >>> merge_non_na([s1,s3,s4], strategy='last')
+    0 1.0
+    1 3.0
+    dtype: float64
+    >>> merge_non_na([s1,s3,s4], strategy=[0, 2, 1], return_source=True)
+    (0 1.0
+    1 2.0
+    dtype: float64, array([1, 1]))
+    
     With mixed types, care has to be taken about the indices:
     Non-Series objects can be provided as well:
     >>> d1 = {'A': 1.0, 'B': np.nan, 'C': 3.0}
@@ -80,36 +483,92 @@ def merge_non_na (data: Union[list[Union[pd.Series, np.ndarray, list, tuple, dic
     2 3.0
     dtype: float64
     """
+    _numba.check_engine(engine)
+    majority = isinstance(strategy, str) and strategy == 'majority'
+    
+    if _polars.accepts(data):
+        _instrument.path('polars')
+        order = _order(strategy, len(data) if isinstance(data, list) else data.width)
+        if majority:
+            raise ValueError("Strategy 'majority' is not supported for Polars inputs.")
+        result, source, remaining = _polars.merge_non_na(data, order, return_source, out)
+        _instrument.mark('fill')
+        _check_remaining(remaining, remaining_na)
+        return (result, source) if return_source else result
+    
     if isinstance(data, list):
-        data = pd.concat([elem if isinstance(elem, pd.Series) else pd.Series(elem) for elem in data], axis='columns')
+        data = _coerce.series_list(data, dicts=True)
+        order = _order(strategy, len(data))
+        if _categorical.supports([s.dtype for s in data]):
+            # pd.concat() would turn differing categories into objects
+            data = _categorical.unify(data)
+        elif len(data) > 0:
+            data = _resolve(data)
+        _instrument.mark('coerce')
+        if len(data) > 0 and _can_align(data) and not majority and not return_source:
+            if order is None:
+                result, remaining = _first_valid_aligned(data, n_jobs, engine, out)
+            else:
+                result, remaining = _first_valid_aligned([data[i] for i in order], n_jobs, engine)
+                # keep the labels in the order of the given Series
+                index = align(data)[0]
+                if not result.index.equals(index):
+                    result = result.reindex(index)
+                result.name = data[0].name if data[0].name is not None else 0
+            _instrument.mark('fill')
+            _check_remaining(remaining, remaining_na)
+            return _into(out, result)
+        data = pd.concat(data, axis='columns')
+        _instrument.mark('align')
     
     if not isinstance(data, pd.DataFrame):
         return pd.Series([True for _ in range(len(data))])
     
+    order = _order(strategy, len(data.columns))
+    if order is not None:
+        name = data.columns[0]
+        data = data.iloc[:,order]
+    
     n = len(data.columns)
     if n == 0:
         raise ValueError("Number of Series may not be zero.")
+    if len(set(data.dtypes)) > 1:
+        dtype = _coerce.merge_dtype(list(data.dtypes), False)
+        if dtype is not None:
+            data = data.astype(dtype)
     
-    i = 0
-    result = data.iloc[:,i]
-    na = result.isna()
-    
-    while na.any():
-        
-        if i + 1 == n:
-            if remaining_na == 'raise':
-                raise ValueError('NA values still remain in Series after merging.')
-            elif remaining_na == 'warn':
-                warnings.warn('NA values still remain in Series after merging.')
-                return result
-            elif remaining_na == 'ignore':
-                return result
-            else:
-                raise ValueError(f"Expected value for kwarg 'remaining_na' to be one of "
-                                 "['raise', 'warn', 'ignore'], got {remaining_na} instead.")
-        
-        i += 1
-        result.where(~na, data.iloc[:,i], inplace=True)
-        na = result.isna()
+    target = None if out is None else _coerce.buffer(out, (len(data),))
+    choice = None
+    if majority or return_source:
+        _instrument.path('choice')
+        values, mask = _coerce.stacked(data)
+        choice = _majority_choice(values, mask) if majority else _first_choice(mask)
+        result = _take(data, choice)
+        remaining = (choice < 0).any()
+    elif _categorical.supports(list(data.dtypes)):
+        _instrument.path('categorical')
+        columns = _categorical.unify([data.iloc[:,i] for i in range(n)])
+        codes = _categorical.first_valid([_categorical.codes(s) for s in columns])
+        result = pd.Series(pd.Categorical.from_codes(codes, dtype=columns[0].dtype),
+                           index=data.index, name=data.columns[0])
+        remaining = (codes == -1).any()
+    elif engine == 'numba' and len(set(data.dtypes)) == 1 and _numba.supports(data.dtypes):
+        _instrument.path('numba')
+        result, remaining = _first_valid_numba([data.iloc[:,i].to_numpy() for i in range(n)], n_jobs, target)
+        result = pd.Series(result, index=data.index, name=data.columns[0])
+    elif len(set(data.dtypes)) == 1:
+        result, remaining = _first_valid(data, n_jobs, target)
+    else:
+        _instrument.path('where')
+        result, remaining = _first_valid_where(data)
+    _instrument.mark('fill')
     
+    _check_remaining(remaining, remaining_na)
+    if order is not None:
+        result.name = name
+    result = _into(out, result)
+    if return_source:
+        # report positions in the order the Series were given
+        source = np.where(choice < 0, -1, choice if order is None else order[np.maximum(choice, 0)])
+        return result, source
     return result
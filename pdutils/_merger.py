@@ -0,0 +1,179 @@
+from typing import Union, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import _categorical, _coerce
+from ._align import align
+from ._merge import _check_remaining, _resolve_dtype
+
+class NonNAMerger:
+    """
+    Incremental merge of Series, which are added one at a time.
+    
+    Accumulates the result of merge_non_na() with ``strategy='first'``,
+    without holding all Series in memory at once. Only the positions that
+    are still NA are tracked, and each added Series is read at these
+    positions only. Once no NA values are left, ``is_complete`` allows to
+    skip loading the remaining Series altogether.
+    
+    Labels are aligned like in merge_non_na(). Labels that are missing in
+    the result so far are appended to it as NA first, so a merger that is
+    complete may become incomplete again, if a Series with new labels is
+    added. Series of a dtype that differs from the result are converted to
+    their common dtype like in merge_non_na(), e.g. integers become Int64
+    instead of float, if NA values are introduced.
+    
+    Parameters
+    ----------
+    remaining_na : {'raise', 'warn', 'ignore'}, default 'raise
+        What to do, when NA values remain in the result, see
+        merge_non_na(). Applied by result().
+    
+    Raises
+    ------
+    ValueError
+        If value for ``remaining_na`` is not recognized.
+    
+    See Also
+    --------
+    merge_non_na: Combine multiple Series.
+    
+    Examples
+    --------
+    >>> merger = NonNAMerger()
+    >>> for path in paths:
+    ...     merger.add(pd.read_parquet(path, columns=['price'])['price'])
+    ...     if merger.is_complete:
+    ...         break
+    >>> merged = merger.result()
+    """
+    
+    def __init__ (self, remaining_na: Optional[str] = 'raise'):
+        if remaining_na not in ('raise', 'warn', 'ignore'):
+            raise ValueError(f"Expected value for kwarg 'remaining_na' to be one of "
+                             f"['raise', 'warn', 'ignore'], got {remaining_na} instead.")
+        self._remaining_na = remaining_na
+        self._values = None
+        self._index = None
+        self._name = None
+        self._pending = None
+        self._n_added = 0
+    
+    def __len__ (self) -> int:
+        return 0 if self._index is None else len(self._index)
+    
+    @property
+    def n_added (self) -> int:
+        """
+        Number of Series added so far.
+        """
+        return self._n_added
+    
+    @property
+    def n_remaining (self) -> int:
+        """
+        Number of rows that are still NA.
+        """
+        return 0 if self._pending is None else len(self._pending)
+    
+    @property
+    def is_complete (self) -> bool:
+        """
+        Whether at least one Series was added and no NA values are left.
+        """
+        return self._pending is not None and len(self._pending) == 0
+    
+    def add (self, s: Union[pd.Series, np.ndarray, list, tuple, dict]) -> 'NonNAMerger':
+        """
+        Fill the NA values of the result with the values of ``s``.
+        
+        The Series is not modified and no reference to it is kept.
+        
+        Parameters
+        ----------
+        s : array-like
+            Series to take values from.
+        
+        Returns
+        -------
+        NonNAMerger
+            The merger itself, to allow chaining.
+        
+        Raises
+        ------
+        ValueError
+            If indexes differ and contain duplicate or NA labels.
+        TypeError
+            If ``s`` is not array-like.
+        """
+        s = _coerce.series_list([s], dicts=True)[0]
+        self._n_added += 1
+        if self._values is None:
+            self._values = _coerce.values(s).copy()
+            self._index = s.index
+            self._name = s.name if s.name is not None else 0
+            self._pending = np.flatnonzero(pd.isna(self._values))
+            return self
+        
+        result = pd.Series(self._values, index=self._index, copy=False)
+        if _categorical.supports([result.dtype, s.dtype]):
+            result, s = _categorical.unify([result, s])
+        else:
+            dtype = _resolve_dtype([result, s])
+            if dtype is not None:
+                result, s = result.astype(dtype, copy=False), s.astype(dtype, copy=False)
+        
+        index, indexers = align([result, s])
+        if indexers is not None and len(index) > len(result):
+            # the union starts with the labels of the result, new ones are appended
+            self._pending = np.concatenate([self._pending, np.arange(len(result), len(index))])
+            result = result.reindex(index)
+        
+        if result.dtype != s.dtype:
+            result = result.where(result.notna(), s if indexers is None else s.reindex(index))
+            self._values, self._index = _coerce.values(result), result.index
+            self._pending = np.flatnonzero(result.isna().to_numpy())
+            return self
+        
+        pending = self._pending
+        missing = pending[:0]
+        if indexers is None:
+            rows = pending
+        else:
+            positions = np.full(len(index), -1)
+            positions[indexers[1]] = np.arange(len(s))
+            rows = positions[pending]
+            # labels that are missing in s stay NA
+            missing, pending, rows = pending[rows < 0], pending[rows >= 0], rows[rows >= 0]
+        
+        target = _coerce.values(result)
+        values = _coerce.values(s)[rows]
+        valid = ~pd.isna(values)
+        target[pending[valid]] = values[valid]
+        self._values, self._index = target, result.index
+        self._pending = np.sort(np.concatenate([missing, pending[~valid]]))
+        return self
+    
+    def result (self) -> pd.Series:
+        """
+        Return the merged Series, applying ``remaining_na``.
+        
+        The merger can still be used afterwards, without affecting the
+        returned Series.
+        
+        Returns
+        -------
+        pd.Series
+            Result of merging all Series added so far.
+        
+        Raises
+        ------
+        ValueError
+            If no Series were added.
+            If NA values remain and ``remaining_na`` is ``raise``.
+        """
+        if self._values is None:
+            raise ValueError("Number of Series may not be zero.")
+        _check_remaining(self.n_remaining > 0, self._remaining_na)
+        return pd.Series(self._values.copy(), index=self._index, name=self._name)
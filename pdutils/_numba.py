@@ -0,0 +1,126 @@
+import functools
+from types import SimpleNamespace
+from typing import Optional
+
+import numpy as np
+
+NA_NEVER, NA_NAN, NA_NAT = 0, 1, 2
+"""How NA values are represented in the values passed to the kernels."""
+
+def check_engine (engine: Optional[str]) -> None:
+    """
+    Validate the ``engine`` keyword argument.
+    """
+    if engine not in (None, 'numba'):
+        raise ValueError(f"Expected value for kwarg 'engine' to be one of "
+                         f"[None, 'numba'], got {engine} instead.")
+
+def supports (dtypes: list) -> bool:
+    """
+    Check whether numba is available and can handle all ``dtypes``.
+    
+    Supported are numpy booleans, numbers and datetimes, which must not be
+    mixed with each other.
+    """
+    if not available():
+        return False
+    if not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+        return False
+    kinds = {dtype.kind for dtype in dtypes}
+    return kinds <= set('biuf') or kinds == {'M'} or kinds == {'m'}
+
+def na_kind (dtype: np.dtype) -> int:
+    """
+    Return how NA values are represented in arrays of ``dtype``.
+    """
+    if dtype.kind in 'mM':
+        return NA_NAT
+    return NA_NAN if dtype.kind == 'f' else NA_NEVER
+
+def as_kernel_input (array: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """
+    Convert ``array`` to ``dtype`` without copying, if possible.
+    
+    Datetimes are returned as int64, with NaT being the smallest integer.
+    """
+    array = array.astype(dtype, copy=False)
+    return array.view('i8') if dtype.kind in 'mM' else array
+
+@functools.lru_cache(maxsize=None)
+def _kernels () -> Optional[SimpleNamespace]:
+    """
+    Import numba and define the kernels, or return None, if numba is not
+    installed.
+    
+    Both take long enough to slow down importing pdutils noticeably, so
+    they are deferred until the numba engine is first requested.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(nogil=True, inline='always')
+    def _isna (value, na_kind):
+        if na_kind == NA_NAN:
+            return value != value
+        if na_kind == NA_NAT:
+            return value == np.iinfo(np.int64).min
+        return False
+    
+    @numba.njit(nogil=True)
+    def eq_update (values, na_kind, ref, has_ref, any_na, check):
+        """
+        Compare the next column of a block of rows with the first non-NA
+        value seen so far in each row.
+        
+        Columns are processed one after another in a single fused loop over
+        contiguous memory each, updating the per-row state in place:
+        ``ref`` holds the first non-NA value, ``has_ref`` whether one was
+        found, ``any_na`` whether an NA value was found and ``check``
+        whether all non-NA values are equal.
+        """
+        for i in range(values.shape[0]):
+            value = values[i]
+            na = _isna(value, na_kind)
+            has = has_ref[i]
+            # bitwise operators keep the loop free of branches
+            check[i] &= na | (not has) | (value == ref[i])
+            if not has:
+                ref[i] = value
+            has_ref[i] = has | (not na)
+            any_na[i] |= na
+    
+    @numba.njit(nogil=True)
+    def first_valid_update (values, na_kind, out, filled):
+        """
+        Fill the rows of ``out`` that are not ``filled`` yet with the non-NA
+        values of the next column. Returns the number of newly filled rows.
+        """
+        n = 0
+        for i in range(values.shape[0]):
+            if not filled[i] and not _isna(values[i], na_kind):
+                out[i] = values[i]
+                filled[i] = True
+                n += 1
+        return n
+    
+    return SimpleNamespace(eq_update=eq_update, first_valid_update=first_valid_update)
+
+def available () -> bool:
+    """
+    Check whether numba is installed, compiling the kernels on first use.
+    """
+    return _kernels() is not None
+
+def eq_update (values, na_kind, ref, has_ref, any_na, check) -> None:
+    """
+    Run the eq_update kernel, see _kernels().
+    """
+    _kernels().eq_update(values, na_kind, ref, has_ref, any_na, check)
+
+def first_valid_update (values, na_kind, out, filled) -> int:
+    """
+    Run the first_valid_update kernel, see _kernels().
+    """
+    return _kernels().first_valid_update(values, na_kind, out, filled)
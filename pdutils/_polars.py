@@ -0,0 +1,176 @@
+from typing import Union, Optional
+
+import numpy as np
+
+from . import _eq
+
+pl = None
+"""The polars module, once a Polars input has been passed."""
+
+def _from_polars (obj) -> bool:
+    """
+    Check whether ``obj`` is an instance of a Polars class, without
+    importing polars.
+    """
+    return type(obj).__module__.partition('.')[0] == 'polars'
+
+def accepts (data) -> bool:
+    """
+    Check whether ``data`` is a Polars DataFrame or a non-empty list of
+    Polars Series, which are processed with Polars expressions.
+    
+    Polars is only imported, once such an input is passed, since importing
+    it takes longer than importing pdutils itself.
+    """
+    global pl
+    if isinstance(data, list):
+        if len(data) == 0 or not all(_from_polars(elem) for elem in data):
+            return False
+    elif not _from_polars(data):
+        return False
+    if pl is None:
+        import polars
+        pl = polars
+    if isinstance(data, pl.DataFrame):
+        return True
+    return isinstance(data, list) and len(data) > 0 and all(isinstance(elem, pl.Series) for elem in data)
+
+def _frame (data: Union[list['pl.Series'], 'pl.DataFrame']) -> 'pl.DataFrame':
+    """
+    Validate the inputs and combine them into a single DataFrame without
+    copying their data. Series are renamed by position, as their names
+    need not be unique.
+    """
+    if isinstance(data, pl.DataFrame):
+        if data.width == 0:
+            raise ValueError("Number of Series may not be zero.")
+        return data
+    n = len(data[0])
+    if any(len(s) != n for s in data[1:]):
+        raise ValueError("Lengths of all Series must be equal.")
+    return pl.DataFrame([s.alias(f'_{j}') for j, s in enumerate(data)])
+
+def _columns (frame: 'pl.DataFrame') -> list['pl.Expr']:
+    """
+    Return an expression for each column, which treats NaN as NA like
+    pandas does. Polars keeps NaN and null apart.
+    """
+    return [pl.col(name).fill_nan(None) if dtype.is_float() else pl.col(name)
+            for name, dtype in frame.schema.items()]
+
+def _kind (dtype: 'pl.DataType'):
+    """
+    Return the group of dtypes whose values can equal values of ``dtype``.
+    Numbers, including booleans, are compared with each other, while other
+    dtypes are only compared with themselves.
+    """
+    if dtype.is_numeric() or dtype == pl.Boolean:
+        return 'numeric'
+    return dtype
+
+def _eq_group (columns: list['pl.Expr'], dtypes: list['pl.DataType']) -> 'pl.Expr':
+    """
+    Build the expression comparing columns of a single group of dtypes,
+    ignoring NA values.
+    
+    Rows of orderable dtypes are equal, if their horizontal minimum equals
+    their horizontal maximum, both of which ignore NA values. Otherwise,
+    each element is compared to the first non-NA element of its row, like
+    the numpy kernel does.
+    """
+    if all(dtype.is_numeric() or dtype == pl.Boolean for dtype in dtypes) or \
+            all(dtype == dtypes[0] and (dtype.is_temporal() or dtype == pl.String) for dtype in dtypes):
+        return (pl.min_horizontal(columns) == pl.max_horizontal(columns)).fill_null(True)
+    ref = pl.coalesce(columns)
+    return pl.all_horizontal([(column == ref).fill_null(True) for column in columns])
+
+def _eq_expr (frame: 'pl.DataFrame', na: str) -> 'pl.Expr':
+    """
+    Build the expression comparing all columns of ``frame`` elementwise.
+    
+    Columns are compared within groups of dtypes that share a supertype.
+    Values of different groups are never equal, so rows are only equal, if
+    their non-NA values all belong to a single group.
+    """
+    if frame.width == 1:
+        # a single Series is always equal
+        return pl.repeat(True, pl.len())
+    columns = _columns(frame)
+    groups = {}
+    for column, dtype in zip(columns, frame.schema.values()):
+        groups.setdefault(_kind(dtype), []).append((column, dtype))
+    checks = [_eq_group(*map(list, zip(*group))) for group in groups.values()]
+    check = pl.all_horizontal(checks)
+    if len(groups) > 1:
+        present = [pl.any_horizontal([column.is_not_null() for column, _ in group]).cast(pl.UInt32)
+                   for group in groups.values()]
+        check = check & (pl.sum_horizontal(present) <= 1)
+    if na == 'any':
+        return check
+    nulls = [column.is_null() for column in columns]
+    check = check & ~pl.any_horizontal(nulls)
+    if na == 'all':
+        check = check | pl.all_horizontal(nulls)
+    return check
+
+def _prepare (data: Union[list['pl.Series'], 'pl.DataFrame'], na: str, out) -> 'pl.DataFrame':
+    """
+    Validate the arguments of eq_multiple and equals_multiple.
+    """
+    _eq._check_na(na)
+    if out is not None:
+        raise ValueError("Kwarg 'out' is not supported for Polars inputs.")
+    return _frame(data)
+
+def eq_multiple (data: Union[list['pl.Series'], 'pl.DataFrame'],
+                 na: str,
+                 result: str = 'series',
+                 out=None
+                 ) -> 'pl.Series':
+    """
+    Compare Polars Series elementwise, see pdutils.eq_multiple().
+    """
+    if result != 'series':
+        raise ValueError(f"Expected value for kwarg 'result' to be 'series' for Polars inputs, "
+                         f"got {result} instead.")
+    frame = _prepare(data, na, out)
+    return frame.select(_eq_expr(frame, na).alias('')).to_series()
+
+def equals_multiple (data: Union[list['pl.Series'], 'pl.DataFrame'], na: str) -> bool:
+    """
+    Test whether Polars Series contain the same elements, see
+    pdutils.equals_multiple().
+    """
+    frame = _prepare(data, na, None)
+    return np.bool_(frame.select(_eq_expr(frame, na).all()).item())
+
+def merge_non_na (data: Union[list['pl.Series'], 'pl.DataFrame'],
+                  order: Optional[np.ndarray],
+                  return_source: bool,
+                  out=None
+                  ) -> tuple['pl.Series', Optional['pl.Series'], bool]:
+    """
+    Coalesce Polars Series in the given ``order``, see pdutils.merge_non_na().
+    
+    Returns the result, which Series each value was taken from, if
+    ``return_source`` is True, and whether NA values remain.
+    """
+    if out is not None:
+        raise ValueError("Kwarg 'out' is not supported for Polars inputs.")
+    frame = _frame(data)
+    name = frame.columns[0] if isinstance(data, pl.DataFrame) else data[0].name
+    columns = _columns(frame)
+    if order is not None:
+        columns = [columns[j] for j in order]
+        positions = [int(j) for j in order]
+    else:
+        positions = list(range(len(columns)))
+    
+    exprs = [pl.coalesce(columns).alias(name)]
+    if return_source:
+        sources = [pl.when(column.is_not_null()).then(pl.lit(j)) for column, j in zip(columns, positions)]
+        exprs.append(pl.coalesce(sources).fill_null(-1).alias('source'))
+    merged = frame.select(exprs)
+    result = merged.to_series(0)
+    source = merged.to_series(1) if return_source else None
+    return result, source, result.null_count() > 0
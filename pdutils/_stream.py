@@ -0,0 +1,154 @@
+from typing import Union, Optional, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from ._eq import eq_multiple, equals_multiple
+from ._merge import merge_non_na
+
+Chunk = Union[pd.DataFrame, tuple[pd.Series, ...], list[pd.Series]]
+
+def _as_list (chunk: Chunk) -> Union[pd.DataFrame, list[pd.Series]]:
+    """
+    Convert a chunk to the input expected by the non-streaming functions.
+    """
+    if isinstance(chunk, pd.DataFrame):
+        return chunk
+    if isinstance(chunk, (tuple, list)):
+        return list(chunk)
+    raise TypeError(f"Chunk must be DataFrame, tuple or list of Series, "
+                    f"got {type(chunk)} instead.")
+
+def eq_multiple_chunks (chunks: Iterable[Chunk],
+                        na: Optional[str] = 'any'
+                        ) -> Iterator[pd.Series]:
+    """
+    Compare multiple Series elementwise, one chunk at a time.
+    
+    Streaming variant of eq_multiple() for data that is read in pieces,
+    e.g. by ``pd.read_csv(chunksize=...)``. Only a single chunk is held in
+    memory at a time.
+    
+    Parameters
+    ----------
+    chunks : iterable of pd.DataFrame or tuples of Series
+        Chunks to compare. A DataFrame is compared column by column, a
+        tuple holds aligned chunks of the Series to compare.
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled during the comparison.
+        See eq_multiple() for details.
+    
+    Yields
+    ------
+    pd.Series
+        Elementwise results of the comparison of each chunk, carrying the
+        index of the chunk (or of its first Series).
+    
+    Raises
+    ------
+    ValueError
+        If a chunk is empty or holds Series of different lengths.
+        If value for ``na`` is not recognized.
+    TypeError
+        If a chunk is neither a DataFrame nor a tuple of array-likes.
+    
+    See Also
+    --------
+    eq_multiple: Compare multiple Series elementwise.
+    equals_multiple_chunks: Return True, if all chunks are equal.
+    
+    Examples
+    --------
+    >>> reader = pd.read_csv('data.csv', usecols=['a', 'b', 'c'], chunksize=10000)
+    >>> check = pd.concat(eq_multiple_chunks(reader))
+    """
+    for chunk in chunks:
+        series = _as_list(chunk)
+        if isinstance(series, pd.DataFrame):
+            index = series.index
+        else:
+            index = getattr(series[0], 'index', None) if len(series) > 0 else None
+        check = eq_multiple(series, na)
+        if index is not None:
+            check.index = index
+        yield check
+
+def equals_multiple_chunks (chunks: Iterable[Chunk],
+                            na: Optional[str] = 'any'
+                            ) -> bool:
+    """
+    Test whether multiple Series contain the same elements, one chunk at
+    a time.
+    
+    Streaming variant of equals_multiple(). Stops consuming ``chunks`` at
+    the first chunk containing a mismatch.
+    
+    Parameters
+    ----------
+    chunks : iterable of pd.DataFrame or tuples of Series
+        Chunks to compare. A DataFrame is compared column by column, a
+        tuple holds aligned chunks of the Series to compare.
+    
+    na : {'all', 'any, 'none'}, default 'any'
+        Control how NA values are handled during the comparison.
+        See eq_multiple() for details.
+    
+    Returns
+    -------
+    bool
+        Result of the comparison. True, if ``chunks`` is empty.
+    
+    See Also
+    --------
+    equals_multiple: Test whether multiple Series contain the same elements.
+    
+    Examples
+    --------
+    >>> reader = pd.read_csv('data.csv', usecols=['a', 'b', 'c'], chunksize=10000)
+    >>> equals_multiple_chunks(reader, na='all')
+    True
+    """
+    for chunk in chunks:
+        if not equals_multiple(_as_list(chunk), na):
+            return np.False_
+    return np.True_
+
+def merge_non_na_chunks (chunks: Iterable[Chunk],
+                         remaining_na: Optional[str] = 'raise'
+                         ) -> Iterator[pd.Series]:
+    """
+    Combine multiple Series by filling NA values with non-NA values from
+    the others, one chunk at a time.
+    
+    Streaming variant of merge_non_na() for data that is read in pieces,
+    e.g. by ``pd.read_csv(chunksize=...)``. Only a single chunk is held in
+    memory at a time.
+    
+    Parameters
+    ----------
+    chunks : iterable of pd.DataFrame or tuples of Series
+        Chunks to merge. A DataFrame is merged column by column, a tuple
+        holds chunks of the Series to merge.
+    
+    remaining_na : {'raise', 'warn', 'ignore'}, default 'raise
+        What to do, when NA values remain after merging a chunk.
+        See merge_non_na() for details.
+    
+    Yields
+    ------
+    pd.Series
+        Result of merging each chunk.
+    
+    See Also
+    --------
+    merge_non_na: Combine multiple Series.
+    
+    Examples
+    --------
+    >>> reader = pd.read_csv('data.csv', usecols=['a', 'b', 'c'], chunksize=10000)
+    >>> for merged in merge_non_na_chunks(reader):
+    ...     merged.to_csv('merged.csv', mode='a', header=False)
+    """
+    for chunk in chunks:
+        yield merge_non_na(_as_list(chunk), remaining_na)
@@ -0,0 +1,33 @@
+import unittest
+
+import pandas as pd
+
+from pdutils._align import align
+
+class TestAlign (unittest.TestCase):
+    
+    def setUp (self):
+        self.s1 = pd.Series({'red': 1.0, 'blue': 2.0})
+        self.s2 = pd.Series({'red': 3.0, 'blue': 4.0})
+        self.s3 = pd.Series({'cyan': 5.0, 'red': 6.0})
+        self.s4 = pd.Series([1.0, 2.0], index=['red', 'red'])
+    
+    def test_equal (self):
+        index, indexers = align([self.s1, self.s2])
+        self.assertIs(index, self.s1.index)
+        self.assertIsNone(indexers)
+        
+        # duplicates are fine, as long as all indexes are equal
+        index, indexers = align([self.s4, self.s4.copy()])
+        self.assertIsNone(indexers)
+    
+    def test_union (self):
+        index, indexers = align([self.s1, self.s3, self.s2])
+        self.assertEqual(list(index), ['red', 'blue', 'cyan'])
+        self.assertEqual([list(i) for i in indexers], [[0, 1], [2, 0], [0, 1]])
+        self.assertTrue(index.equals(pd.concat([self.s1, self.s3, self.s2], axis='columns').index))
+        
+        self.assertRaises(ValueError, align, [self.s1, self.s4])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
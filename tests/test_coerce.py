@@ -0,0 +1,67 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_multiple, merge_non_na, _coerce
+
+class TestCoerce (unittest.TestCase):
+    
+    def setUp (self):
+        self.s1 = pd.Series([1.0, 2.0,    3.0])
+        self.n2 = np.array([1.0, np.nan, 3.0])
+        self.l3 = [1, 2, 3]
+    
+    def test_series_list (self):
+        data = [self.s1, self.n2, self.l3]
+        series = _coerce.series_list(data)
+        self.assertIsNot(series, data)
+        self.assertIs(series[0], self.s1)
+        self.assertTrue(np.shares_memory(series[1].to_numpy(), self.n2))
+        self.assertEqual(list(series[2]), self.l3)
+        
+        # the list of the caller is left untouched
+        eq_multiple(data)
+        merge_non_na(data)
+        self.assertIs(data[1], self.n2)
+        self.assertIs(data[2], self.l3)
+        
+        # columns of DataFrames are views, without going through iteritems()
+        df = pd.DataFrame({'a': [1.0, 2.0], 'b': [3.0, 4.0]})
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            series = _coerce.series_list(df)
+        self.assertEqual([s.name for s in series], ['a', 'b'])
+        self.assertTrue(np.shares_memory(series[1].to_numpy(), df.to_numpy()))
+        
+        self.assertIsNone(_coerce.series_list(self.s1))
+        self.assertRaises(TypeError, _coerce.series_list, [self.s1, {0: 1.0}])
+        self.assertEqual(len(_coerce.series_list([self.s1, {0: 1.0}], dicts=True)), 2)
+        self.assertRaises(TypeError, _coerce.series_list, [self.s1, 1.0], dicts=True)
+    
+    def test_stacked (self):
+        # a homogeneous DataFrame is returned as view
+        df = pd.DataFrame({'a': [1.0, np.nan], 'b': [3.0, 4.0], 'c': [5.0, 6.0]})
+        values, mask = _coerce.stacked(df)
+        self.assertEqual(values.shape, (3, 2))
+        self.assertTrue(values.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.shares_memory(values, df.to_numpy()))
+        self.assertEqual(mask.tolist(), [[False, True], [False, False], [False, False]])
+        
+        # mixed dtypes are unified once
+        values, mask = _coerce.stacked([pd.Series([1, 2]), pd.Series([1.5, np.nan]), pd.Series([1, None], dtype='Int64')])
+        self.assertEqual(values.dtype, np.float64)
+        self.assertEqual(values[:,0].tolist(), [1.0, 1.5, 1.0])
+        self.assertEqual(mask[:,1].tolist(), [False, True, True])
+        
+        values, mask = _coerce.stacked([pd.Series([1, 2]), pd.Series(['a', None])])
+        self.assertEqual(values.dtype, object)
+        self.assertEqual(mask[:,1].tolist(), [False, True])
+        
+        values, mask = _coerce.stacked([pd.Series(['a', None], dtype='category'), pd.Series(['b', 'a'], dtype='category')])
+        self.assertEqual(values.tolist(), [[0, -1], [1, 0]])
+        self.assertEqual(mask.tolist(), [[False, True], [False, False]])
+
+if __name__ == '__main__':
+    unittest.main()
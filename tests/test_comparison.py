@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from pdutils import Comparison, eq_multiple, equals_multiple
+
+class TestComparison (unittest.TestCase):
+    
+    def setUp (self):
+        self.s1 = pd.Series([1.0, 2.0,    3.0,    np.nan])
+        self.s2 = pd.Series([1.0, np.nan, 3.0,    np.nan])
+        self.s3 = pd.Series([1.0, np.nan, -3.0,   np.nan])
+        self.l2 = list(self.s2)
+    
+    def test_modes (self):
+        s = [self.s1, self.s2, self.s3]
+        c = Comparison(s)
+        for na in ['any', 'all', 'none']:
+            self.assertTrue(pd.Series.equals(c.eq(na), eq_multiple(s, na)))
+            self.assertEqual(c.equals(na), equals_multiple(s, na))
+        
+        r = c.eq(['any', 'all', 'none'])
+        self.assertEqual(list(r.columns), ['any', 'all', 'none'])
+        self.assertEqual(list(r['all']), list(eq_multiple(s, 'all')))
+        r = c.equals(['any', 'all'])
+        self.assertEqual(list(r.index), ['any', 'all'])
+        self.assertEqual(list(r), [False, False])
+        
+        self.assertTrue(Comparison([self.s1, self.s2]).equals('any'))
+        self.assertRaises(ValueError, c.eq, 'foobar')
+        with self.assertRaisesRegex(ValueError, 'got foobar instead'):
+            c.equals(['any', 'foobar'])
+    
+    def test_shared (self):
+        c = Comparison([self.s1, self.l2])
+        with mock.patch('pdutils._coerce.stacked') as stack:
+            stack.return_value = (np.stack([self.s1, self.s2]), np.stack([self.s1.isna(), self.s2.isna()]))
+            c.eq('any')
+            c.eq('none')
+            c.equals(['all', 'none'])
+            stack.assert_called_once()
+        
+        # results do not share memory with the cache
+        r = c.eq('any')
+        r[:] = False
+        self.assertTrue(c.equals('any'))
+    
+    def test_inputs (self):
+        # the list of the caller is left untouched
+        s = [self.l2, self.s1]
+        c = Comparison(s)
+        self.assertTrue(isinstance(s[0], list))
+        self.assertEqual(len(c), 4)
+        
+        c = Comparison(pd.concat([self.s1, self.s2], axis='columns'))
+        self.assertEqual(list(c.eq('all')), [True, False, True, True])
+        self.assertEqual(c.values.shape, (2, 4))
+        self.assertEqual(c.mask.sum(), 3)
+        
+        c = Comparison([self.s3])
+        self.assertEqual(list(c.eq('none')), [True] * 4)
+        
+        a = pd.Series(['x', None, 'y'], dtype='category')
+        b = pd.Series(['x', 'z',  'y'], dtype=pd.CategoricalDtype(['z', 'y', 'x']))
+        self.assertEqual(list(Comparison([a, b]).eq(['any', 'none']).all(axis=1)), [True, False, True])
+        
+        self.assertRaises(ValueError, Comparison, [])
+        self.assertRaises(ValueError, Comparison, [self.s1, self.s1[:2]])
+
+if __name__ == '__main__':
+    unittest.main()
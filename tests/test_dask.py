@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_multiple, merge_non_na, eq_multiple_dask, equals_multiple_dask, merge_non_na_dask
+
+try:
+    import dask.dataframe as dd
+except ImportError:
+    dd = None
+
+@unittest.skipIf(dd is None, "dask is not installed")
+class TestDask (unittest.TestCase):
+    
+    def setUp (self):
+        self.df = pd.DataFrame({'A': [1.0, 2.0,    3.0, np.nan, 5.0, 6.0],
+                                'B': [1.0, np.nan, 3.0, np.nan, 5.0, 7.0],
+                                'C': [1.0, np.nan, 4.0, 5.0,    5.0, 6.0]})
+        self.ddf = dd.from_pandas(self.df, npartitions=3)
+    
+    def test_eq (self):
+        for na in ['any', 'all', 'none']:
+            r = eq_multiple_dask(self.ddf, na).compute(scheduler='threads')
+            self.assertEqual(list(r), list(eq_multiple(self.df, na)))
+            self.assertTrue(r.index.equals(self.df.index))
+        
+        # differing divisions are realigned, missing labels count as NA
+        a = dd.from_pandas(self.df['A'], npartitions=2)
+        b = dd.from_pandas(self.df['B'].iloc[1:], npartitions=3)
+        r = eq_multiple_dask([a, b], 'all').compute(scheduler='sync')
+        self.assertEqual(list(r), [False, False, True, True, True, False])
+        
+        self.assertRaises(ValueError, eq_multiple_dask, [], 'any')
+        self.assertRaises(ValueError, eq_multiple_dask, self.ddf, 'foobar')
+        self.assertRaises(TypeError, eq_multiple_dask, [self.df['A']])
+    
+    def test_equals (self):
+        self.assertFalse(equals_multiple_dask(self.ddf, scheduler='threads'))
+        self.assertFalse(equals_multiple_dask(self.ddf[['A', 'B']]))
+        self.assertTrue(equals_multiple_dask([self.ddf['A'], self.ddf['A']], scheduler='processes'))
+        self.assertFalse(equals_multiple_dask([self.ddf['A'], self.ddf['A']], na='none'))
+    
+    def test_merge (self):
+        r = merge_non_na_dask(self.ddf).compute(scheduler='threads')
+        self.assertTrue(pd.Series.equals(r, merge_non_na(self.df)))
+        
+        r = merge_non_na_dask(self.ddf, strategy='last').compute(scheduler='threads')
+        self.assertEqual(list(r), [1.0, 2.0, 4.0, 5.0, 5.0, 6.0])
+        
+        a = dd.from_pandas(self.df['A'].iloc[:4], npartitions=2)
+        b = dd.from_pandas(self.df['C'].iloc[2:], npartitions=2)
+        r = merge_non_na_dask([a, b]).compute(scheduler='sync')
+        self.assertEqual(list(r), [1.0, 2.0, 3.0, 5.0, 5.0, 6.0])
+        self.assertEqual(list(r.index), list(range(6)))
+        
+        # remaining NA values are reported, once the result is computed
+        r = merge_non_na_dask(self.ddf[['A', 'B']])
+        with self.assertRaises(ValueError):
+            r.compute(scheduler='sync')
+        self.assertRaises(ValueError, merge_non_na_dask, self.ddf, remaining_na='foobar')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,10 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 
-from pdutils import eq_multiple, equals_multiple
+from pdutils import eq_multiple, equals_multiple, clear_fingerprints, _arrow, _fingerprint, _numba
 
 class TestMultipleEqual (unittest.TestCase):
     
@@ -76,7 +77,8 @@ class TestMultipleEqual (unittest.TestCase):
         self.assertRaises(TypeError, eq_multiple, [self.s5, self.d2, self.s3], na='all')
         
         # invalid keyword argument
-        self.assertRaises(ValueError, eq_multiple, [self.s1, self.s2], 'foobar')
+        with self.assertRaisesRegex(ValueError, 'got foobar instead'):
+            eq_multiple([self.s1, self.s2], 'foobar')
         
         # DataFrame as input
         df = pd.concat([self.s5, self.s2, self.s3], axis='columns')
@@ -146,6 +148,193 @@ class TestMultipleEqual (unittest.TestCase):
         self.assertFalse(equals_multiple(df, na='all'))
         self.assertTrue(equals_multiple(df, na='any'))
         self.assertFalse(equals_multiple(df, na='none'))
+    
+    def test_blocks (self):
+        # results must not depend on how rows are split into blocks
+        with mock.patch('pdutils._blocks.BLOCK_SIZE', 2):
+            self.assertEqual(sum(eq_multiple([self.s1, self.s2, self.s3, self.s4], na='any')), 2)
+            self.assertEqual(sum(eq_multiple([self.s5, self.s2, self.s3], na='all')), 2)
+            self.assertTrue(equals_multiple([self.s1, self.s2], na='any'))
+            self.assertFalse(equals_multiple([self.s1, self.s4], na='any'))
+            self.assertFalse(equals_multiple([self.s5, self.s3], na='none'))
+    
+    def test_datetime_mixes (self):
+        # datetimes compared as objects are Timestamps, not integers
+        dt = pd.Series(pd.to_datetime(['2022-01-01', None, '2022-01-03']))
+        td = pd.Series(pd.to_timedelta([1, None, 3], unit='s'))
+        for x in [dt, td]:
+            self.assertEqual(list(eq_multiple([x, x.astype(object)], na='none')), [True, False, True])
+            self.assertTrue(equals_multiple([x.astype(object), x], na='all'))
+        
+        ns = dt.astype('int64').astype(float).where(dt.notna())
+        self.assertEqual(list(eq_multiple([dt, ns])), [False, True, False])
+        self.assertFalse(equals_multiple([pd.Series(pd.to_datetime([0])), pd.Series(pd.to_timedelta([0]))]))
+        
+        df = pd.concat([dt, dt.astype(object), dt], axis='columns')
+        with mock.patch('pdutils._blocks.BLOCK_SIZE', 2):
+            self.assertEqual(list(eq_multiple(df, na='none')), [True, False, True])
+    
+    @mock.patch('pdutils._blocks.BLOCK_SIZE', 2)
+    @mock.patch('pdutils._blocks.PARALLEL_MIN_ROWS', 0)
+    def test_n_jobs (self):
+        s = [self.s1, self.s2, self.s3, self.s4]
+        for na in ['any', 'all', 'none']:
+            self.assertTrue(pd.Series.equals(eq_multiple(s, na, n_jobs=2), eq_multiple(s, na)))
+            self.assertEqual(equals_multiple(s, na, n_jobs=-1), equals_multiple(s, na))
+        self.assertTrue(equals_multiple([self.s1, self.s2], n_jobs=2))
+        self.assertRaises(ValueError, eq_multiple, s, n_jobs=0)
+    
+    @unittest.skipIf(not _numba.available(), "numba is not installed")
+    def test_numba (self):
+        s = [self.s1, self.s2, self.s3, self.s4]
+        for na in ['any', 'all', 'none']:
+            self.assertTrue(pd.Series.equals(eq_multiple(s, na, engine='numba'), eq_multiple(s, na)))
+            self.assertEqual(equals_multiple(s, na, engine='numba'), equals_multiple(s, na))
+        
+        d = [pd.Series(pd.to_datetime(['2022-01-01', '2022-01-02', '2022-01-03'])),
+             pd.Series(pd.to_datetime(['2022-01-01', None,         '2022-01-03'])),
+             pd.Series(pd.to_datetime(['2022-01-01', None,         None]))]
+        self.assertEqual(sum(eq_multiple(d, na='all', engine='numba')), 1)
+        self.assertEqual(sum(eq_multiple(d, na='any', engine='numba')), 3)
+        
+        # unsupported dtypes fall back to the default engine
+        o = [x.astype(object) for x in [self.s5, self.s2, self.s3]]
+        self.assertEqual(sum(eq_multiple(o, na='all', engine='numba')), 2)
+        
+        self.assertRaises(ValueError, eq_multiple, s, engine='foobar')
+    
+    @unittest.skipIf(_arrow.pa is None, "pyarrow is not installed")
+    @mock.patch('pdutils._blocks.BLOCK_SIZE', 2)
+    def test_arrow (self):
+        s = [self.s1, self.s2, self.s3, self.s4]
+        for dtype in ['string[pyarrow]', 'double[pyarrow]']:
+            a = [x.astype(dtype) for x in s]
+            for na in ['any', 'all', 'none']:
+                check = eq_multiple(a, na)
+                self.assertEqual(str(check.dtype), 'bool[pyarrow]')
+                self.assertEqual(list(check), list(eq_multiple(s, na)))
+                self.assertEqual(equals_multiple(a, na), equals_multiple(s, na))
+                self.assertEqual(list(eq_multiple(a, na, result='mismatches').positions),
+                                 list(eq_multiple(s, na, result='mismatches').positions))
+        
+        # differing Arrow types fall back to the default path
+        check = eq_multiple([self.s1.astype('int64[pyarrow]'), self.s4.astype('double[pyarrow]')])
+        self.assertEqual(list(check), list(eq_multiple([self.s1, self.s4])))
+    
+    @mock.patch('pdutils._blocks.BLOCK_SIZE', 2)
+    def test_categorical (self):
+        s = [self.s1, self.s2, self.s3, self.s4, self.s5]
+        c = [x.astype('category') for x in s]
+        for na in ['any', 'all', 'none']:
+            self.assertTrue(pd.Series.equals(eq_multiple(c, na), eq_multiple(s, na)))
+            self.assertEqual(equals_multiple(c, na), equals_multiple(s, na))
+        
+        # differing categories are recoded, regardless of their order
+        a = pd.Series(['x', None, 'y'], dtype=pd.CategoricalDtype(['x', 'y']))
+        b = pd.Series(['x', 'z',  None], dtype=pd.CategoricalDtype(['z', 'x']))
+        self.assertEqual(list(eq_multiple([a, b], 'any')), [True, True, True])
+        self.assertEqual(list(eq_multiple([a, b], 'none')), [True, False, False])
+        
+        # categories in a different order must be recoded as well
+        b = b.cat.set_categories(['z', 'y', 'x']).fillna('y')
+        self.assertTrue(equals_multiple([a, b]))
+        self.assertEqual(list(eq_multiple([a, b], 'none')), [True, False, True])
+    
+    def test_fingerprint (self):
+        s = [self.s1, self.s2, self.s3, self.s4, self.s5]
+        for na in ['any', 'all', 'none']:
+            for a in s:
+                for b in s:
+                    self.assertEqual(equals_multiple([a, b], na, fingerprint=True), equals_multiple([a, b], na))
+        
+        a = pd.Series(np.arange(10.0))
+        b = a.copy()
+        with mock.patch('pdutils._eq._compare') as compare:
+            b.iloc[9] = -1.0
+            self.assertFalse(equals_multiple([a, b], 'none', fingerprint=True))
+            self.assertFalse(equals_multiple([a, self.s2.reindex(range(10))], 'none', fingerprint=True))
+            compare.assert_not_called()
+        
+        # cached fingerprints are invalidated by modifications
+        b.iloc[9] = 9.0
+        self.assertTrue(equals_multiple([a, b], 'none', fingerprint=True))
+        b.to_numpy()[1] = 0.5
+        clear_fingerprints()
+        self.assertFalse(equals_multiple([a, b], 'none', fingerprint=True))
+        
+        # writes outside of the sampled elements are not missed
+        a = pd.Series(np.arange(1000.0))
+        b = a.copy()
+        b[500] = -1.0
+        self.assertFalse(equals_multiple([a, b], 'none', fingerprint=True))
+        b[500] = 500.0
+        self.assertTrue(equals_multiple([a, b], 'none', fingerprint=True))
+        
+        # read-only Series are hashed only once
+        values = np.arange(1000.0)
+        values.flags.writeable = False
+        a, b = pd.Series(values, copy=False), pd.Series(-values)
+        with mock.patch('pdutils._fingerprint._compute', wraps=_fingerprint._compute) as compute:
+            for _ in range(3):
+                self.assertFalse(equals_multiple([a, b], 'none', fingerprint=True))
+            self.assertEqual(compute.call_count, 4)
+    
+    @mock.patch('pdutils._blocks.BLOCK_SIZE', 8)
+    def test_result (self):
+        s = [pd.concat([x] * 7, ignore_index=True) for x in [self.s1, self.s2, self.s3, self.s4]]
+        for na in ['any', 'all', 'none']:
+            check = eq_multiple(s, na)
+            
+            bits = eq_multiple(s, na, result='bitmap')
+            self.assertEqual(bits.dtype, np.uint8)
+            self.assertEqual(len(bits), 3)
+            self.assertEqual(list(np.unpackbits(bits, count=21).astype(bool)), list(check))
+            
+            positions, labels = eq_multiple(s, na, result='mismatches')
+            self.assertEqual(list(positions), list(np.flatnonzero(~check)))
+        
+        s = [self.s1.set_axis(['a', 'b', 'c']), self.s4]
+        r = eq_multiple(s, result='mismatches')
+        self.assertEqual(list(r.positions), [1])
+        self.assertEqual(list(r.labels), ['b'])
+        
+        r = eq_multiple([self.s1], result='mismatches')
+        self.assertEqual(len(r.positions), 0)
+        self.assertEqual(list(np.unpackbits(eq_multiple(self.s1, result='bitmap'), count=3)), [1, 1, 1])
+        
+        self.assertRaises(ValueError, eq_multiple, s, result='foobar')
+    
+    def test_out (self):
+        s = [self.s1, self.s2, self.s4]
+        copies = [x.copy() for x in s]
+        
+        out = np.zeros(3, dtype=bool)
+        self.assertIs(eq_multiple(s, out=out), out)
+        self.assertEqual(list(out), list(eq_multiple(s)))
+        self.assertIs(eq_multiple(s, 'none', out=out), out)
+        self.assertEqual(list(out), [True, False, True])
+        
+        out = pd.Series(False, index=['a', 'b', 'c'])
+        self.assertIs(eq_multiple(s, out=out), out)
+        self.assertEqual(list(out), [True, False, True])
+        self.assertEqual(list(out.index), ['a', 'b', 'c'])
+        
+        bits = np.zeros(1, dtype=np.uint8)
+        self.assertIs(eq_multiple(s, 'none', result='bitmap', out=bits), bits)
+        self.assertEqual(list(np.unpackbits(bits, count=3)), [1, 0, 1])
+        
+        out = np.zeros(3, dtype=bool)
+        eq_multiple([self.s1], out=out)
+        self.assertTrue(out.all())
+        
+        # inputs are left untouched
+        for x, y in zip(s, copies):
+            self.assertTrue(x.equals(y))
+        
+        self.assertRaises(ValueError, eq_multiple, s, out=np.zeros(2, dtype=bool))
+        self.assertRaises(ValueError, eq_multiple, s, out=np.zeros(3, dtype=int))
+        self.assertRaises(ValueError, eq_multiple, s, result='mismatches', out=np.zeros(3, dtype=bool))
+        self.assertRaises(TypeError, eq_multiple, s, out=[False] * 3)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
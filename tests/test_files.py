@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_multiple_files, equals_multiple_files, merge_non_na_files, _arrow
+
+class TestFiles (unittest.TestCase):
+    
+    def setUp (self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.a = np.array([1.0, 2.0,    3.0, np.nan, np.nan])
+        self.b = np.array([1.0, np.nan, 4.0, 5.0,    np.nan])
+        self.c = np.array([9.0, 9.0,    9.0, 9.0,    6.0])
+    
+    def tearDown (self):
+        self.dir.cleanup()
+    
+    def path (self, name):
+        return os.path.join(self.dir.name, name)
+    
+    def memmap (self, name, values):
+        m = np.memmap(self.path(name), dtype=values.dtype, mode='w+', shape=values.shape)
+        m[:] = values
+        return m
+    
+    def test_memmap (self):
+        sources = [self.memmap('a.bin', self.a), self.memmap('b.bin', self.b)]
+        out = np.memmap(self.path('eq.bin'), dtype=bool, mode='w+', shape=(5,))
+        eq_multiple_files(sources, out, block_size=2)
+        self.assertEqual(list(np.fromfile(self.path('eq.bin'), dtype=bool)), [True, True, False, True, True])
+        
+        self.assertTrue(equals_multiple_files(sources[:1] * 2, 'all', block_size=2))
+        self.assertFalse(equals_multiple_files(sources[:1] * 2, 'none', block_size=2))
+        self.assertFalse(equals_multiple_files(sources, block_size=2))
+        
+        out = np.memmap(self.path('merged.bin'), dtype=float, mode='w+', shape=(5,))
+        merge_non_na_files(sources + [self.memmap('c.bin', self.c)], out, block_size=3)
+        self.assertEqual(list(np.fromfile(self.path('merged.bin'))), [1.0, 2.0, 3.0, 5.0, 6.0])
+        
+        with self.assertRaises(ValueError):
+            merge_non_na_files(sources, np.empty(5), block_size=2)
+        with self.assertWarns(UserWarning):
+            merge_non_na_files(sources, np.empty(5), remaining_na='warn')
+        
+        self.assertRaises(ValueError, eq_multiple_files, sources, np.empty(4, dtype=bool))
+        self.assertRaises(ValueError, eq_multiple_files, [self.a, self.b[:4]], np.empty(5, dtype=bool))
+        self.assertRaises(ValueError, eq_multiple_files, sources, np.empty(5, dtype=bool), block_size=0)
+        self.assertRaises(ValueError, merge_non_na_files, sources, np.empty(5), remaining_na='foobar')
+        self.assertRaises(ValueError, eq_multiple_files, [], np.empty(5, dtype=bool))
+        self.assertRaises(TypeError, eq_multiple_files, [list(self.a)], np.empty(5, dtype=bool))
+    
+    @unittest.skipIf(_arrow.pa is None, "pyarrow is not installed")
+    def test_parquet (self):
+        import pyarrow.parquet as pq
+        
+        # row groups of differing sizes are realigned
+        a = pd.DataFrame({'x': pd.array([1, None, 3, None, None], dtype='Int64')})
+        b = pd.DataFrame({'x': pd.array([1, 2, 4, 5, None], dtype='Int64'), 'y': self.b})
+        pq.write_table(_arrow.pa.Table.from_pandas(a), self.path('a.parquet'), row_group_size=3)
+        pq.write_table(_arrow.pa.Table.from_pandas(b), self.path('b.parquet'), row_group_size=2)
+        sources = [(self.path('a.parquet'), 'x'), (self.path('b.parquet'), 'x')]
+        
+        eq_multiple_files(sources, self.path('eq.parquet'), block_size=2)
+        r = pd.read_parquet(self.path('eq.parquet'))
+        self.assertEqual(list(r['eq']), [True, True, False, True, True])
+        self.assertFalse(equals_multiple_files(sources, block_size=2))
+        self.assertTrue(equals_multiple_files(sources[:1] * 3, na='all', block_size=2))
+        
+        # integers stay integers, even though single blocks contain NA
+        merge_non_na_files(sources, self.path('merged.parquet'), remaining_na='ignore', block_size=2)
+        r = pq.read_table(self.path('merged.parquet')).column('merged')
+        self.assertEqual(str(r.type), 'int64')
+        self.assertEqual(r.to_pylist(), [1, 2, 3, 5, None])
+        
+        # parquet and memmap sources can be mixed
+        sources = [(self.path('b.parquet'), 'y'), self.memmap('c.bin', self.c)]
+        merge_non_na_files(sources, self.path('merged.parquet'), name='z', block_size=4)
+        r = pd.read_parquet(self.path('merged.parquet'))
+        self.assertEqual(list(r['z']), [1.0, 9.0, 4.0, 5.0, 6.0])
+        
+        # large integers are neither rounded nor compared as floats
+        big = 2**53 + 1
+        c = pd.DataFrame({'x': pd.array([big, None, 3], dtype='Int64'), 'y': pd.array([big - 1, 2, None], dtype='Int64')})
+        pq.write_table(_arrow.pa.Table.from_pandas(c), self.path('c.parquet'), row_group_size=2)
+        sources = [(self.path('c.parquet'), 'x'), (self.path('c.parquet'), 'y')]
+        self.assertFalse(equals_multiple_files(sources, block_size=2))
+        merge_non_na_files(sources, self.path('merged.parquet'), block_size=2)
+        self.assertEqual(pq.read_table(self.path('merged.parquet')).column('merged').to_pylist(), [big, 2, 3])
+        out = np.zeros(3, dtype=np.int64)
+        merge_non_na_files(sources, out, block_size=2)
+        self.assertEqual(list(out), [big, 2, 3])
+        
+        self.assertRaises(KeyError, eq_multiple_files, [(self.path('a.parquet'), 'foo')], np.empty(5, dtype=bool))
+
+if __name__ == '__main__':
+    unittest.main()
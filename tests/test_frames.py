@@ -0,0 +1,123 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_frames, eq_multiple, merge_non_na_frames, merge_non_na
+
+class TestEqFrames (unittest.TestCase):
+    
+    def setUp (self):
+        self.df1 = pd.DataFrame({'A': [1.0, 2.0,    3.0], 'B': ['x', 'y',  'z'], 'C': [1, 2, 3]})
+        self.df2 = pd.DataFrame({'A': [1.0, np.nan, 3.0], 'B': ['x', None, 'q'], 'C': [1, 2, 4]})
+        self.df3 = pd.DataFrame({'C': [1, 2, 3], 'A': [1.0, np.nan, np.nan]}, index=['a', 'b', 'c'])
+    
+    def test_eq (self):
+        r = eq_frames([self.df1, self.df2])
+        self.assertTrue(isinstance(r, pd.DataFrame))
+        self.assertEqual(list(r.columns), ['A', 'B', 'C'])
+        
+        # same as comparing column by column
+        for na in ['any', 'all', 'none']:
+            r = eq_frames([self.df1, self.df2, self.df1], na=na)
+            for column in r.columns:
+                e = eq_multiple([self.df1[column], self.df2[column], self.df1[column]], na=na)
+                self.assertEqual(list(r[column]), list(e))
+        
+        # single frames are always equal
+        self.assertTrue(eq_frames([self.df2], na='none').all(axis=None))
+    
+    def test_alignment (self):
+        # columns are aligned by label, missing columns are NA
+        r = eq_frames([self.df3, self.df1])
+        self.assertEqual(list(r.columns), ['C', 'A', 'B'])
+        self.assertEqual(list(r.index), ['a', 'b', 'c'])
+        self.assertEqual(list(r['A']), [True, True, True])
+        self.assertEqual(list(r['B']), [True, True, True])
+        
+        r = eq_frames([self.df3, self.df1], na='all')
+        self.assertEqual(list(r['B']), [False, False, False])
+    
+    def test_summary (self):
+        r = eq_frames([self.df1, self.df2], summary='columns')
+        self.assertEqual(list(r.index), ['A', 'B', 'C'])
+        self.assertEqual(list(r), [True, False, False])
+        
+        r = eq_frames([self.df1, self.df2], summary='rows')
+        self.assertEqual(list(r), [True, True, False])
+        
+        r = eq_frames([self.df1, self.df2], na='none', summary='rows')
+        self.assertEqual(list(r), [True, False, False])
+    
+    def test_invalid (self):
+        self.assertRaises(ValueError, eq_frames, [])
+        self.assertRaises(ValueError, eq_frames, [self.df1, self.df1.iloc[:2]])
+        self.assertRaises(ValueError, eq_frames, [self.df1, self.df2], na='foobar')
+        self.assertRaises(ValueError, eq_frames, [self.df1, self.df2], summary='foobar')
+        self.assertRaises(TypeError, eq_frames, self.df1)
+        self.assertRaises(TypeError, eq_frames, [self.df1, self.df1['A']])
+
+class TestMergeNonNAFrames (unittest.TestCase):
+    
+    def setUp (self):
+        self.df1 = pd.DataFrame({'A': [1.0, np.nan, np.nan], 'B': ['x', None, 'z'], 'C': [1, 2, 3],
+                                 'D': pd.Categorical(['u', None, 'v'])})
+        self.df2 = pd.DataFrame({'A': [4.0, 5.0, np.nan], 'B': ['q', 'r', 's'], 'C': [4, 5, 6],
+                                 'D': pd.Categorical(['w', 'w', None])})
+        self.df3 = pd.DataFrame({'E': [7, 8], 'A': [9.0, 9.5]}, index=[2, 3])
+    
+    def test_merge (self):
+        r = merge_non_na_frames([self.df1, self.df2], remaining_na='ignore')
+        self.assertEqual(list(r.columns), ['A', 'B', 'C', 'D'])
+        self.assertEqual(list(r['B']), ['x', 'r', 'z'])
+        self.assertEqual(list(r['D']), ['u', 'w', 'v'])
+        
+        # same as merging column by column, including the dtypes
+        for frames in ([self.df1, self.df2], [self.df2, self.df1, self.df2.iloc[:,::-1]]):
+            r = merge_non_na_frames(frames, remaining_na='ignore')
+            for column in r.columns:
+                e = merge_non_na([df[column] for df in frames], remaining_na='ignore')
+                self.assertTrue(r[column].equals(e), column)
+    
+    def test_alignment (self):
+        # rows are aligned by label, missing columns are NA
+        r = merge_non_na_frames([self.df3, self.df1], remaining_na='ignore')
+        self.assertEqual(list(r.columns), ['E', 'A', 'B', 'C', 'D'])
+        self.assertEqual(list(r.index), [2, 3, 0, 1])
+        self.assertEqual(list(r['A'].fillna(-1)), [9.0, 9.5, 1.0, -1])
+        
+        # integers become nullable instead of float, if rows are missing
+        self.assertEqual(r['E'].dtype, 'Int64')
+        self.assertEqual(r['C'].dtype, 'Int64')
+        self.assertEqual(list(r['C'].fillna(-1)), [3, -1, 1, 2])
+        
+        df = pd.DataFrame({'A': [1.0, 2.0]}, index=[0, 0])
+        self.assertRaises(ValueError, merge_non_na_frames, [df, self.df3])
+    
+    def test_remaining (self):
+        r, remaining = merge_non_na_frames([self.df1, self.df2], remaining_na='ignore', return_remaining=True)
+        self.assertEqual(list(remaining), ['A'])
+        self.assertTrue(r.equals(merge_non_na_frames([self.df1, self.df2], remaining_na='ignore')))
+        
+        r, remaining = merge_non_na_frames([self.df1, self.df2, self.df3], remaining_na='ignore', return_remaining=True)
+        self.assertEqual(list(remaining), ['B', 'C', 'D', 'E'])
+        
+        with self.assertRaisesRegex(ValueError, r"\['A'\]"):
+            merge_non_na_frames([self.df1, self.df2])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            merge_non_na_frames([self.df1, self.df2], remaining_na='warn')
+        self.assertEqual(len(w), 1)
+        
+        r, remaining = merge_non_na_frames([self.df2.fillna({'A': 0.0}), self.df1], return_remaining=True)
+        self.assertEqual(len(remaining), 0)
+    
+    def test_invalid (self):
+        self.assertRaises(ValueError, merge_non_na_frames, [])
+        self.assertRaises(ValueError, merge_non_na_frames, [self.df1], remaining_na='foobar')
+        self.assertRaises(TypeError, merge_non_na_frames, self.df1)
+        self.assertRaises(TypeError, merge_non_na_frames, [self.df1, self.df1['A']])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_groups, eq_multiple, merge_non_na_groups
+
+class TestGroups (unittest.TestCase):
+    
+    def setUp (self):
+        self.df = pd.DataFrame({
+            'key': ['a', 'b', 'a', 'c', 'b', 'c', None],
+            'x':   [np.nan, 2.0, 1.0, np.nan, 2.0, np.nan, 9.9],
+            'y':   ['u', None, 'v', 'w', 'z', 'w', 'q'],
+        })
+    
+    def test_eq_groups (self):
+        r = eq_groups(self.df, by='key')
+        self.assertEqual(list(r.index), ['a', 'b', 'c'])
+        self.assertEqual(list(r.columns), ['x', 'y'])
+        self.assertEqual(list(r['x']), [True, True, True])
+        self.assertEqual(list(r['y']), [False, True, True])
+        
+        # same results as eq_multiple() on the rows of each group
+        for na in ['any', 'all', 'none']:
+            r = eq_groups(self.df['x'], by=self.df['key'], na=na)
+            self.assertEqual(r.index.name, 'key')
+            for key, group in self.df.dropna(subset=['key']).groupby('key'):
+                expected = eq_multiple([pd.Series([value]) for value in group['x']], na=na).all()
+                self.assertEqual(r[key], expected)
+        
+        r = eq_groups(self.df, by=['key', 'y'], na='none')
+        self.assertEqual(len(r), 4)
+        self.assertEqual(r.loc[('c', 'w'), 'x'], False)
+        self.assertEqual(list(eq_groups(pd.Series(['x', 'x', 'y']), by=[2, 2, 1], sort=False)), [True, True])
+        
+        # a group of a single NA row is equal, like a single Series
+        for na in ['any', 'all', 'none']:
+            r = eq_groups(pd.Series([np.nan, 1.0, np.nan, np.nan]), by=[0, 1, 2, 2], na=na)
+            self.assertEqual(list(r), [True, True, na != 'none'])
+        
+        values = pd.Series(['p', 'q', None, 'p'], dtype='category')
+        self.assertEqual(list(eq_groups(values, by=[0, 1, 1, 0])), [True, True])
+        
+        self.assertRaises(ValueError, eq_groups, self.df, by='key', na='foobar')
+        self.assertRaises(ValueError, eq_groups, self.df['x'], by=[1, 2])
+        self.assertRaises(KeyError, eq_groups, self.df, by='foobar')
+        self.assertRaises(TypeError, eq_groups, [1, 2], by=[1, 2])
+    
+    def test_merge_non_na_groups (self):
+        r = merge_non_na_groups(self.df, by='key', remaining_na='ignore')
+        expected = self.df.groupby('key').first()
+        self.assertTrue(r.equals(expected))
+        
+        with self.assertRaises(ValueError):
+            merge_non_na_groups(self.df, by='key')
+        with self.assertWarns(UserWarning):
+            merge_non_na_groups(self.df, by='key', remaining_na='warn')
+        self.assertRaises(ValueError, merge_non_na_groups, self.df, by='key', remaining_na='foobar')
+        
+        r = merge_non_na_groups(self.df['y'], by=self.df['key'], sort=False)
+        self.assertEqual(list(r.index), ['a', 'b', 'c'])
+        self.assertEqual(list(r), ['u', 'z', 'w'])
+        
+        # nullable dtypes are kept
+        s = pd.Series([None, 1, 3, 4, 5], dtype='Int64')
+        r = merge_non_na_groups(s, by=np.array([2, 2, 1, 1, 2]))
+        self.assertEqual(r.dtype, 'Int64')
+        self.assertEqual(list(r), [3, 1])
+        
+        # rows with NA in any key are dropped
+        df = pd.DataFrame({'k1': [2, 2, 1, None, 1], 'k2': ['x', 'x', 'y', 'y', 'a'], 'v': [np.nan, 1, 3, 4, 5]})
+        r = merge_non_na_groups(df, by=['k1', 'k2'])
+        self.assertTrue(r.equals(df.groupby(['k1', 'k2']).first()))
+        r = merge_non_na_groups(df, by=['k1', 'k2'], sort=False)
+        self.assertEqual(list(r.index), [(2.0, 'x'), (1.0, 'y'), (1.0, 'a')])
+
+if __name__ == '__main__':
+    unittest.main()
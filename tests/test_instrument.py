@@ -0,0 +1,74 @@
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_multiple, equals_multiple, merge_non_na, instrument, _instrument
+
+class TestInstrument (unittest.TestCase):
+    
+    def setUp (self):
+        self.s1 = pd.Series([1.0, np.nan, 3.0, np.nan])
+        self.s2 = pd.Series([1.0, 2.0,    3.0, np.nan])
+        self.s3 = pd.Series([1.0, 2.0,    4.0, 4.0])
+    
+    @mock.patch('pdutils._blocks.BLOCK_SIZE', 2)
+    def test_eq (self):
+        with instrument() as reports:
+            eq_multiple([self.s1, list(self.s2)], na='all')
+            equals_multiple([self.s1, self.s3])
+        
+        self.assertEqual([r.function for r in reports], ['eq_multiple', 'equals_multiple'])
+        r = reports[0]
+        self.assertEqual(r.path, 'numpy')
+        self.assertEqual(list(r.timings), ['coerce', 'compare', 'result'])
+        self.assertEqual(r.shapes, [(4,), (4,)])
+        self.assertEqual(r.dtypes, [np.dtype(float), 'list'])
+        self.assertEqual(r.iterations, 2)
+        self.assertGreater(r.allocated, 0)
+        self.assertGreaterEqual(r.total, sum(r.timings.values()) * 0.99)
+        
+        # stops at the first mismatching block
+        self.assertEqual(reports[1].iterations, 2)
+    
+    def test_merge (self):
+        reports = []
+        with instrument(reports.append, memory=False) as collected:
+            merge_non_na([self.s1, self.s2, self.s3])
+            merge_non_na(pd.concat([self.s1, self.s2.astype(object), self.s3], axis='columns'))
+            with self.assertRaises(ValueError):
+                merge_non_na([self.s1, self.s2])
+        
+        self.assertEqual(reports, collected)
+        self.assertEqual(len(reports), 3)
+        r = reports[0]
+        self.assertEqual(r.path, 'aligned')
+        self.assertEqual(list(r.timings), ['coerce', 'align', 'fill', 'result'])
+        self.assertIsNone(r.allocated)
+        
+        r = reports[1]
+        self.assertEqual(r.path, 'where')
+        self.assertEqual(r.shapes, [(4, 3)])
+        self.assertEqual(r.iterations, 2)
+        
+        # failing calls are reported as well
+        self.assertEqual(reports[2].function, 'merge_non_na')
+    
+    def test_scope (self):
+        with instrument() as reports:
+            pass
+        merge_non_na([self.s1, self.s2, self.s3])
+        self.assertEqual(reports, [])
+        self.assertEqual(_instrument._listeners, [])
+        
+        # calls from other threads are reported, too
+        with instrument(memory=False) as reports:
+            thread = threading.Thread(target=eq_multiple, args=([self.s1, self.s2],))
+            thread.start()
+            thread.join()
+        self.assertEqual(len(reports), 1)
+
+if __name__ == '__main__':
+    unittest.main()
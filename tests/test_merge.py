@@ -1,9 +1,10 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 
-from pdutils import merge_non_na
+from pdutils import merge_non_na, _arrow, _numba
 
 class TestMergeNonNA(unittest.TestCase):
     
@@ -78,6 +79,12 @@ class TestMergeNonNA(unittest.TestCase):
         m = pd.Series({'red': 777.7, 'blue': np.nan, 'green': 111.1, 'cyan': 135.7})
         self.assertTrue(pd.Series.equals(r, m))
         
+        # inputs are left untouched
+        s1 = self.s1.copy()
+        merge_non_na([s1, self.s4])
+        merge_non_na([s1, self.s7])
+        self.assertTrue(pd.Series.equals(s1, self.s1))
+        
         # single element
         r = merge_non_na([self.s])
         self.assertTrue(isinstance(r, pd.Series))
@@ -99,6 +106,16 @@ class TestMergeNonNA(unittest.TestCase):
         # ignore unequal values
         r = merge_non_na(self.df3)
         self.assertTrue(pd.Series.equals(r, self.df['A']))
+        
+        # input is left untouched
+        df = self.df4.copy()
+        merge_non_na(df, remaining_na='ignore')
+        self.assertTrue(pd.DataFrame.equals(df, self.df4))
+        
+        # extension dtypes are kept
+        r = merge_non_na(self.df1[['A', 'C']].astype('Int64'))
+        self.assertEqual(r.dtype, 'Int64')
+        self.assertEqual(list(r), [1, 2])
     
     def test_mixed (self):
         # list, tuple and numpy array have no index
@@ -115,6 +132,128 @@ class TestMergeNonNA(unittest.TestCase):
         r = merge_non_na([self.d1, self.s4])
         self.assertTrue(pd.Series.equals(r, self.s))
     
+    @mock.patch('pdutils._blocks.BLOCK_SIZE', 1)
+    @mock.patch('pdutils._blocks.PARALLEL_MIN_ROWS', 0)
+    def test_n_jobs (self):
+        r = merge_non_na([self.s1, self.s2, self.s3, self.s4], n_jobs=2)
+        self.assertTrue(pd.Series.equals(r, self.s))
+        
+        r = merge_non_na(self.df3, n_jobs=-1)
+        self.assertTrue(pd.Series.equals(r, self.df['A']))
+        
+        with self.assertRaises(ValueError):
+            merge_non_na(self.df4, n_jobs=2)
+    
+    @unittest.skipIf(not _numba.available(), "numba is not installed")
+    def test_numba (self):
+        r = merge_non_na([self.s1, self.s2, self.s3, self.s4], engine='numba')
+        self.assertTrue(pd.Series.equals(r, self.s))
+        
+        r = merge_non_na(self.df2, engine='numba')
+        self.assertTrue(pd.Series.equals(r, self.df['A']))
+        
+        r = merge_non_na([self.s2, self.s6], remaining_na='ignore', engine='numba')
+        m = pd.Series({'red': 777.7, 'blue': np.nan, 'green': 111.1})
+        self.assertTrue(pd.Series.equals(r, m))
+        
+        with self.assertRaises(ValueError):
+            merge_non_na(self.df4, engine='numba')
+        
+        self.assertRaises(ValueError, merge_non_na, self.df1, engine='foobar')
+    
+    @unittest.skipIf(_arrow.pa is None, "pyarrow is not installed")
+    def test_arrow (self):
+        dtype = 'double[pyarrow]'
+        r = merge_non_na([x.astype(dtype) for x in [self.s1, self.s2, self.s3, self.s4]])
+        self.assertEqual(r.dtype, dtype)
+        self.assertEqual(list(r), [777.7, 222.2, 111.1])
+        
+        r = merge_non_na(self.df2.astype(dtype))
+        self.assertEqual(r.dtype, dtype)
+        self.assertEqual(list(r), [1.0, 2.0])
+        
+        r = merge_non_na([self.s2.astype(dtype), self.s7.astype(dtype)], remaining_na='ignore')
+        self.assertEqual(r.dtype, dtype)
+        self.assertEqual(list(r.index), ['red', 'blue', 'green', 'cyan'])
+        self.assertEqual(list(r.isna()), [False, True, False, False])
+        
+        s = [pd.Series(['a', None, None], dtype='string[pyarrow]'),
+             pd.Series([None, 'b', None], dtype='string[pyarrow]')]
+        r = merge_non_na(s, remaining_na='ignore')
+        self.assertTrue(pd.Series.equals(r, pd.Series(['a', 'b', None], dtype='string[pyarrow]')))
+        with self.assertRaises(ValueError):
+            merge_non_na(s)
+    
+    def test_categorical (self):
+        c = [x.astype('category') for x in [self.s1, self.s2, self.s3, self.s4]]
+        r = merge_non_na(c)
+        self.assertTrue(isinstance(r.dtype, pd.CategoricalDtype))
+        self.assertEqual(list(r), list(self.s))
+        
+        # differing categories are unified instead of falling back to objects
+        a = pd.Series(['x', None, None], dtype=pd.CategoricalDtype(['x', 'y']))
+        b = pd.Series([None, 'z', None], dtype=pd.CategoricalDtype(['z']))
+        for data in [[a, b], pd.DataFrame({'a': a, 'b': b})]:
+            r = merge_non_na(data, remaining_na='ignore')
+            self.assertEqual(list(r.cat.categories), ['x', 'y', 'z'])
+            self.assertEqual(list(r.astype(object).fillna('-')), ['x', 'z', '-'])
+        with self.assertRaises(ValueError):
+            merge_non_na([a, b])
+        
+        r = merge_non_na([a, b.set_axis([2, 3, 4])], remaining_na='ignore')
+        self.assertTrue(isinstance(r.dtype, pd.CategoricalDtype))
+        self.assertEqual(list(r.index), [0, 1, 2, 3, 4])
+        self.assertEqual(list(r.isna()), [False, True, True, False, True])
+    
+    def test_strategy (self):
+        s = [self.s1, self.s2, self.s3, self.s4]
+        r = merge_non_na(s, strategy='last')
+        self.assertTrue(pd.Series.equals(r, pd.Series({'red': 777.7, 'blue': 222.2, 'green': 111.1})))
+        
+        # frames and unaligned Series are reordered the same way
+        r = merge_non_na(self.df3, strategy='last')
+        self.assertEqual(list(r), [1.0, 9.9])
+        self.assertEqual(r.name, 'B')
+        r = merge_non_na([self.s1, self.s7], strategy='last')
+        self.assertEqual(list(r), [777.7, 222.2, 111.1, 135.7])
+        
+        r, source = merge_non_na(self.df3, strategy=[0, 2, 1], return_source=True)
+        self.assertEqual(list(r), [1.0, 2.0])
+        self.assertEqual(list(source), [2, 1])
+        r, source = merge_non_na(self.df3, strategy=np.array([0, 2, 1]), return_source=True)
+        self.assertEqual(list(source), [2, 1])
+        r = merge_non_na(s, strategy=np.array([3, 2, 1, 0]))
+        self.assertTrue(pd.Series.equals(r, merge_non_na(s, strategy='last')))
+        
+        r, source = merge_non_na(s, return_source=True)
+        self.assertTrue(pd.Series.equals(r, self.s))
+        self.assertEqual(list(source), [1, 0, 3])
+        
+        df = pd.DataFrame({'A': [1, 2, 3, np.nan], 'B': [2, np.nan, 4, np.nan], 'C': [2, 5, 3, np.nan]})
+        r, source = merge_non_na(df, remaining_na='ignore', strategy='majority', return_source=True)
+        self.assertEqual(list(r.fillna(-1)), [2.0, 2.0, 3.0, -1])
+        self.assertEqual(list(source), [1, 0, 0, -1])
+        
+        with self.assertRaises(ValueError):
+            merge_non_na(df, strategy='majority')
+        
+        o = [pd.Series(['x', None, 'y'], dtype='string'), pd.Series(['y', 'z', None]), pd.Series(['y', 'z', 'x'])]
+        r = merge_non_na(o, strategy='majority')
+        self.assertEqual(list(r), ['y', 'z', 'y'])
+        r = merge_non_na([x.astype('category') for x in o], strategy='majority')
+        self.assertTrue(isinstance(r.dtype, pd.CategoricalDtype))
+        self.assertEqual(list(r), ['y', 'z', 'y'])
+        
+        # datetimes are not counted as their integer nanoseconds
+        dt = pd.Series(pd.to_datetime(['2022-01-01', '2022-01-03']))
+        r, source = merge_non_na([dt.astype('int64').astype(float), dt, dt.astype(object)],
+                                 strategy='majority', return_source=True)
+        self.assertEqual(list(r), list(dt))
+        self.assertEqual(list(source), [1, 1])
+        
+        self.assertRaises(ValueError, merge_non_na, s, strategy='foobar')
+        self.assertRaises(ValueError, merge_non_na, s, strategy=[1, 2])
+    
     def test_remaining (self):
         with self.assertRaises(ValueError):
             merge_non_na(self.df4)
@@ -130,6 +269,72 @@ class TestMergeNonNA(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             merge_non_na([self.s1, self.s2, self.s3], remaining_na='foobar')
+    
+    def test_out (self):
+        s = [self.s1, self.s2, self.s4]
+        copies = [x.copy() for x in s]
+        
+        out = np.zeros(3)
+        self.assertIs(merge_non_na(s, out=out), out)
+        self.assertEqual(list(out), list(self.s))
+        
+        # reordered and unaligned results are copied into the buffer
+        out = pd.Series(0.0, index=['a', 'b', 'c'])
+        self.assertIs(merge_non_na(s, strategy='last', out=out), out)
+        self.assertEqual(list(out), [777.7, 222.2, 111.1])
+        self.assertEqual(list(out.index), ['a', 'b', 'c'])
+        out = np.zeros(4)
+        merge_non_na([self.s1, self.s7], out=out)
+        self.assertEqual(list(out), [777.7, 222.2, 111.1, 135.7])
+        
+        out = np.zeros(2)
+        r, source = merge_non_na(self.df3, strategy='majority', return_source=True, out=out)
+        self.assertIs(r, out)
+        self.assertEqual(list(out), [1.0, 2.0])
+        df = self.df2.copy()
+        self.assertIs(merge_non_na(self.df2, remaining_na='ignore', out=out), out)
+        self.assertEqual(list(out), [1.0, 2.0])
+        self.assertTrue(self.df2.equals(df))
+        
+        out = pd.Series([0, 0], dtype='Int64')
+        merge_non_na([pd.Series([1, None], dtype='Int64'), pd.Series([None, 2], dtype='Int64')], out=out)
+        self.assertEqual(list(out), [1, 2])
+        
+        # inputs are left untouched
+        for x, y in zip(s, copies):
+            self.assertTrue(x.equals(y))
+        
+        self.assertRaises(ValueError, merge_non_na, s, out=np.zeros(2))
+        self.assertRaises(TypeError, merge_non_na, s, out=np.zeros(3, dtype=int))
+        self.assertRaises(TypeError, merge_non_na, s, out=[0.0] * 3)
+    
+    def test_dtypes (self):
+        # integers are not converted to float, which would lose precision
+        big = 2**53 + 1
+        r = merge_non_na([pd.Series([big, 2]), pd.Series([None, 5], dtype='Int64')])
+        self.assertEqual(r.dtype, 'Int64')
+        self.assertEqual(list(r), [big, 2])
+        r = merge_non_na([pd.Series([big, 2]), pd.Series([7], index=[2])])
+        self.assertEqual(r.dtype, 'Int64')
+        self.assertEqual(list(r), [big, 2, 7])
+        r = merge_non_na([pd.Series([None, 5], dtype='Int32'), pd.Series([big, 2], dtype='Int64')])
+        self.assertEqual(r.dtype, 'Int64')
+        self.assertEqual(list(r), [big, 5])
+        r = merge_non_na([pd.Series([True, False]), pd.Series([True], index=[2])])
+        self.assertEqual(r.dtype, 'boolean')
+        
+        # floats and integers are promoted like numpy does
+        r = merge_non_na([pd.Series([1.5, np.nan], dtype='float32'), pd.Series([1, 2])])
+        self.assertEqual(r.dtype, np.float64)
+        self.assertEqual(list(r), [1.5, 2.0])
+        
+        # tz-aware datetimes of differing time zones are merged in UTC
+        s = [pd.Series(pd.to_datetime([None, '2020-01-01 12:00']).tz_localize('UTC')),
+             pd.Series(pd.to_datetime(['2021-01-01 01:00', '2021-01-02']).tz_localize('Europe/Berlin'))]
+        for data in (s, pd.concat(s, axis=1)):
+            r = merge_non_na(data)
+            self.assertEqual(r.dtype, pd.DatetimeTZDtype(tz='UTC'))
+            self.assertEqual(list(r), [pd.Timestamp('2021-01-01', tz='UTC'), pd.Timestamp('2020-01-01 12:00', tz='UTC')])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
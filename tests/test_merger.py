@@ -0,0 +1,91 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdutils import merge_non_na, NonNAMerger
+
+class TestNonNAMerger (unittest.TestCase):
+    
+    def setUp (self):
+        self.s1 = pd.Series({'red': np.nan, 'blue': 222.2,  'green': np.nan})
+        self.s2 = pd.Series({'red': 777.7,  'blue': np.nan, 'green': np.nan})
+        self.s4 = pd.Series({'red': 777.7,  'blue': np.nan, 'green': 111.1})
+        self.s7 = pd.Series({'red': 777.7,  'cyan': 135.7,  'green': 111.1})
+    
+    def test_merger (self):
+        merger = NonNAMerger()
+        self.assertFalse(merger.is_complete)
+        self.assertRaises(ValueError, merger.result)
+        
+        copy = self.s1.copy()
+        merger.add(self.s1).add(self.s2)
+        self.assertFalse(merger.is_complete)
+        self.assertEqual(merger.n_remaining, 1)
+        self.assertRaises(ValueError, merger.result)
+        
+        merger.add(self.s4)
+        self.assertTrue(merger.is_complete)
+        self.assertEqual(merger.n_added, 3)
+        r = merger.result()
+        self.assertTrue(r.equals(merge_non_na([self.s1, self.s2, self.s4])))
+        self.assertTrue(self.s1.equals(copy))
+        
+        # the result is independent of further additions, which may add labels
+        merger.add(self.s7)
+        self.assertEqual(len(merger), 4)
+        self.assertEqual(list(r), [777.7, 222.2, 111.1])
+        merger.add(pd.Series({'black': np.nan}))
+        self.assertFalse(merger.is_complete)
+        self.assertEqual(merger.n_remaining, 1)
+        
+        merger = NonNAMerger(remaining_na='ignore')
+        for s in [self.s1, self.s7, self.s2]:
+            merger.add(s)
+        r = merger.result()
+        self.assertTrue(r.equals(merge_non_na([self.s1, self.s7, self.s2])))
+        
+        with self.assertWarns(UserWarning):
+            NonNAMerger(remaining_na='warn').add(self.s1).result()
+        self.assertRaises(ValueError, NonNAMerger, remaining_na='foobar')
+    
+    def test_dtypes (self):
+        # differing dtypes are upcast like merge_non_na() does
+        s = [pd.Series([1, 2, 3]), pd.Series([np.nan, 2.5, 3.5])]
+        r = NonNAMerger().add(s[1]).add(s[0]).result()
+        self.assertTrue(r.equals(merge_non_na(s[::-1])))
+        
+        s = [pd.Series([1, None, None], dtype='Int64'), [4, 5, None], {2: 6}]
+        merger = NonNAMerger()
+        merger.add(s[0]).add(pd.Series(s[1], dtype='Int64'))
+        self.assertEqual(merger.n_remaining, 1)
+        r = merger.add(pd.Series(s[2], dtype='Int64')).result()
+        self.assertEqual(r.dtype, 'Int64')
+        self.assertEqual(list(r), [1, 5, 6])
+        
+        s = [pd.Series(['a', None], dtype='category'), pd.Series(['b', 'c'], dtype='category')]
+        r = NonNAMerger().add(s[0]).add(s[1]).result()
+        self.assertTrue(isinstance(r.dtype, pd.CategoricalDtype))
+        self.assertEqual(list(r), ['a', 'c'])
+        
+        # integers stay exact, if new labels introduce NA values
+        big = 2**53 + 1
+        r = NonNAMerger('ignore').add(pd.Series([big, 2])).add(pd.Series([7], index=[2])).result()
+        self.assertEqual(r.dtype, 'Int64')
+        self.assertEqual(list(r), [big, 2, 7])
+        r = NonNAMerger().add(pd.Series([big, 2])).add(pd.Series([7, 8])).result()
+        self.assertEqual(r.dtype, np.int64)
+        
+        # same dtype as merge_non_na(), also if labels are covered partly
+        cases = [[pd.Series([big, 2, 3]), pd.Series([7], index=[1])],
+                 [pd.Series([big, 2]), pd.Series([7, 8], index=[1, 0])],
+                 [pd.Series([True, False]), pd.Series([False], index=[0]), pd.Series([True, True])],
+                 [pd.Series([1.5, np.nan], dtype='float32'), pd.Series([1, 2], index=[1, 2])]]
+        for s in cases:
+            merger = NonNAMerger()
+            for x in s:
+                merger.add(x)
+            self.assertEqual(merger.result().dtype, merge_non_na(s).dtype)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_multiple, equals_multiple, merge_non_na, instrument
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+@unittest.skipIf(pl is None, "polars is not installed")
+class TestPolars (unittest.TestCase):
+    
+    def setUp (self):
+        self.df = pd.DataFrame({'A': [1.0, 2.0,    3.0, np.nan, 5.0, 6.0],
+                                'B': [1.0, np.nan, 3.0, np.nan, 5.0, 7.0],
+                                'C': [1.0, np.nan, 4.0, 5.0,    5.0, 6.0]})
+        self.pdf = pl.from_pandas(self.df, nan_to_null=False)
+    
+    def test_eq (self):
+        series = [self.pdf[column] for column in self.pdf.columns]
+        for na in ['any', 'all', 'none']:
+            for data in [self.pdf, series]:
+                r = eq_multiple(data, na)
+                self.assertTrue(isinstance(r, pl.Series))
+                self.assertEqual(r.to_list(), list(eq_multiple(self.df, na)))
+                self.assertEqual(equals_multiple(data, na), equals_multiple(self.df, na))
+        
+        s = [pl.Series([True, None, False]), pl.Series([True, False, True])]
+        self.assertEqual(eq_multiple(s, 'all').to_list(), [True, False, False])
+        s = [pl.Series(['x', None, 'y']), pl.Series(['x', 'z', 'z'])]
+        self.assertEqual(eq_multiple(s).to_list(), [True, True, False])
+        
+        # dtypes without a common supertype are never equal, like in pandas
+        s = [[1, 2, None], ['1', None, None], [1, None, 3]]
+        for na in ['any', 'all', 'none']:
+            self.assertEqual(eq_multiple([pl.Series(x) for x in s], na).to_list(),
+                             list(eq_multiple([pd.Series(x) for x in s], na)))
+        
+        # a single Series is always equal
+        for na in ['any', 'all', 'none']:
+            self.assertEqual(eq_multiple([pl.Series([1, None])], na).to_list(), [True, True])
+            self.assertTrue(equals_multiple(pl.DataFrame({'a': [None, 1]}), na))
+        
+        self.assertRaises(ValueError, eq_multiple, self.pdf, 'foobar')
+        self.assertRaises(ValueError, eq_multiple, self.pdf, result='bitmap')
+        self.assertRaises(ValueError, eq_multiple, [series[0], series[1][:2]])
+    
+    def test_merge (self):
+        r = merge_non_na(self.pdf, remaining_na='ignore')
+        self.assertTrue(isinstance(r, pl.Series))
+        self.assertEqual(r.name, 'A')
+        expected = merge_non_na(self.df, remaining_na='ignore')
+        self.assertEqual(r.fill_null(-1).to_list(), list(expected.fillna(-1)))
+        
+        series = [self.pdf[column] for column in self.pdf.columns]
+        r, source = merge_non_na(series, remaining_na='ignore', strategy='last', return_source=True)
+        expected, expected_source = merge_non_na(self.df, remaining_na='ignore', strategy='last', return_source=True)
+        self.assertEqual(r.fill_null(-1).to_list(), list(expected.fillna(-1)))
+        self.assertEqual(source.to_list(), list(expected_source))
+        
+        r = merge_non_na(self.pdf, strategy=[1, 3, 2], remaining_na='ignore')
+        self.assertEqual(r.to_list(), [1.0, 2.0, 3.0, 5.0, 5.0, 7.0])
+        
+        missing = [pl.Series([np.nan, 1.0]), pl.Series([None, 2.0])]
+        with self.assertRaises(ValueError):
+            merge_non_na(missing)
+        with self.assertWarns(UserWarning):
+            merge_non_na(missing, remaining_na='warn')
+        self.assertRaises(ValueError, merge_non_na, self.pdf, strategy='majority')
+        self.assertRaises(ValueError, merge_non_na, self.pdf, out=np.zeros(6))
+    
+    def test_instrument (self):
+        with instrument(memory=False) as reports:
+            merge_non_na(self.pdf, remaining_na='ignore')
+        self.assertEqual(reports[0].path, 'polars')
+        self.assertEqual(reports[0].shapes, [(6, 3)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pdutils import eq_multiple_chunks, equals_multiple_chunks, merge_non_na_chunks
+
+class TestStream (unittest.TestCase):
+    
+    def setUp (self):
+        self.df = pd.DataFrame({'A': [1.0, 2.0,    3.0, np.nan],
+                                'B': [1.0, np.nan, 3.0, np.nan],
+                                'C': [1.0, np.nan, 4.0, 5.0]})
+    
+    def chunks (self, df, size=2):
+        for start in range(0, len(df), size):
+            yield df.iloc[start:start+size]
+    
+    def test_eq (self):
+        r = pd.concat(eq_multiple_chunks(self.chunks(self.df)))
+        self.assertEqual(list(r), [True, True, False, True])
+        self.assertTrue(r.index.equals(self.df.index))
+        
+        r = pd.concat(eq_multiple_chunks(self.chunks(self.df), na='all'))
+        self.assertEqual(list(r), [True, False, False, False])
+        
+        # tuples of aligned Series
+        chunks = ((c['A'], c['B']) for c in self.chunks(self.df))
+        r = pd.concat(eq_multiple_chunks(chunks))
+        self.assertEqual(list(r), [True, True, True, True])
+        
+        self.assertRaises(TypeError, list, eq_multiple_chunks([self.df['A']]))
+    
+    def test_equals (self):
+        self.assertFalse(equals_multiple_chunks(self.chunks(self.df)))
+        self.assertTrue(equals_multiple_chunks(self.chunks(self.df[['A', 'B']])))
+        self.assertTrue(equals_multiple_chunks([]))
+        
+        # stop at first failing chunk
+        chunks = self.chunks(self.df, size=1)
+        self.assertFalse(equals_multiple_chunks(chunks))
+        self.assertEqual(len(list(chunks)), 1)
+    
+    def test_merge (self):
+        r = pd.concat(merge_non_na_chunks(self.chunks(self.df)))
+        self.assertEqual(list(r), [1.0, 2.0, 3.0, 5.0])
+        
+        with self.assertRaises(ValueError):
+            list(merge_non_na_chunks(self.chunks(self.df[['A', 'B']])))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file